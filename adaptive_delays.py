@@ -0,0 +1,167 @@
+import json
+import os
+import sys
+import threading
+
+# 기본 딜레이 설정 (학습 데이터가 없을 때 사용)
+DEFAULT_DELAYS = {
+    'typing': 0.01,      # 타이핑 속도
+    'after_send': 4,     # 전송 후 대기
+    'check_interval': 2, # 응답 체크 간격
+    'max_wait': 120,     # 최대 대기 시간
+    'between_exchange': 4,  # 교환 간 대기
+    'initial_load': 10,  # 초기 로딩 대기
+    'between_prompts': 10,  # 프롬프트 간 대기
+    'quiet_period': 1.5, # 완료 신호가 없을 때 응답 완료로 볼 무변화 시간
+    'settle': 0.3,       # 중지 버튼/커서가 사라진 뒤 확정까지 대기
+    'stream_interval': 0.2  # 스트리밍 모드에서 새 조각 확인 간격
+}
+
+STATS_FILE = "delay_stats.json"
+MAX_SAMPLES = 50      # 플랫폼별로 보관하는 최근 관측 수
+MIN_SAMPLES = 3       # 이보다 적으면 기본 딜레이 사용
+MIN_INTERVAL = 0.25   # 가장 촘촘한 폴링 간격
+MIN_TIMEOUT = 60      # 학습된 타임아웃의 하한
+
+
+def percentile(values, pct):
+    """정렬 후 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class AdaptiveDelays(dict):
+    """관측된 응답 시간으로 폴링 간격과 타임아웃을 정하는 딜레이 설정
+
+    dict처럼 기존 키(delays['check_interval'] 등)를 그대로 쓸 수 있고 (관측값 목록은 observed()),
+    플랫폼별 통계는 STATS_FILE에 저장되어 다음 실행에서 이어서 사용한다.
+    """
+
+    def __init__(self, stats_file=STATS_FILE, adaptive=True):
+        super().__init__(DEFAULT_DELAYS)
+        self.stats_file = stats_file
+        self.adaptive = adaptive
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.load()
+
+    def load(self):
+        """저장된 통계 불러오기"""
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                self.samples = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 딜레이 통계 불러오기 실패: {e}")
+            self.samples = {}
+
+    def save(self):
+        """통계 저장"""
+        if not self.stats_file:
+            return
+        try:
+            # 여러 워커가 공유할 때 저장이 겹치지 않도록 파일 쓰기까지 잠금 안에서
+            with self.lock:
+                data = json.dumps(self.samples, ensure_ascii=False, indent=2)
+                with open(self.stats_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+        except Exception as e:
+            print(f"⚠️ 딜레이 통계 저장 실패: {e}")
+
+    def record(self, platform, first_token, total, chars):
+        """응답 하나의 관측값 기록 (첫 토큰까지 / 완료까지 걸린 초, 글자 수)"""
+        with self.lock:
+            entries = self.samples.setdefault(platform, [])
+            entries.append({
+                'first_token': round(first_token, 3) if first_token is not None else None,
+                'total': round(total, 3),
+                'chars': chars
+            })
+            del entries[:-MAX_SAMPLES]
+
+    def observed(self, platform, key):
+        """플랫폼의 특정 관측값 목록"""
+        with self.lock:
+            entries = list(self.samples.get(platform, []))
+        return [e[key] for e in entries if e.get(key) is not None]
+
+    def expected_total(self, platform):
+        """예상 응답 완료 시간 (중앙값, 데이터 부족시 None)"""
+        totals = self.observed(platform, 'total')
+        if not self.adaptive or len(totals) < MIN_SAMPLES:
+            return None
+        return percentile(totals, 50)
+
+    def poll_interval(self, platform, elapsed, previous=None):
+        """다음 폴링까지 간격
+
+        스트리밍 중에는 간격을 두 배씩 늘리고, 예상 완료 시각에 가까워지면 촘촘하게 확인한다.
+        """
+        expected = self.expected_total(platform)
+        if expected is None:
+            return self['check_interval']
+
+        near = expected * 0.8
+        if elapsed >= near:
+            return MIN_INTERVAL
+
+        interval = previous * 2 if previous else MIN_INTERVAL
+        return max(MIN_INTERVAL, min(interval, self['check_interval'], near - elapsed))
+
+    def timeout(self, platform):
+        """응답 최대 대기 시간"""
+        totals = self.observed(platform, 'total')
+        if not self.adaptive or len(totals) < MIN_SAMPLES:
+            return self['max_wait']
+        return min(self['max_wait'], max(percentile(totals, 95) * 3, MIN_TIMEOUT))
+
+    def summary(self):
+        """플랫폼별 통계 요약"""
+        result = {}
+        for platform in list(self.samples):
+            totals = self.observed(platform, 'total')
+            first_tokens = self.observed(platform, 'first_token')
+            chars = self.observed(platform, 'chars')
+            speeds = [
+                e['chars'] / (e['total'] - e['first_token'])
+                for e in self.samples.get(platform, [])
+                if e.get('first_token') is not None and e['total'] > e['first_token']
+            ]
+            result[platform] = {
+                'samples': len(totals),
+                'first_token_p50': percentile(first_tokens, 50),
+                'total_p50': percentile(totals, 50),
+                'total_p95': percentile(totals, 95),
+                'chars_p50': percentile(chars, 50),
+                'chars_per_sec': percentile(speeds, 50),
+                'timeout': self.timeout(platform)
+            }
+        return result
+
+    def print_summary(self):
+        """통계와 기본 설정 비교 출력"""
+        summary = self.summary()
+        if not summary:
+            print("📉 아직 수집된 응답 통계가 없습니다")
+            return
+
+        print("📈 응답 시간 통계 (학습값 / 기본값)")
+        for platform, s in summary.items():
+            fmt = lambda v, unit="초": f"{v:.1f}{unit}" if v is not None else "-"
+            print(f"   {platform:7s} 샘플 {s['samples']}개")
+            print(f"      첫 토큰 {fmt(s['first_token_p50'])} / 완료 p50 {fmt(s['total_p50'])}, p95 {fmt(s['total_p95'])}")
+            print(f"      속도 {fmt(s['chars_per_sec'], '자/초')} / 중간 길이 {fmt(s['chars_p50'], '자')}")
+            print(f"      타임아웃 {s['timeout']:.0f}초 (기본 {self['max_wait']}초), "
+                  f"폴링 간격 {MIN_INTERVAL}~{self['check_interval']}초 (기본 {self['check_interval']}초)")
+
+
+# 저장된 통계 확인
+if __name__ == "__main__":
+    stats_file = sys.argv[1] if len(sys.argv) > 1 else STATS_FILE
+    AdaptiveDelays(stats_file).print_summary()
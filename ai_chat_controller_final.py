@@ -1,280 +1,749 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import time
-import os
-import json
-import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from adaptive_delays import AdaptiveDelays
+from browser_launcher import launch_chrome, attach_chrome, detach_chrome, get_driver_rss, apply_lite_settings, keep_tab_active
+from checkpoint import CHECKPOINT_FILE, save_checkpoint, load_checkpoint, clear_checkpoint
+from conversation_store import ConversationStore
+from locator_cache import LocatorCache
+from driver_pool import acquire_from_pool, release_to_pool, POOL_HOST, POOL_PORT
+from phase_timer import PhaseTimer, TRACE_FILE
+from page_scripts import (
+    POLLING_BASELINE_JS, REPLY_BASELINE_JS, ARM_WITH_BASELINE_JS, WAIT_COMPLETION_JS,
+    STREAM_INSTALL_JS, STREAM_READ_JS, STREAM_FINAL_JS, EXTRACT_MESSAGE_JS,
+    INJECT_MESSAGE_JS, PREPARE_INPUT_JS, INPUT_EMPTY_JS, AGENT_VERSION, AGENT_INSTALL_JS, AGENT_CALL_JS
+)
+from platform_adapters import css_selectors, default_adapters
+from profile_merge import merge_profiles, SHARED_PROFILE
+from prompt_source import open_prompt_source, parse_range, skipped_note
 
 class AIController:
-    def __init__(self):
-        self.gpt_driver = None
-        self.claude_driver = None
+    def __init__(self, gpt_profile="chrome_profile", claude_profile="claude_profile"):
+        # 플랫폼 이름 → 드라이버 / 어댑터
+        self.drivers = {}
+        self.adapters = default_adapters()
         self.is_running = False
         
-        # 프롬프트 저장 파일
+        # 브라우저 프로필 폴더 (병렬 실행시 워커마다 별도 사본 사용)
+        self.gpt_profile = gpt_profile
+        self.claude_profile = claude_profile
+        
+        # 통합 프로필 폴더 (지정하면 브라우저 하나에 GPT/Claude 탭을 띄움, --shared)
+        self.shared_profile = None
+        self.windows = {}  # 플랫폼 → 공유 브라우저의 탭 핸들
+        self.current_window = None
+        
+        # 브라우저 실행 방식: 'headed' (창 모드) 또는 'lite' (헤드리스 + 리소스 절약)
+        self.launch_mode = 'headed'
+        self.renderer_limit = None  # 렌더러 프로세스 최대 수 (None이면 Chrome 기본값)
+        self.tabs_per_browser = 1  # 2 이상이면 뒤 탭 스로틀링 해제 (TabMultiplexer)
+        
+        # 드라이버 풀 주소 (지정하면 미리 띄워둔 브라우저를 빌려서 사용)
+        self.pool_url = None
+        self.pool_slots = {}
+        self.conversation_count = 0
+        
+        # 프롬프트 파일 (JSON/JSONL/CSV, 필요한 만큼만 읽음)
         self.prompts_file = "prompts.json"
+        self.prompt_range = (0, None)
+        self.fresh_prompts = False  # True면 완료 기록(<파일>.done)을 지우고 처음부터
         self.load_prompts()
         
-        # 딜레이 설정
-        self.delays = {
-            'typing': 0.01,      # 타이핑 속도
-            'after_send': 4,     # 전송 후 대기
-            'check_interval': 2, # 응답 체크 간격
-            'max_wait': 120,     # 최대 대기 시간
-            'between_exchange': 4,  # 교환 간 대기
-            'initial_load': 10,  # 초기 로딩 대기
-            'between_prompts': 10  # 프롬프트 간 대기
+        # 딜레이 설정 (기본값은 adaptive_delays.DEFAULT_DELAYS, 관측된 응답 시간으로 폴링 간격/타임아웃 조정)
+        self.delays = AdaptiveDelays()
+        
+        # 응답 완료 감지 방식: 'observer' (MutationObserver), 'stream' (조각 단위 수신) 또는 'polling' (안정화 횟수)
+        self.completion_mode = 'observer'
+        self.on_delta = None  # 'stream' 모드에서 새 텍스트 조각마다 호출 (platform, chunk)
+        
+        # 메시지 입력 방식: 'inject' (스크립트로 직접 입력) 또는 'clipboard' (붙여넣기)
+        self.input_mode = 'inject'
+        
+        # 투기적 전달: 상대가 답하는 동안 받는 쪽 입력창을 미리 준비하고 완료 즉시 전송
+        self.speculative = False
+        self.prepared_inputs = {}
+        self.prepare_threads = {}
+        
+        # 통했던 셀렉터와 찾은 입력창 기억 (매 전송마다 후보를 처음부터 기다리지 않음)
+        self.locators = LocatorCache()
+        
+        # 페이지 에이전트 사용시 상태 확인/읽기/전송이 각각 WebDriver 요청 한 번 (--agent)
+        self.page_agent = False
+        self.command_counts = {}  # 플랫폼별 WebDriver 명령 수
+        self.counted_drivers = set()
+        
+        # 실행 통계 (교환별 전달 간격 등)
+        self.run_stats = {'handoff_gaps': [], 'commands_per_turn': []}
+        
+        # 단계별 소요 시간 (입력창 찾기, 입력, 전송, 첫 토큰, 완료 감지, 기록 등)
+        self.phases = PhaseTimer()
+        self.trace_file = TRACE_FILE  # None이면 타임라인 저장 안 함
+        self.last_timing = {}  # 플랫폼별 마지막 응답의 (첫 토큰, 전체) 시간
+        self.reply_baselines = {}  # 플랫폼별 전송 직전 마지막 응답 (폴링 대기가 이전 응답을 건너뛰는 기준)
+        
+        # 대화 구성
+        #   participants: 참가자 (어댑터 이름), turns: relay는 총 발언 수 / broadcast는 라운드 수
+        #   mode: 'relay' (차례로 직전 응답 전달) 또는 'broadcast' (모두에게 동시에 보내고 동시에 받음)
+        self.topology = {
+            'participants': ["GPT", "Claude"],
+            'mode': 'relay',
+            'turns': 6
         }
+        self.last_submit_at = 0
+        
+        # 대화 기록 (발언이 끝날 때마다 conversations.jsonl에 덧붙임)
+        self.store = ConversationStore()
+        
+        # 진행 상황 저장 위치 (None이면 저장 안 함, --resume으로 이어서 실행)
+        self.checkpoint_path = CHECKPOINT_FILE
+        self.successful_prompts = 0
+        self.attempted_prompts = 0
+        self.last_responses = {}
+    
+    @property
+    def gpt_driver(self):
+        return self.drivers.get("GPT")
+    
+    @gpt_driver.setter
+    def gpt_driver(self, driver):
+        self.drivers["GPT"] = driver
+    
+    @property
+    def claude_driver(self):
+        return self.drivers.get("Claude")
+    
+    @claude_driver.setter
+    def claude_driver(self, driver):
+        self.drivers["Claude"] = driver
     
     def load_prompts(self):
-        """프롬프트 불러오기"""
-        self.prompts = [
-            "안녕하세요! 당신의 이름은 무엇인가요? 그리고 오늘 기분은 어떠신가요?",
-            "좋아하는 색깔이 무엇인가요? 그 이유도 알려주세요.",
-            "만약 하루 동안 어떤 동물이든 될 수 있다면 무엇이 되고 싶나요?"
-        ]
-        self.save_prompts()
-    
-    def save_prompts(self):
-        """프롬프트 저장"""
-        with open(self.prompts_file, 'w', encoding='utf-8') as f:
-            json.dump(self.prompts, f, ensure_ascii=False, indent=2)
-    
-    def clean_response_text(self, text):
-        """응답 텍스트에서 UI 요소 제거"""
-        if not text:
-            return text
-        
-        # UI 요소들 제거
-        ui_elements = [
-            "재시도",
-            "Retry", 
-            "Copy",
-            "복사",
-            "좋아요",
-            "싫어요",
-            "👍",
-            "👎",
-            "Share",
-            "공유",
-            "Download",
-            "다운로드",
-            "Edit",
-            "편집"
-        ]
-        
-        cleaned_text = text
-        
-        # UI 요소 제거
-        for element in ui_elements:
-            cleaned_text = cleaned_text.replace(element, "")
-        
-        # 특수 패턴 제거 (버튼 텍스트 등)
-        cleaned_text = re.sub(r'\s*(재시도|복사|좋아요|싫어요)\s*$', '', cleaned_text)
-        cleaned_text = re.sub(r'^\s*(재시도|복사|좋아요|싫어요)\s*', '', cleaned_text)
-        
-        # 연속된 공백 정리
-        cleaned_text = " ".join(cleaned_text.split())
-        
-        return cleaned_text.strip()
+        """프롬프트 소스 열기 (파일이 없을 때만 기본 프롬프트로 생성)"""
+        start, end = self.prompt_range
+        self.prompts = open_prompt_source(self.prompts_file, start, end, fresh=self.fresh_prompts)
     
     def start_browsers(self):
         """브라우저 시작"""
+        if self.pool_url:
+            return self.attach_pool_browsers()
+        if self.shared_profile:
+            return self.start_shared_browser()
+        
+        started = time.time()
         print("🚀 브라우저 시작 중...")
         
+        if self.launch_mode == 'lite':
+            print("   🪶 저사양 모드 (헤드리스, 이미지/폰트/미디어 차단)")
+        
+        background_tabs = self.tabs_per_browser > 1
+        
         # ChatGPT 브라우저
-        gpt_options = webdriver.ChromeOptions()
-        gpt_options.add_argument(f"user-data-dir={os.path.join(os.getcwd(), 'chrome_profile')}")
-        gpt_options.add_argument("--disable-blink-features=AutomationControlled")
-        gpt_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        gpt_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.gpt_driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=gpt_options
-        )
+        self.gpt_driver = launch_chrome(self.gpt_profile, self.launch_mode, self.renderer_limit, background_tabs)
         
         # Claude 브라우저
-        claude_options = webdriver.ChromeOptions()
-        claude_options.add_argument(f"user-data-dir={os.path.join(os.getcwd(), 'claude_profile')}")
-        claude_options.add_argument("--disable-blink-features=AutomationControlled")
-        claude_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        claude_options.add_experimental_option('useAutomationExtension', False)
-        
-        self.claude_driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=claude_options
-        )
+        self.claude_driver = launch_chrome(self.claude_profile, self.launch_mode, self.renderer_limit, background_tabs)
         
         # 채팅 페이지로 이동
         print("📍 ChatGPT 페이지 로딩...")
-        self.gpt_driver.get("https://chatgpt.com")
+        self.adapters["GPT"].new_chat(self.gpt_driver)
         
         print("📍 Claude 페이지 로딩...")
-        self.claude_driver.get("https://claude.ai/new")
+        self.adapters["Claude"].new_chat(self.claude_driver)
+        print(f"   브라우저 2개 실행 + 페이지 로딩: {time.time() - started:.1f}초")
         
         print(f"⏳ {self.delays['initial_load']}초 대기 중...")
         time.sleep(self.delays['initial_load'])
         
         print("✅ 브라우저 준비 완료\n")
     
-    def send_to_gpt(self, message):
-        """GPT에 메시지 전송"""
-        try:
-            print("📤 GPT에 메시지 전송 시작...")
+    def start_shared_browser(self):
+        """통합 프로필로 브라우저 하나를 띄우고 GPT/Claude를 탭으로 열기 (통합 프로필이 없으면 먼저 만듦)"""
+        merge_profiles({"GPT": self.gpt_profile, "Claude": self.claude_profile}, self.shared_profile, self.launch_mode)
+        
+        started = time.time()
+        print("🚀 공유 브라우저 시작 중... (두 사이트를 탭 하나씩)")
+        # 응답을 기다리는 쪽 탭이 뒤로 가도 느려지지 않도록 스로틀링 해제
+        driver = launch_chrome(self.shared_profile, self.launch_mode, self.renderer_limit, background_tabs=True)
+        
+        for i, platform in enumerate(("GPT", "Claude")):
+            if i > 0:
+                driver.switch_to.new_window('tab')
+                if self.launch_mode == 'lite':
+                    apply_lite_settings(driver)
+            print(f"📍 {platform} 페이지 로딩...")
+            self.adapters[platform].new_chat(driver)
+            keep_tab_active(driver)
+            self.windows[platform] = self.current_window = driver.current_window_handle
+            self.drivers[platform] = driver
+        print(f"   브라우저 1개 실행 + 페이지 로딩: {time.time() - started:.1f}초")
+        
+        print(f"⏳ {self.delays['initial_load']}초 대기 중...")
+        time.sleep(self.delays['initial_load'])
+        
+        print("✅ 브라우저 준비 완료\n")
+    
+    def focus(self, platform):
+        """공유 브라우저에서 플랫폼 탭으로 전환 (브라우저가 따로면 아무것도 안 함)"""
+        handle = self.windows.get(platform)
+        if handle and handle != self.current_window:
+            self.drivers[platform].switch_to.window(handle)
+            self.current_window = handle
+    
+    def attach_pool_browsers(self):
+        """드라이버 풀에서 로그인된 브라우저를 빌려 연결"""
+        print(f"🔗 드라이버 풀에서 브라우저 대여 중... ({self.pool_url})")
+        
+        for platform in ("GPT", "Claude"):
+            slot = acquire_from_pool(self.pool_url, platform)
+            if not slot:
+                raise RuntimeError(f"{platform} 브라우저를 풀에서 빌리지 못했습니다")
             
-            # 여러 방법으로 입력창 찾기
-            input_selectors = [
-                (By.ID, "prompt-textarea"),
-                (By.CSS_SELECTOR, "textarea[data-id='root']"),
-                (By.CSS_SELECTOR, "div[contenteditable='true']")
-            ]
+            self.pool_slots[platform] = slot
+            self.drivers[platform] = attach_chrome(slot['port'], self.launch_mode, slot.get('pid'))
+            self.new_chat(platform)
+            print(f"   ✓ {platform}: {slot['id']} (포트 {slot['port']})")
+        
+        print("✅ 브라우저 준비 완료\n")
+    
+    def count_commands(self):
+        """드라이버마다 WebDriver 명령 수를 세도록 연결 (요소 조작도 driver.execute를 거침)"""
+        for platform, driver in self.drivers.items():
+            if driver is None or id(driver) in self.counted_drivers:
+                continue
+            self.counted_drivers.add(id(driver))
+            execute = driver.execute
             
-            input_div = None
-            for by, selector in input_selectors:
-                try:
-                    input_div = WebDriverWait(self.gpt_driver, 5).until(
-                        EC.element_to_be_clickable((by, selector))
-                    )
-                    if input_div:
-                        print(f"   ✓ 입력창 찾음: {selector}")
-                        break
-                except:
-                    continue
+            def counted(command, params=None, platform=platform, execute=execute):
+                self.command_counts[platform] = self.command_counts.get(platform, 0) + 1
+                return execute(command, params)
+            driver.execute = counted
+    
+    def print_command_summary(self):
+        """발언당 WebDriver 명령 수 요약 출력"""
+        counts = self.run_stats['commands_per_turn']
+        if not counts:
+            return
+        mode = "에이전트" if self.page_agent else self.completion_mode
+        print(f"🔢 WebDriver 명령 ({mode}): 발언당 평균 {sum(counts) / len(counts):.1f}회 / 최대 {max(counts):.0f}회 "
+              f"(플랫폼별 합계 {', '.join(f'{p} {n}' for p, n in self.command_counts.items())})")
+    
+    def report_memory(self, label):
+        """드라이버별 메모리 사용량(RSS) 출력"""
+        if self.windows:
+            usage = {"공유 브라우저": get_driver_rss(self.gpt_driver)}
+        else:
+            usage = {platform: get_driver_rss(driver) for platform, driver in self.drivers.items()}
+        if all(rss is None for rss in usage.values()):
+            return usage
+        
+        summary = ", ".join(
+            f"{platform} {rss:.0f}MB" if rss is not None else f"{platform} n/a" for platform, rss in usage.items()
+        )
+        print(f"🧠 메모리 ({label}): {summary}")
+        return usage
+    
+    def send_message(self, platform, message):
+        """플랫폼 어댑터를 통해 메시지 전송"""
+        adapter = self.adapters[platform]
+        driver = self.drivers[platform]
+        try:
+            self.focus(platform)
+            print(f"📤 {platform}에 메시지 전송 시작...")
+            
+            if self.page_agent and self.send_with_agent(driver, platform, message):
+                return True
             
+            # 입력창 찾기 (미리 준비해 둔 입력창이 있으면 사용)
+            with self.phases.phase('locate', platform):
+                input_div = self.take_prepared_input(platform) or adapter.find_input(driver, self.locators)
             if not input_div:
-                print("❌ GPT 입력창을 찾을 수 없습니다")
+                print(f"❌ {platform} 입력창을 찾을 수 없습니다")
                 return False
             
-            # JavaScript로 포커스 및 클리어
-            self.gpt_driver.execute_script("""
-                var element = arguments[0];
-                element.focus();
-                element.click();
-            """, input_div)
-            time.sleep(0.5)
+            # 메시지 입력 (직접 입력 실패시 클립보드 방식)
+            with self.phases.phase('inject', platform, chars=len(message)):
+                injected = self.input_mode == 'inject' and self.inject_message(driver, input_div, message)
+            if not injected:
+                self.paste_message(adapter, driver, input_div, message)
             
-            # 기존 텍스트 삭제
+            # 전송
+            with self.phases.phase('submit', platform):
+                self.arm_completion_observer(driver, platform, message)
+                adapter.submit(driver, input_div)
+            self.last_submit_at = time.time()
+            
+            print(f"✅ {platform} 전송 완료!")
+            print(f"   메시지: {message[:60]}...")
+            with self.phases.phase('after_send', platform):
+                self.wait_after_send(driver, input_div)
+            return True
+            
+        except Exception as e:
+            print(f"❌ {platform} 전송 실패: {e}")
+            driver.save_screenshot(f"{platform.lower()}_error.png")
+            return False
+    
+    def start_prepare(self, platform):
+        """받는 쪽 입력창을 백그라운드에서 미리 찾아 비워둠
+
+        에이전트는 전송이 요청 한 번이라 불필요하고, 공유 브라우저는 탭 전환이 겹치므로 사용 안 함
+        """
+        if not self.speculative or self.page_agent or self.windows:
+            return
+        
+        def prepare():
+            adapter = self.adapters[platform]
+            driver = self.drivers[platform]
+            try:
+                with self.phases.phase('prepare', platform):
+                    input_div = adapter.find_input(driver, self.locators)
+                    if input_div:
+                        driver.execute_script(PREPARE_INPUT_JS, input_div)
+                if input_div:
+                    self.prepared_inputs[platform] = input_div
+            except Exception as e:
+                print(f"   ⚠️ {platform} 입력창 준비 실패: {e}")
+        
+        self.prepared_inputs.pop(platform, None)
+        thread = threading.Thread(target=prepare, daemon=True)
+        self.prepare_threads[platform] = thread
+        thread.start()
+    
+    def take_prepared_input(self, platform):
+        """미리 준비한 입력창 꺼내기 (아직 페이지에 붙어 있을 때만)"""
+        thread = self.prepare_threads.pop(platform, None)
+        if thread:
+            thread.join()
+        input_div = self.prepared_inputs.pop(platform, None)
+        if input_div is None:
+            return None
+        try:
+            input_div.is_enabled()
+            return input_div
+        except Exception:
+            return None
+    
+    def forward_response(self, sender, receiver, response):
+        """한쪽 응답을 다른 쪽에 전달하고 전달 간격 기록"""
+        received_at = time.time()
+        
+        # 투기적 전달이면 입력창이 이미 준비되어 있으므로 바로 전송
+        if not self.speculative:
+            print(f"⏸️ {self.delays['between_exchange']}초 대기...")
+            with self.phases.phase('between_exchange', receiver):
+                time.sleep(self.delays['between_exchange'])
+        
+        print(f"\n【{sender} → {receiver}】 {receiver}에 {sender} 응답 전달")
+        if not self.send_message(receiver, response):
+            print(f"❌ {receiver} 전달 실패")
+            return False
+        
+        # 응답 수신 ~ 상대 전송 클릭까지 (전송 후 대기는 제외)
+        gap = self.last_submit_at - received_at
+        self.run_stats['handoff_gaps'].append((f"{sender}→{receiver}", gap))
+        print(f"🔀 전달 간격: {gap:.2f}초")
+        return True
+    
+    def inject_message(self, driver, input_div, message):
+        """스크립트 한 번으로 입력창 내용 교체 (확인되면 True)"""
+        try:
+            if driver.execute_script(INJECT_MESSAGE_JS, input_div, message):
+                return True
+            print("   ⚠️ 직접 입력 확인 실패, 클립보드 방식 사용")
+        except Exception as e:
+            print(f"   ⚠️ 직접 입력 실패: {e}")
+        return False
+    
+    def paste_message(self, adapter, driver, input_div, message):
+        """클립보드 붙여넣기로 메시지 입력"""
+        # 클릭 및 포커스
+        adapter.focus_input(driver, input_div)
+        time.sleep(0.5)
+        
+        # 기존 텍스트 삭제
+        with self.phases.phase('clear', adapter.name):
             input_div.send_keys(Keys.CONTROL + "a")
             time.sleep(0.2)
             input_div.send_keys(Keys.DELETE)
             time.sleep(0.5)
-            
-            # 메시지 입력 (클립보드 방식)
-            self.gpt_driver.execute_script("""
+        
+        # 클립보드로 텍스트 복사 후 붙여넣기
+        with self.phases.phase('paste', adapter.name, chars=len(message)):
+            driver.execute_script("""
                 navigator.clipboard.writeText(arguments[0]);
             """, message)
             time.sleep(0.5)
             
             input_div.send_keys(Keys.CONTROL + "v")
             time.sleep(1)
-            
-            # Enter로 전송
-            input_div.send_keys(Keys.RETURN)
-            
-            print(f"✅ GPT 전송 완료!")
-            print(f"   메시지: {message[:60]}...")
+    
+    def wait_after_send(self, driver, input_div):
+        """전송 후 대기 (옵저버 사용시 입력창이 비워질 때까지만)"""
+        if self.input_mode != 'inject' or self.completion_mode == 'polling':
             time.sleep(self.delays['after_send'])
-            return True
-            
+            return
+        try:
+            WebDriverWait(driver, self.delays['after_send'], poll_frequency=0.1).until(
+                lambda d: d.execute_script(INPUT_EMPTY_JS, input_div)
+            )
+        except Exception:
+            pass
+    
+    def agent_call(self, driver, platform, method, *args):
+        """페이지 에이전트 메서드 호출 (페이지가 새로 로드되어 없으면 설치하면서 호출)"""
+        result = driver.execute_script(AGENT_CALL_JS, AGENT_VERSION, method, list(args))
+        if isinstance(result, dict) and result.get('missing'):
+            adapter = self.adapters[platform]
+            config = {
+                'version': AGENT_VERSION,
+                'input': css_selectors(adapter.input_selectors),
+                'response': adapter.response_selectors,
+                'stop': adapter.stop_selectors,
+                'streaming': adapter.streaming_selectors,
+                'submit': adapter.submit_selectors,
+                'toolbar': adapter.toolbar_selectors
+            }
+            result = driver.execute_script(AGENT_INSTALL_JS, config, method, list(args))
+        return result
+    
+    def send_with_agent(self, driver, platform, message):
+        """에이전트로 입력+기준점+전송 (실패하면 False → 기존 방식으로 전송)"""
+        try:
+            with self.phases.phase('submit', platform, chars=len(message)):
+                result = self.agent_call(driver, platform, 'send', message)
+                # 전송 버튼이 없는 화면이면 돌려받은 입력창에 Enter
+                if result.get('reason') == 'submit' and result.get('input'):
+                    result['input'].send_keys(Keys.RETURN)
+                    result['sent'] = True
+                # 버튼이 비활성이라 페이지 안에서 재시도 중이면 실제로 눌릴 때까지 확인
+                deadline = time.time() + 3
+                while result.get('sent') == 'pending' and time.time() < deadline:
+                    time.sleep(0.05)
+                    result['sent'] = self.agent_call(driver, platform, 'submitted')
+                if result.get('sent') == 'clicked':
+                    result['sent'] = True
+                elif result.get('sent') is not True:
+                    result['reason'] = 'submit'
+                    result['sent'] = False
         except Exception as e:
-            print(f"❌ GPT 전송 실패: {e}")
-            self.gpt_driver.save_screenshot("gpt_error.png")
+            print(f"   ⚠️ 에이전트 전송 실패: {e}")
+            return False
+        if result.get('baseline'):
+            self.reply_baselines[platform] = result['baseline']
+        if not result.get('sent'):
+            print(f"   ⚠️ 에이전트 전송 실패 ({result.get('reason')}), 기존 방식 사용")
             return False
+        
+        self.last_submit_at = time.time()
+        print(f"✅ {platform} 전송 완료! (에이전트)")
+        print(f"   메시지: {message[:60]}...")
+        return True
+    
+    def new_chat(self, platform):
+        """새 채팅 시작 (에이전트 사용시 사이트 안 링크로 이동, 없으면 주소로 이동)"""
+        driver = self.drivers[platform]
+        adapter = self.adapters[platform]
+        self.focus(platform)
+        try:
+            if self.page_agent and self.agent_call(driver, platform, 'newChat', adapter.new_chat_url):
+                return
+        except Exception:
+            pass
+        adapter.new_chat(driver)
+        self.locators.invalidate(platform)
+    
+    def send_to_gpt(self, message):
+        """GPT에 메시지 전송"""
+        return self.send_message("GPT", message)
     
     def send_to_claude(self, message):
         """Claude에 메시지 전송"""
+        return self.send_message("Claude", message)
+    
+    def arm_completion_observer(self, driver, platform, message=""):
+        """전송 직전에 옵저버 설치 및 기준점 기록 (폴링 방식도 이전 응답 기준점은 기록)"""
+        adapter = self.adapters[platform]
+        selectors = adapter.response_selectors
+        self.reply_baselines.pop(platform, None)
         try:
-            print("📤 Claude에 메시지 전송 시작...")
-            
-            # 입력창 찾기
-            input_div = WebDriverWait(self.claude_driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "div[contenteditable='true']"))
+            if self.completion_mode == 'observer':
+                baseline = driver.execute_script(ARM_WITH_BASELINE_JS, selectors, message, adapter.toolbar_selectors)
+            elif self.completion_mode == 'stream':
+                baseline = driver.execute_script(STREAM_INSTALL_JS + REPLY_BASELINE_JS,
+                                                 selectors, message, True, adapter.toolbar_selectors)
+            else:
+                baseline = driver.execute_script(POLLING_BASELINE_JS, selectors, adapter.toolbar_selectors)
+            self.reply_baselines[platform] = baseline
+        except Exception as e:
+            print(f"   ⚠️ 옵저버 설치 실패: {e}")
+    
+    def wait_for_response_complete(self, driver, platform="GPT"):
+        """응답 완료 대기 (첫 토큰까지 / 생성 / 완료 감지 후 반환까지를 단계로 기록)"""
+        self.focus(platform)
+        self.last_timing.pop(platform, None)
+        started = time.perf_counter()
+        result = self.detect_response_complete(driver, platform)
+        finished = time.perf_counter()
+        
+        timing = self.last_timing.get(platform)
+        if timing:
+            # 측정 기준점(전송 또는 대기 시작)부터 완료 감지까지를 뒤에서부터 배치
+            first_token, total = timing
+            anchor = max(finished - total, started) if total else started
+            if first_token is not None:
+                first_at = min(anchor + first_token, finished)
+                self.phases.add('first_token', platform, anchor, first_at)
+                anchor = first_at
+            self.phases.add('generation', platform, anchor, finished, chars=len(result or ''))
+        else:
+            self.phases.add('response_wait', platform, started, finished)
+        return result
+    
+    def record_timing(self, platform, first_token, total, chars):
+        """응답 시간을 학습 통계에 넣고 단계 기록용으로 보관"""
+        self.last_timing[platform] = (first_token, total)
+        self.delays.record(platform, first_token, total, chars)
+    
+    def detect_response_complete(self, driver, platform="GPT"):
+        """설정된 방식으로 응답 완료 감지 (감지 방식을 쓸 수 없으면 폴링으로 전환)
+
+        None은 시간 초과/응답 없음이므로 폴링으로 다시 기다리지 않고 그대로 실패 처리
+        """
+        baseline = self.reply_baselines.get(platform)
+        if self.page_agent:
+            result = self.wait_for_response_agent(driver, platform)
+        elif self.completion_mode == 'observer':
+            result = self.wait_for_response_observer(driver, platform)
+        elif self.completion_mode == 'stream':
+            result = self.wait_for_response_streaming(driver, platform)
+        else:
+            return self.wait_for_response_polling(driver, platform, baseline)
+        
+        if result is not False:
+            return result
+        print("   ↩️ 폴링 방식으로 전환")
+        return self.wait_for_response_polling(driver, platform, baseline)
+    
+    def stream_response(self, driver, platform="GPT"):
+        """응답이 오는 동안 새로 덧붙은 텍스트 조각만 차례로 yield
+        
+        매 확인마다 전체 텍스트가 아닌 추가분만 전달받으므로 응답이 길어져도 비용이 일정하다.
+        끝나면 'complete' 또는 'timeout'을 반환한다 (StopIteration.value).
+        """
+        adapter = self.adapters[platform]
+        start_time = time.time()
+        max_wait = self.delays.timeout(platform)
+        offset = 0
+        saw_indicator = False
+        
+        while (time.time() - start_time) < max_wait:
+            state = driver.execute_script(
+                STREAM_READ_JS,
+                adapter.response_selectors, "", False,
+                adapter.stop_selectors,
+                adapter.streaming_selectors,
+                offset
             )
+            for chunk in state['chunks']:
+                yield chunk
+            offset = state['count']
             
-            # 클릭 및 포커스
-            input_div.click()
-            time.sleep(0.5)
-            
-            # 기존 텍스트 삭제
-            input_div.send_keys(Keys.CONTROL + "a")
-            time.sleep(0.2)
-            input_div.send_keys(Keys.DELETE)
-            time.sleep(0.5)
-            
-            # 클립보드로 텍스트 복사
-            self.claude_driver.execute_script("""
-                navigator.clipboard.writeText(arguments[0]);
-            """, message)
-            time.sleep(0.5)
-            
-            # 붙여넣기
-            input_div.send_keys(Keys.CONTROL + "v")
-            time.sleep(1)
+            if state['active']:
+                saw_indicator = True
+            quiet = self.delays['settle'] if saw_indicator else self.delays['quiet_period']
+            if (state['started'] and not state['active'] and state['length'] > 50
+                    and state['idle'] >= quiet * 1000):
+                return 'complete'
             
-            # Enter로 전송
-            input_div.send_keys(Keys.RETURN)
+            time.sleep(self.delays['stream_interval'])
+        
+        return 'timeout'
+    
+    def wait_for_response_streaming(self, driver, platform="GPT"):
+        """조각 단위로 응답 수신 후 완료 대기 (실패시 False)"""
+        print(f"⏳ {platform} 응답 대기 중... (스트리밍)")
+        
+        start_time = time.time()
+        first_token = None
+        received = 0
+        stream = self.stream_response(driver, platform)
+        try:
+            while True:
+                try:
+                    chunk = next(stream)
+                except StopIteration as stop:
+                    status = stop.value
+                    break
+                if first_token is None:
+                    first_token = time.time() - start_time
+                received += len(chunk)
+                if self.on_delta:
+                    self.on_delta(platform, chunk)
             
-            print(f"✅ Claude 전송 완료!")
-            print(f"   메시지: {message[:60]}...")
-            time.sleep(self.delays['after_send'])
-            return True
+            # 최종 텍스트는 끝난 뒤 한 번만 읽어서 정리
+            with self.phases.phase('extract', platform):
+                text = driver.execute_script(STREAM_FINAL_JS, self.adapters[platform].toolbar_selectors)
+        except Exception as e:
+            print(f"   ⚠️ 스트리밍 수신 실패: {e}")
+            return False
+        
+        if status == 'complete' and text and len(text) > 50:
+            print(f"✅ {platform} 응답 완료! (총 {len(text)}자)")
+            self.record_timing(platform, first_token, time.time() - start_time, len(text))
+            return text
+        
+        if text and len(text) > 50:
+            print(f"⚠️ {platform} 시간 초과, 현재까지 받은 응답 사용 ({len(text)}자)")
+            return text
+        
+        print(f"❌ {platform} 응답을 받지 못했습니다")
+        return None
+    
+    def wait_for_response_observer(self, driver, platform="GPT"):
+        """MutationObserver 신호로 응답 완료 대기 (실패시 False)"""
+        print(f"⏳ {platform} 응답 대기 중... (옵저버)")
+        
+        adapter = self.adapters[platform]
+        max_wait = self.delays.timeout(platform)
+        try:
+            driver.set_script_timeout(max_wait + 5)
+            result = driver.execute_async_script(
+                WAIT_COMPLETION_JS,
+                adapter.response_selectors,
+                adapter.stop_selectors,
+                adapter.streaming_selectors,
+                int(self.delays['quiet_period'] * 1000),
+                int(self.delays['settle'] * 1000),
+                50,
+                int(max_wait * 1000),
+                adapter.toolbar_selectors
+            )
+        except Exception as e:
+            print(f"   ⚠️ 옵저버 대기 실패: {e}")
+            return False
+        
+        if not result:
+            return False
+        
+        text = result.get('text') or ''
+        if result.get('status') == 'complete':
+            print(f"✅ {platform} 응답 완료! (총 {len(text)}자)")
+            first_ms = result.get('firstMs')
+            self.record_timing(
+                platform,
+                first_ms / 1000 if first_ms is not None else None,
+                result.get('totalMs', 0) / 1000,
+                len(text)
+            )
+            return text
+        
+        # 시간 초과시 마지막 텍스트 반환
+        if text and len(text) > 50:
+            print(f"⚠️ {platform} 시간 초과, 현재까지 받은 응답 사용 ({len(text)}자)")
+            return text
+        
+        print(f"❌ {platform} 응답을 받지 못했습니다")
+        return None
+    
+    def wait_for_response_agent(self, driver, platform="GPT"):
+        """페이지 에이전트 상태를 주기적으로 확인 (확인마다 요청 한 번, 끝나면 읽기 한 번)
+
+        에이전트를 실행할 수 없으면 False, 시간 초과로 응답이 없으면 None
+        """
+        print(f"⏳ {platform} 응답 대기 중... (에이전트)")
+        
+        start_time = time.time()
+        max_wait = self.delays.timeout(platform)
+        quiet_ms = int(self.delays['quiet_period'] * 1000)
+        settle_ms = int(self.delays['settle'] * 1000)
+        offset = 0
+        status = None
+        interval = None
+        try:
+            while (time.time() - start_time) < max_wait:
+                status = self.agent_call(driver, platform, 'status', quiet_ms, settle_ms, 50)
+                if status['state'] == 'complete':
+                    break
+                
+                # 새 텍스트 조각 전달은 콜백이 있을 때만 (읽기 요청이 추가됨)
+                if self.on_delta and status['length'] > offset:
+                    chunk = self.agent_call(driver, platform, 'read', offset)
+                    if chunk['text']:
+                        self.on_delta(platform, chunk['text'])
+                    offset = chunk['length']
+                
+                interval = self.delays.poll_interval(platform, time.time() - start_time, interval)
+                time.sleep(interval)
             
+            text = self.agent_call(driver, platform, 'read', 0)['text']
         except Exception as e:
-            print(f"❌ Claude 전송 실패: {e}")
-            self.claude_driver.save_screenshot("claude_error.png")
+            print(f"   ⚠️ 에이전트 대기 실패: {e}")
             return False
+        
+        if status and status['state'] == 'complete':
+            print(f"✅ {platform} 응답 완료! (총 {len(text)}자)")
+            first_ms = status.get('firstMs')
+            self.record_timing(
+                platform,
+                first_ms / 1000 if first_ms is not None else None,
+                status.get('totalMs', 0) / 1000,
+                len(text)
+            )
+            return text
+        
+        if text and len(text) > 50:
+            print(f"⚠️ {platform} 시간 초과, 현재까지 받은 응답 사용 ({len(text)}자)")
+            return text
+        
+        print(f"❌ {platform} 응답을 받지 못했습니다")
+        return None
     
-    def wait_for_response_complete(self, driver, platform="GPT"):
-        """응답 완료 대기"""
+    def wait_for_response_polling(self, driver, platform="GPT", baseline=None):
+        """응답 완료 대기 (텍스트 안정화 횟수 방식)
+
+        baseline(전송 직전 마지막 응답의 개수/본문)이 있으면 그대로 남아 있는 이전 응답은 무시
+        """
         print(f"⏳ {platform} 응답 대기 중...")
         
-        # 플랫폼별 셀렉터
-        if platform == "GPT":
-            selectors = [
-                "div[data-message-author-role='assistant']",
-                "div.group:has(div.text-token-text-primary)"
-            ]
-        else:  # Claude
-            selectors = [
-                "div[data-test-render-count]",
-                "div.prose"
-            ]
+        adapter = self.adapters[platform]
+        selectors = adapter.response_selectors
         
         start_time = time.time()
+        max_wait = self.delays.timeout(platform)
         last_text = ""
+        initial_text = None
+        first_token = None
         stable_count = 0
+        interval = None
         
-        while (time.time() - start_time) < self.delays['max_wait']:
+        while (time.time() - start_time) < max_wait:
             try:
-                # 여러 셀렉터 시도
-                messages = None
-                for selector in selectors:
-                    try:
-                        messages = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if messages:
-                            break
-                    except:
-                        continue
+                # 여러 셀렉터 시도 (지난번에 찾은 셀렉터부터)
+                messages = self.locators.find_all(driver, platform, 'response', selectors)
                 
                 if messages:
                     latest_msg = messages[-1]
                     
-                    # JavaScript로 전체 텍스트 가져오기
-                    current_text = driver.execute_script("""
-                        return arguments[0].innerText || arguments[0].textContent || '';
-                    """, latest_msg)
-                    
-                    # UI 요소 제거
-                    current_text = self.clean_response_text(current_text)
+                    # 본문만 마크다운으로 가져오기 (버튼/툴바는 브라우저에서 제외)
+                    current_text = driver.execute_script(
+                        EXTRACT_MESSAGE_JS, latest_msg, adapter.toolbar_selectors
+                    )
+                    # 새 응답이 아직 안 생겼으면 이전 응답은 빈 것으로 취급
+                    if (baseline and len(messages) <= baseline['count']
+                            and current_text == baseline['text']):
+                        current_text = ""
                     current_length = len(current_text) if current_text else 0
                     
+                    # 첫 토큰 시점 기록 (대기 시작 때 보이던 텍스트에서 바뀐 순간)
+                    if initial_text is None:
+                        initial_text = current_text
+                    elif first_token is None and current_text != initial_text:
+                        first_token = time.time() - start_time
+                    
                     # 텍스트가 안정화되었는지 확인
                     if current_length > 50 and current_text == last_text:
                         stable_count += 1
@@ -282,6 +751,7 @@ class AIController:
                         
                         if stable_count >= 3:
                             print(f"✅ {platform} 응답 완료! (총 {current_length}자)")
+                            self.record_timing(platform, first_token, time.time() - start_time, current_length)
                             return current_text
                     else:
                         stable_count = 0
@@ -292,7 +762,9 @@ class AIController:
             except Exception as e:
                 pass
             
-            time.sleep(self.delays['check_interval'])
+            # 스트리밍 중에는 간격을 늘리고 예상 완료 시점 근처에서는 촘촘하게 확인
+            interval = self.delays.poll_interval(platform, time.time() - start_time, interval)
+            time.sleep(interval)
         
         # 시간 초과시 마지막 텍스트 반환
         if last_text and len(last_text) > 50:
@@ -302,140 +774,367 @@ class AIController:
         print(f"❌ {platform} 응답을 받지 못했습니다")
         return None
     
-    def save_conversation_log(self, prompt_idx, conversations):
-        """대화 내용을 파일로 저장"""
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        filename = f"conversation_{timestamp}_prompt{prompt_idx + 1}.txt"
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"프롬프트 {prompt_idx + 1}: {self.prompts[prompt_idx]}\n")
-                f.write("=" * 70 + "\n\n")
-                
-                for i, (speaker, text) in enumerate(conversations):
-                    f.write(f"[{i+1}] {speaker}:\n")
-                    f.write(text + "\n")
-                    f.write("-" * 50 + "\n\n")
-                
-            print(f"💾 대화 내용 저장: {filename}")
-        except Exception as e:
-            print(f"⚠️ 파일 저장 실패: {e}")
+    def record_turn(self, prompt_idx, turn, speaker, text, wait_seconds=None):
+        """발언 하나를 대화 저장소에 기록 (turn 0은 프롬프트, 응답은 받는 즉시 파일에 기록)"""
+        with self.phases.phase('log_write', speaker):
+            self.store.append(prompt_idx + 1, turn, speaker, text, wait_seconds)
+            # 끝난 응답을 버퍼에 남겨 두면 중간에 죽었을 때 잃어버림 (재개시 다시 기록하지 않음)
+            if turn > 0:
+                self.store.flush()
     
-    def run_single_prompt_conversation(self, prompt, prompt_idx):
-        """단일 프롬프트로 3회 왕복 대화"""
+    def run_single_prompt_conversation(self, prompt, prompt_idx, resume=None):
+        """단일 프롬프트로 대화 진행 (구성은 self.topology, resume: 체크포인트에서 이어서 진행)"""
         print(f"\n{'='*70}")
         print(f"🎯 프롬프트 {prompt_idx + 1}/{len(self.prompts)}")
         print(f"📝 내용: {prompt}")
         print(f"{'='*70}\n")
         
-        conversations = []  # 대화 기록
+        conversations = [tuple(turn) for turn in resume['conversations']] if resume else []  # 대화 기록
+        self.conversation_count += 1
+        self.phases.context = {'prompt': prompt_idx + 1, 'turn': len(conversations)}
+        self.report_memory("대화 시작 전")
+        if resume:
+            print(f"↩️ {len(conversations)}번째 발언까지 완료된 상태에서 이어서 진행")
         
-        # 1. GPT에 초기 프롬프트 전송
-        print("【1단계】 GPT에 초기 프롬프트 전송")
-        if not self.send_to_gpt(prompt):
-            return False
+        self.count_commands()
+        commands_before = sum(self.command_counts.values())
+        turns_before = len(conversations)
         
-        # 2. 3회 왕복 대화
-        for exchange in range(3):
-            print(f"\n{'─'*50}")
-            print(f"🔄 왕복 대화 {exchange + 1}/3")
-            print(f"{'─'*50}\n")
-            
-            # GPT 응답 받기
-            print("【GPT → Claude】 GPT 응답 대기")
-            gpt_response = self.wait_for_response_complete(self.gpt_driver, "GPT")
-            if not gpt_response:
-                print("❌ GPT 응답 받기 실패")
-                return False
-            
-            print(f"📥 GPT 응답 수신 완료 ({len(gpt_response)}자)")
-            conversations.append(("GPT", gpt_response))
-            
-            # 교환 간 대기
-            print(f"⏸️ {self.delays['between_exchange']}초 대기...")
-            time.sleep(self.delays['between_exchange'])
-            
-            # Claude에 전달
-            print("\n【GPT → Claude】 Claude에 GPT 응답 전달")
-            if not self.send_to_claude(gpt_response):
-                print("❌ Claude 전달 실패")
+        if self.topology['mode'] == 'broadcast':
+            success = self.run_broadcast(prompt, prompt_idx, conversations, resume)
+        else:
+            success = self.run_relay(prompt, prompt_idx, conversations, resume)
+        
+        turns = len(conversations) - turns_before
+        if turns:
+            self.run_stats['commands_per_turn'].append((sum(self.command_counts.values()) - commands_before) / turns)
+        
+        if success:
+            print(f"\n✅ 프롬프트 {prompt_idx + 1} 완료!")
+            self.report_memory("대화 종료 후")
+        return success
+    
+    def describe_topology(self):
+        """대화 구성 설명 (출력용)"""
+        participants = self.topology['participants']
+        turns = self.topology['turns']
+        if self.topology['mode'] == 'broadcast':
+            return f"{', '.join(participants)} 동시 응답 {turns}라운드"
+        return f"{' → '.join(participants)} 순서로 발언 {turns}회"
+    
+    def check_topology(self):
+        """대화 구성 검증 (참가자마다 어댑터와 브라우저가 있어야 함)"""
+        participants = self.topology['participants']
+        if self.topology['mode'] not in ('relay', 'broadcast'):
+            raise ValueError(f"알 수 없는 대화 방식: {self.topology['mode']}")
+        if len(participants) < 2 or len(set(participants)) != len(participants):
+            raise ValueError(f"참가자는 서로 다른 2개 이상이어야 합니다: {participants}")
+        for platform in participants:
+            if platform not in self.adapters:
+                raise ValueError(f"지원하지 않는 참가자: {platform} (가능: {', '.join(self.adapters)})")
+        if self.topology['turns'] < 1:
+            raise ValueError("발언 수는 1 이상이어야 합니다")
+        if self.shared_profile and self.topology['mode'] == 'broadcast':
+            raise ValueError("공유 브라우저는 탭을 하나씩 조작하므로 broadcast 방식을 지원하지 않습니다")
+    
+    def receive_response(self, platform, resume=None):
+        """응답 대기 후 (응답, 걸린 시간) 반환 (resume이 있으면 중단 전에 요청한 응답)"""
+        started = time.time()
+        if resume:
+            response = self.wait_for_resumed_response(platform, resume)
+        else:
+            response = self.wait_for_response_complete(self.drivers[platform], platform)
+        if not response:
+            print(f"❌ {platform} 응답 받기 실패")
+            return None, time.time() - started
+        
+        print(f"📥 {platform} 응답 수신 완료 ({len(response)}자)")
+        self.last_responses[platform] = response
+        return response, time.time() - started
+    
+    def run_relay(self, prompt, prompt_idx, conversations, resume=None):
+        """참가자 순서대로 돌아가며 직전 응답을 다음 참가자에게 전달"""
+        participants = self.topology['participants']
+        total_turns = self.topology['turns']
+        count = len(participants)
+        rounds = -(-total_turns // count)
+        
+        if resume:
+            # 받은 응답을 아직 전달하지 못했으면 전달부터
+            if conversations and not resume['delivered'] and len(conversations) < total_turns:
+                sender, response = conversations[-1]
+                receiver = participants[len(conversations) % count]
+                if not self.forward_response(sender, receiver, response):
+                    return False
+                self.save_checkpoint(prompt_idx, conversations, delivered=True)
+        else:
+            # 1. 첫 참가자에게 초기 프롬프트 전송
+            print(f"【1단계】 {participants[0]}에 초기 프롬프트 전송")
+            if not self.send_message(participants[0], prompt):
                 return False
+            self.record_turn(prompt_idx, 0, "User", prompt)
+            self.save_checkpoint(prompt_idx, conversations, delivered=True)
+        
+        # 2. 차례로 응답 받고 다음 참가자에게 전달
+        for turn in range(len(conversations), total_turns):
+            speaker = participants[turn % count]
+            receiver = participants[(turn + 1) % count]
+            self.phases.context = {'prompt': prompt_idx + 1, 'turn': turn + 1}
+            if turn % count == 0:
+                print(f"\n{'─'*50}")
+                print(f"🔄 왕복 대화 {turn // count + 1}/{rounds}")
+                print(f"{'─'*50}\n")
             
-            # Claude 응답 받기
-            print("【Claude → GPT】 Claude 응답 대기")
-            claude_response = self.wait_for_response_complete(self.claude_driver, "Claude")
-            if not claude_response:
-                print("❌ Claude 응답 받기 실패")
+            # 응답 받기 (그동안 받을 쪽 입력창 준비)
+            print(f"【{speaker} → {receiver}】 {speaker} 응답 대기")
+            if turn < total_turns - 1:
+                self.start_prepare(receiver)
+            # 재개 직후 첫 차례는 중단 전에 보낸 메시지의 응답 (이미 화면에 있을 수 있음)
+            resumed = resume if resume and resume['delivered'] and turn == len(resume['conversations']) else None
+            response, elapsed = self.receive_response(speaker, resumed)
+            if not response:
                 return False
             
-            print(f"📥 Claude 응답 수신 완료 ({len(claude_response)}자)")
-            conversations.append(("Claude", claude_response))
+            conversations.append((speaker, response))
+            self.record_turn(prompt_idx, len(conversations), speaker, response, elapsed)
+            self.save_checkpoint(prompt_idx, conversations, delivered=False)
             
-            # 마지막 교환이면 종료
-            if exchange == 2:
-                print(f"\n✅ 프롬프트 {prompt_idx + 1} 완료!")
-                # 대화 내용 저장
-                self.save_conversation_log(prompt_idx, conversations)
+            # 마지막 발언이면 종료
+            if turn == total_turns - 1:
                 return True
             
-            # 교환 간 대기
-            print(f"⏸️ {self.delays['between_exchange']}초 대기...")
-            time.sleep(self.delays['between_exchange'])
-            
-            # GPT에 Claude 응답 전달
-            print("\n【Claude → GPT】 GPT에 Claude 응답 전달")
-            if not self.send_to_gpt(claude_response):
-                print("❌ GPT 전달 실패")
+            # 다음 참가자에게 전달
+            if not self.forward_response(speaker, receiver, response):
                 return False
+            self.save_checkpoint(prompt_idx, conversations, delivered=True)
         
         return True
     
-    def run_all_conversations(self):
-        """모든 프롬프트 순차 실행"""
+    def broadcast_message(self, conversations, participant, round_idx, prompt):
+        """방송 라운드에서 참가자 한 명에게 보낼 메시지 (첫 라운드는 프롬프트, 이후는 다른 참가자들의 직전 응답)"""
+        if round_idx == 0:
+            return prompt
+        count = len(self.topology['participants'])
+        previous = conversations[(round_idx - 1) * count:round_idx * count]
+        others = [(speaker, text) for speaker, text in previous if speaker != participant]
+        if len(others) == 1:
+            return others[0][1]
+        return "\n\n".join(f"[{speaker}]\n{text}" for speaker, text in others)
+    
+    def run_broadcast(self, prompt, prompt_idx, conversations, resume=None):
+        """라운드마다 모든 참가자에게 동시에 보내고 응답도 동시에 받음"""
+        participants = self.topology['participants']
+        total_rounds = self.topology['turns']
+        count = len(participants)
+        pool = ThreadPoolExecutor(max_workers=count)
+        
+        try:
+            for round_idx in range(len(conversations) // count, total_rounds):
+                print(f"\n{'─'*50}")
+                print(f"📢 동시 응답 라운드 {round_idx + 1}/{total_rounds} ({', '.join(participants)})")
+                print(f"{'─'*50}\n")
+                self.phases.context = {'prompt': prompt_idx + 1, 'round': round_idx + 1}
+                
+                # 재개 직후 첫 라운드가 이미 전송된 상태면 응답만 받음
+                resumed = resume if resume and resume['delivered'] and round_idx == len(resume['conversations']) // count else None
+                
+                if not resumed:
+                    if round_idx > 0 and not self.speculative:
+                        print(f"⏸️ {self.delays['between_exchange']}초 대기...")
+                        time.sleep(self.delays['between_exchange'])
+                    
+                    # 모두에게 동시에 전송
+                    messages = [self.broadcast_message(conversations, p, round_idx, prompt) for p in participants]
+                    sent = list(pool.map(self.send_message, participants, messages))
+                    if not all(sent):
+                        failed = [p for p, ok in zip(participants, sent) if not ok]
+                        print(f"❌ 전송 실패: {', '.join(failed)}")
+                        return False
+                    if round_idx == 0:
+                        self.record_turn(prompt_idx, 0, "User", prompt)
+                    self.save_checkpoint(prompt_idx, conversations, delivered=True)
+                
+                # 모든 응답을 동시에 대기 (라운드 시간 = 가장 느린 참가자)
+                started = time.time()
+                results = list(pool.map(lambda p: self.receive_response(p, resumed), participants))
+                if not all(response for response, _ in results):
+                    return False
+                print(f"⏱️ 라운드 {round_idx + 1} 완료: {time.time() - started:.1f}초 "
+                      f"(순차 실행이면 {sum(elapsed for _, elapsed in results):.1f}초)")
+                
+                for participant, (response, elapsed) in zip(participants, results):
+                    conversations.append((participant, response))
+                    self.record_turn(prompt_idx, len(conversations), participant, response, elapsed)
+                self.save_checkpoint(prompt_idx, conversations, delivered=False)
+        finally:
+            pool.shutdown(wait=False)
+        
+        return True
+    
+    def save_checkpoint(self, prompt_idx, conversations=None, delivered=True):
+        """현재 진행 상황 저장 (checkpoint_path가 None이면 저장 안 함)
+        
+        delivered: 마지막 메시지(프롬프트 또는 응답)를 상대에게 보냈는지 여부
+        """
+        if not self.checkpoint_path:
+            return
+        
+        chat_urls = {}
+        for platform, driver in self.drivers.items():
+            try:
+                self.focus(platform)
+                chat_urls[platform] = driver.current_url
+            except Exception:
+                pass
+        
+        with self.phases.phase('checkpoint'):
+            # 대화 기록이 체크포인트보다 뒤처지지 않도록 먼저 저장
+            self.store.flush()
+            save_checkpoint({
+                'run_id': self.store.run_id,
+                'prompt_idx': prompt_idx,
+                'turn': len(conversations or []),
+                'delivered': delivered,
+                'conversations': conversations or [],
+                'successful': self.successful_prompts,
+                'attempted': self.attempted_prompts,
+                'topology': self.topology,
+                'last_responses': self.last_responses,
+                'chat_urls': chat_urls,
+                'saved_at': time.strftime("%Y-%m-%d %H:%M:%S")
+            }, self.checkpoint_path)
+    
+    def restore_chats(self, state):
+        """체크포인트에 저장된 채팅 화면으로 다시 이동"""
+        for platform, url in state.get('chat_urls', {}).items():
+            driver = self.drivers.get(platform)
+            if not driver or not url:
+                continue
+            try:
+                self.focus(platform)
+                if driver.current_url != url:
+                    driver.get(url)
+                    self.locators.invalidate(platform)
+                print(f"↩️ {platform} 채팅 복귀: {url}")
+            except Exception as e:
+                print(f"⚠️ {platform} 채팅 복귀 실패: {e}")
+        time.sleep(self.delays['initial_load'])
+    
+    def wait_for_resumed_response(self, platform, resume):
+        """중단 전에 보낸 메시지의 응답 대기 (이미 끝난 응답도 인식)
+        
+        기준점이 없으므로 텍스트 안정화 방식으로 읽고, 이전 응답과 같으면 새 응답이 올 때까지 다시 확인
+        """
+        self.focus(platform)
+        previous = resume.get('last_responses', {}).get(platform)
+        deadline = time.time() + self.delays.timeout(platform)
+        while time.time() < deadline:
+            text = self.wait_for_response_polling(self.drivers[platform], platform)
+            if text and text != previous:
+                return text
+            time.sleep(self.delays['check_interval'])
+        return None
+    
+    def run_all_conversations(self, resume=None):
+        """모든 프롬프트 순차 실행 (resume: 체크포인트에서 이어서 진행)"""
         print("\n🚀 자동 대화 시작!")
-        print("📋 총 프롬프트 수:", len(self.prompts))
-        print("🔄 각 프롬프트당 3회 왕복 대화")
+        print(f"📋 총 프롬프트 수: {len(self.prompts)} (남은 프롬프트 {self.prompts.pending_count()}개, {self.prompts_file})"
+              f"{skipped_note(self.prompts)}")
+        print(f"🔄 각 프롬프트당 {self.describe_topology()}")
         print("💬 하나의 세션에서 모든 대화 진행")
-        print("💾 대화 내용은 자동으로 파일로 저장됩니다\n")
+        print(f"💾 대화 내용은 발언마다 {self.store.path}에 저장됩니다\n")
         
         self.is_running = True
-        successful_prompts = 0
+        self.successful_prompts = 0
+        self.attempted_prompts = 0
+        start_idx = 0
         
-        for idx, prompt in enumerate(self.prompts):
+        if resume:
+            # 같은 실행으로 기록을 이어가고 중단된 프롬프트부터 시작
+            self.store.run_id = resume['run_id']
+            self.topology = resume.get('topology', self.topology)
+            self.successful_prompts = resume.get('successful', 0)
+            self.attempted_prompts = resume.get('attempted', self.successful_prompts)
+            self.last_responses = dict(resume.get('last_responses', {}))
+            start_idx = resume['prompt_idx']
+            print(f"↩️ 프롬프트 {start_idx + 1}, {resume['turn']}번째 발언부터 재개")
+            self.restore_chats(resume)
+        self.check_topology()
+        
+        # 파일에서 하나씩 읽어오며 진행 (완료된 프롬프트는 건너뜀)
+        first = True
+        for idx, prompt in self.prompts:
             if not self.is_running:
                 break
+            if idx < start_idx:
+                continue
             
-            # 프롬프트 실행
-            success = self.run_single_prompt_conversation(prompt, idx)
-            
-            if success:
-                successful_prompts += 1
-                print(f"\n✅ 성공: {successful_prompts}/{idx + 1}")
-            else:
-                print(f"\n⚠️ 실패: 프롬프트 {idx + 1}")
-            
-            # 다음 프롬프트 전 대기 (마지막 제외)
-            if idx < len(self.prompts) - 1:
+            # 다음 프롬프트 전 대기 (첫 프롬프트 제외)
+            if not first:
                 print(f"\n⏸️ 다음 프롬프트까지 {self.delays['between_prompts']}초 대기...")
                 for i in range(self.delays['between_prompts'], 0, -1):
                     print(f"   {i}초...", end='\r')
                     time.sleep(1)
                 print()
+            first = False
+            
+            # 프롬프트 실행 (중단된 프롬프트는 진행된 곳부터)
+            partial = resume if resume and idx == start_idx and (resume['turn'] or resume['delivered']) else None
+            success = self.run_single_prompt_conversation(prompt, idx, resume=partial)
+            self.store.flush()
+            self.attempted_prompts += 1
+            
+            if success:
+                self.successful_prompts += 1
+                self.prompts.mark_done(idx)
+                print(f"\n✅ 성공: {self.successful_prompts}/{self.attempted_prompts}")
+            else:
+                print(f"\n⚠️ 실패: 프롬프트 {idx + 1}")
+            
+            # 다음 프롬프트부터 시작하도록 기록 (아직 보내지 않은 상태)
+            self.save_checkpoint(idx + 1, delivered=False)
         
         print(f"\n{'='*70}")
         print(f"🎊 모든 대화 완료!")
-        print(f"📊 결과: {successful_prompts}/{len(self.prompts)} 성공")
+        print(f"📊 결과: {self.successful_prompts}/{self.attempted_prompts} 성공")
+        self.print_handoff_summary()
+        self.print_command_summary()
+        self.phases.print_summary()
+        self.locators.print_summary()
+        if self.trace_file:
+            self.phases.export_trace(self.trace_file)
+        self.delays.print_summary()
+        self.delays.save()
+        if self.is_running and self.checkpoint_path:
+            clear_checkpoint(self.checkpoint_path)
         print(f"{'='*70}\n")
         
         # 브라우저는 열어둔 채로 유지
         print("💡 브라우저는 계속 열려있습니다.")
-        print("💾 대화 내용은 텍스트 파일로 저장되었습니다.")
+        print(f"💾 대화 내용은 {self.store.path}에 저장되었습니다. (python conversation_store.py stats)")
         print("🔚 프로그램을 종료하려면 Ctrl+C를 누르세요.")
     
+    def print_handoff_summary(self):
+        """교환별 전달 간격 요약 출력"""
+        gaps = [gap for _, gap in self.run_stats['handoff_gaps']]
+        if not gaps:
+            return
+        mode = "투기적" if self.speculative else "일반"
+        print(f"🔀 전달 간격 ({mode}): 평균 {sum(gaps) / len(gaps):.2f}초 / 최대 {max(gaps):.2f}초 ({len(gaps)}회)")
+    
     def stop(self):
         """프로그램 종료 (브라우저 닫기)"""
         print("\n⏹️ 프로그램 종료 중...")
         self.is_running = False
+        self.delays.save()
+        self.store.close()
+        
+        # 풀에서 빌린 브라우저는 닫지 않고 반납
+        for platform, slot in list(self.pool_slots.items()):
+            detach_chrome(self.drivers.pop(platform, None))
+            release_to_pool(self.pool_url, slot['id'], self.conversation_count)
+            print(f"✅ {platform} 브라우저 반납 ({slot['id']})")
+        self.pool_slots = {}
         
         try:
             if self.gpt_driver:
@@ -456,6 +1155,48 @@ class AIController:
 # 메인 실행
 if __name__ == "__main__":
     controller = AIController()
+    if "--lite" in sys.argv:
+        controller.launch_mode = 'lite'
+    if "--speculative" in sys.argv:
+        controller.speculative = True
+    if "--agent" in sys.argv:
+        controller.page_agent = True
+    if "--shared" in sys.argv:
+        controller.shared_profile = SHARED_PROFILE
+    # --static-delays: 학습값 없이 고정 딜레이 표(DEFAULT_DELAYS)로 실행 (비교용)
+    if "--static-delays" in sys.argv:
+        controller.delays.adaptive = False
+    
+    # --resume: 중단된 배치를 체크포인트부터 이어서 실행
+    resume = None
+    if "--resume" in sys.argv:
+        resume = load_checkpoint(controller.checkpoint_path)
+        if resume:
+            print(f"↩️ 체크포인트 발견: 프롬프트 {resume['prompt_idx'] + 1}, 발언 {resume['turn']}개 완료 ({resume['saved_at']})")
+        else:
+            print("⚠️ 체크포인트가 없어 처음부터 시작합니다")
+    for arg in sys.argv[1:]:
+        if arg.startswith("--prompts="):
+            controller.prompts_file = arg.split("=", 1)[1]
+        elif arg.startswith("--range="):
+            controller.prompt_range = parse_range(arg.split("=", 1)[1])
+        elif arg == "--fresh":
+            controller.fresh_prompts = True
+        elif arg.startswith("--mode="):
+            controller.topology['mode'] = arg.split("=", 1)[1]
+        elif arg.startswith("--turns="):
+            controller.topology['turns'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--participants="):
+            controller.topology['participants'] = arg.split("=", 1)[1].split(",")
+        elif arg == "--pool":
+            controller.pool_url = f"http://{POOL_HOST}:{POOL_PORT}"
+        elif arg.startswith("--pool="):
+            controller.pool_url = arg.split("=", 1)[1]
+        elif arg.startswith("--renderers="):
+            controller.renderer_limit = int(arg.split("=", 1)[1])
+        elif arg.startswith("--trace="):
+            controller.trace_file = arg.split("=", 1)[1] or None
+    controller.load_prompts()
     
     print("🎮 AI 자동 대화 컨트롤러 v6.1 - 최종 완성 버전")
     print("=" * 60)
@@ -482,7 +1223,7 @@ if __name__ == "__main__":
         input("\n✅ 준비가 완료되면 엔터를 눌러주세요...")
         
         # 모든 대화 실행
-        controller.run_all_conversations()
+        controller.run_all_conversations(resume=resume)
         
         # 종료 대기
         input("\n🔚 브라우저를 닫고 종료하려면 엔터를 누르세요...")
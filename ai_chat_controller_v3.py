@@ -1,6 +1,5 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,6 +9,8 @@ import os
 import json
 import re
 
+from driver_cache import get_chromedriver_path
+
 class AIController:
     def __init__(self):
         self.gpt_driver = None
@@ -56,7 +57,7 @@ class AIController:
         gpt_options.add_experimental_option('useAutomationExtension', False)
         
         self.gpt_driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(get_chromedriver_path()),
             options=gpt_options
         )
         self.gpt_driver.get("https://chatgpt.com")
@@ -70,7 +71,7 @@ class AIController:
         claude_options.add_experimental_option('useAutomationExtension', False)
         
         self.claude_driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(get_chromedriver_path()),
             options=claude_options
         )
         self.claude_driver.get("https://claude.ai/new")
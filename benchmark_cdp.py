@@ -0,0 +1,99 @@
+import asyncio
+import sys
+import time
+
+from adaptive_delays import AdaptiveDelays
+from ai_chat_controller_final import AIController
+from browser_launcher import launch_chrome
+from cdp_controller import AsyncAIController
+from mock_chat_server import start_mock_server, mock_adapters
+
+# Selenium(chromedriver 경유) vs CDP 직접 연결 비교 (가짜 채팅 서버 사용)
+#   명령 왕복: 같은 탭에서 짧은 스크립트를 반복 실행한 평균 시간
+#   동시 실행: 탭 N개에서 전송+응답 대기를 Selenium은 차례로, CDP는 이벤트 루프 하나로 동시에
+# 사용법: python benchmark_cdp.py [탭 수] [왕복 횟수]
+
+TABS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+ROUNDS = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+SETTINGS = {'chars': 300, 'speed': 1500, 'latency': 300, 'seed': 3}
+
+
+def debugger_port(driver):
+    """Selenium이 띄운 Chrome의 원격 디버깅 포트"""
+    address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+    return int(address.rsplit(":", 1)[1])
+
+
+def selenium_round_trip(driver):
+    """Selenium execute_script 평균 왕복 (ms)"""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        driver.execute_script("return document.readyState;")
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def selenium_exchanges(base_url, driver):
+    """탭마다 차례로 전송 후 응답 대기 (Selenium은 스레드 하나에 브라우저 하나씩)"""
+    controller = AIController()
+    controller.adapters = mock_adapters(base_url)
+    controller.delays = AdaptiveDelays(stats_file=None)
+    controller.drivers["GPT"] = driver
+    controller.checkpoint_path = None
+    started = time.perf_counter()
+    for i in range(TABS):
+        driver.switch_to.window(driver.window_handles[i])
+        controller.send_message("GPT", f"Selenium 메시지 {i + 1}")
+        controller.wait_for_response_complete(driver, "GPT")
+    return time.perf_counter() - started
+
+
+async def cdp_benchmark(base_url, port):
+    """CDP 왕복 시간과 탭 N개 동시 전송+대기 시간"""
+    controller = AsyncAIController(adapters=mock_adapters(base_url), delays=AdaptiveDelays(stats_file=None))
+    names = [f"tab-{i + 1}" for i in range(TABS)]
+    for name in names:
+        await controller.connect(name, "GPT", port, new_tab=True)
+        await controller.new_chat(name)
+
+    session = controller.sessions[names[0]]
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await session.evaluate("return document.readyState;")
+    round_trip = (time.perf_counter() - started) / ROUNDS * 1000
+
+    async def exchange(name):
+        await controller.send_message(name, f"CDP 메시지 {name}")
+        return await controller.wait_for_response_complete(name)
+
+    started = time.perf_counter()
+    replies = await asyncio.gather(*(exchange(name) for name in names))
+    elapsed = time.perf_counter() - started
+
+    controller.print_command_stats()
+    await controller.close()
+    return round_trip, elapsed, sum(1 for reply in replies if reply)
+
+
+if __name__ == "__main__":
+    server, base_url = start_mock_server(port=0, **SETTINGS)
+    driver = launch_chrome(launch_mode="lite")
+    try:
+        driver.get(f"{base_url}/gpt")
+        for _ in range(TABS - 1):
+            driver.switch_to.new_window('tab')
+            driver.get(f"{base_url}/gpt")
+
+        print(f"명령 왕복 측정 중... ({ROUNDS}회)")
+        selenium_ms = selenium_round_trip(driver)
+        print(f"탭 {TABS}개 전송+응답 대기 (Selenium, 차례로)...")
+        selenium_seconds = selenium_exchanges(base_url, driver)
+
+        print(f"탭 {TABS}개 전송+응답 대기 (CDP, 동시)...")
+        cdp_ms, cdp_seconds, ok = asyncio.run(cdp_benchmark(base_url, debugger_port(driver)))
+
+        print("\n=== 결과 ===")
+        print(f"명령 왕복       Selenium {selenium_ms:6.2f}ms / CDP {cdp_ms:6.2f}ms ({selenium_ms / cdp_ms:.1f}배)")
+        print(f"탭 {TABS}개 대화    Selenium {selenium_seconds:6.2f}초 / CDP {cdp_seconds:6.2f}초 (CDP 성공 {ok}/{TABS})")
+    finally:
+        driver.quit()
+        server.shutdown()
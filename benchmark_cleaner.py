@@ -0,0 +1,157 @@
+from urllib.parse import quote
+import glob
+import re
+import sys
+import time
+
+from browser_launcher import launch_chrome
+from page_scripts import MARKDOWN_JS
+from response_cleaner import UI_LABELS, clean_text
+
+# 응답 정리 함수 비교 (브라우저 없이 실행)
+#   1) 속도: 기존 replace 반복 방식 vs 미리 만든 정규식 방식
+#   2) 저장된 대화(conversation_*.txt)로 정확도 확인
+#      - 기존 방식이 지워서 남은 흔적("불려도 ." 처럼 단어가 빠진 자리) 개수
+#      - 본문 속 단어("좋아요", "Edit" 등)는 그대로 남아야 함
+#      - 버튼 문구 줄을 붙인 innerText 형태에서는 버튼 문구만 지워져야 함
+#   3) --markdown: 브라우저에서 MARKDOWN_JS 변환 결과 확인 (목록 안 코드 블록 등)
+# 사용법: python benchmark_cleaner.py [반복횟수] [--markdown]
+
+ARGS = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+ROUNDS = int(ARGS[0]) if ARGS else 200
+SIZES_KB = [1, 10, 50]
+MESSAGE_PATTERN = re.compile(r"^\[\d+\] (?:GPT|Claude):\n(.*?)\n-{10,}$", re.MULTILINE | re.DOTALL)
+
+# 단어가 지워지고 문장부호만 남은 자리
+DAMAGE_PATTERN = re.compile(r"\S \.")
+
+# 본문에 UI 문구가 들어간 문장
+INLINE_SENTENCE = " 이 방법도 좋아요. Edit 모드에서 복사 후 Share 하면 됩니다."
+
+# (응답 HTML, 기대하는 마크다운) - 코드 블록은 들여쓰기와 빈 줄이 그대로 남아야 함
+NESTED_CODE = "def f(x):\n    if x:\n\n        return 1\n"
+LATER_CODE = "class A:\n    def g(self):\n        pass\n"
+MARKDOWN_CASES = [
+    (
+        "<ol><li><p>작성</p><pre><code class='language-python'>" + NESTED_CODE + "</code></pre></li>"
+        "<li>실행</li></ol>",
+        "1. 작성\n```python\n" + NESTED_CODE + "```\n2. 실행"
+    ),
+    (
+        "<p>순서:</p><ul><li>설치<pre><code>pip install a\n\npip install b\n</code></pre></li></ul>"
+        "<p>나중 코드:</p><pre><code class='language-python'>" + LATER_CODE + "</code></pre>",
+        "순서:\n\n- 설치\n```\npip install a\n\npip install b\n```\n\n나중 코드:\n\n```python\n" + LATER_CODE + "```"
+    ),
+    (
+        "<pre><code>    들여쓴 첫 줄\n끝</code></pre><ol start='3'><li>목록</li></ol>",
+        "```\n    들여쓴 첫 줄\n끝\n```\n\n3. 목록"
+    ),
+]
+
+
+def legacy_clean(text):
+    """기존 clean_response_text (문구를 본문 어디서든 지움)"""
+    if not text:
+        return text
+    cleaned_text = text
+    for element in UI_LABELS:
+        cleaned_text = cleaned_text.replace(element, "")
+    cleaned_text = re.sub(r'\s*(재시도|복사|좋아요|싫어요)\s*$', '', cleaned_text)
+    cleaned_text = re.sub(r'^\s*(재시도|복사|좋아요|싫어요)\s*', '', cleaned_text)
+    cleaned_text = " ".join(cleaned_text.split())
+    return cleaned_text.strip()
+
+
+def with_buttons(text):
+    """실제 innerText처럼 문장 사이와 끝에 버튼 문구 줄 추가"""
+    first, dot, rest = text.partition(". ")
+    if rest:
+        text = f"{first}.\n복사\n\n{rest}"
+    return text + "\n\n복사\n재시도\n👍 👎\nEdit\n"
+
+
+def load_corpus():
+    """저장된 대화 파일에서 메시지 본문 추출"""
+    messages = []
+    for path in sorted(glob.glob("conversation_*.txt")):
+        with open(path, 'r', encoding='utf-8') as f:
+            messages.extend(m.strip() for m in MESSAGE_PATTERN.findall(f.read()))
+    return messages
+
+
+def measure(function, text):
+    """한 번 호출당 평균 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(text)
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def run_benchmark(corpus):
+    """응답 크기별 호출 비용 비교"""
+    sample = with_buttons(" ".join(corpus) or "벤치마크 문장입니다. Edit 좋아요 Copy")
+    print(f"=== 속도 (호출 한 번당, {ROUNDS}회 평균) ===")
+    for size in SIZES_KB:
+        text = (sample * (size * 1024 // len(sample) + 1))[:size * 1024]
+        old = measure(legacy_clean, text)
+        new = measure(clean_text, text)
+        print(f"{size:3d}KB  기존 {old:8.1f}µs / 정규식 {new:8.1f}µs  ({old / new:.1f}배 빠름)")
+
+
+def run_corpus_check(corpus):
+    """저장된 대화로 정확도 확인 (실패 수 반환)"""
+    print(f"\n=== 저장된 대화 확인 ({len(corpus)}개 메시지) ===")
+    failures = 0
+    legacy_failures = 0
+    damaged = 0
+
+    for i, message in enumerate(corpus):
+        damaged += len(DAMAGE_PATTERN.findall(message))
+        expected = " ".join(message.split())
+
+        # 본문 속 UI 단어는 그대로 유지 (기존 방식은 지워버림)
+        inline = message + INLINE_SENTENCE
+        if clean_text(inline) != expected + INLINE_SENTENCE:
+            failures += 1
+            print(f"❌ {i + 1}번 본문 변경: ...{clean_text(inline)[-80:]}")
+        if legacy_clean(inline) != expected + INLINE_SENTENCE:
+            legacy_failures += 1
+
+        # 버튼 문구 줄만 제거
+        result = clean_text(with_buttons(message))
+        if result != expected:
+            failures += 1
+            print(f"❌ {i + 1}번 버튼 문구 처리 오류: ...{result[-80:]}")
+
+    print(f"저장된 대화에 남은 단어 삭제 흔적: {damaged}곳")
+    print(f"기존 방식이 본문 속 UI 단어를 지운 메시지: {legacy_failures}개")
+    print(f"정규식 방식 실패: {failures}개")
+    return failures
+
+
+def run_markdown_check():
+    """MARKDOWN_JS 변환 결과 확인 (실패 수 반환)"""
+    print(f"\n=== 마크다운 변환 확인 ({len(MARKDOWN_CASES)}개) ===")
+    failures = 0
+    driver = launch_chrome(launch_mode="lite")
+    try:
+        for i, (html, expected) in enumerate(MARKDOWN_CASES):
+            driver.get("data:text/html;charset=utf-8," + quote(f"<body>{html}</body>"))
+            result = driver.execute_script(MARKDOWN_JS + "return __aiMarkdown(document.body, []);")
+            if result != expected:
+                failures += 1
+                print(f"❌ {i + 1}번 변환 오류:\n{result}\n--- 기대값 ---\n{expected}")
+    finally:
+        driver.quit()
+    print(f"마크다운 변환 실패: {failures}개")
+    return failures
+
+
+if __name__ == "__main__":
+    corpus = load_corpus()
+    run_benchmark(corpus)
+    failed = bool(corpus) and run_corpus_check(corpus)
+    if "--markdown" in sys.argv and run_markdown_check():
+        failed = True
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,66 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+import pathlib
+import time
+import sys
+
+from ai_chat_controller_final import AIController
+from driver_cache import get_chromedriver_path
+
+# 응답 완료 감지 지연 측정 (가짜 채팅 페이지 사용, 오프라인)
+# 사용법: python benchmark_completion.py [반복횟수]
+
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+PAGE = pathlib.Path(__file__).with_name("mock_chat_page.html").resolve().as_uri()
+
+
+def measure(controller, driver, platform, mode):
+    """응답 스트리밍 종료 ~ 완료 감지 사이의 지연 측정"""
+    controller.completion_mode = mode
+    lags = []
+
+    for i in range(ROUNDS):
+        message = f"벤치마크 메시지 {i + 1}"
+        controller.arm_completion_observer(driver, platform, message)
+        driver.execute_script("window.mockChat.send(arguments[0]);", message)
+
+        text = controller.wait_for_response_complete(driver, platform)
+        detected_at = time.time()
+
+        finished_at = driver.execute_script("return window.mockChat.finishedAt;")
+        if not text or not finished_at:
+            print(f"   ❌ {mode} {i + 1}회차 실패")
+            continue
+        lags.append(detected_at - finished_at / 1000)
+
+    return lags
+
+
+print("응답 완료 감지 벤치마크 시작...")
+
+options = webdriver.ChromeOptions()
+options.add_argument("--headless=new")
+
+driver = webdriver.Chrome(
+    service=Service(get_chromedriver_path()),
+    options=options
+)
+
+controller = AIController()
+results = {}
+
+try:
+    for platform in ["GPT", "Claude"]:
+        for mode in ["polling", "observer"]:
+            driver.get(f"{PAGE}?platform={platform.lower()}&chars=800&speed=400")
+            results[(platform, mode)] = measure(controller, driver, platform, mode)
+finally:
+    driver.quit()
+
+print("\n=== 결과 (스트리밍 종료 후 감지까지 걸린 시간) ===")
+for (platform, mode), lags in results.items():
+    if lags:
+        avg = sum(lags) / len(lags)
+        print(f"{platform:7s} {mode:9s} 평균 {avg:.2f}초 / 최대 {max(lags):.2f}초 ({len(lags)}회)")
+    else:
+        print(f"{platform:7s} {mode:9s} 측정 실패")
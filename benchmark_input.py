@@ -0,0 +1,106 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.keys import Keys
+import pathlib
+import time
+import sys
+
+from ai_chat_controller_final import AIController
+from driver_cache import get_chromedriver_path
+
+# 메시지 전송 시간 측정 (입력창 찾기 ~ 전송 완료)
+# 비교 대상: inject (직접 입력) / clipboard (붙여넣기) / typing (v4 한 글자씩 입력)
+# 사용법: python benchmark_input.py [반복횟수]
+
+ROUNDS = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+PAYLOADS = [100, 10000]
+TYPING_LIMIT = 1000  # 한 글자씩 입력은 너무 오래 걸려서 이 길이까지만 측정
+PAGE = pathlib.Path(__file__).with_name("mock_chat_page.html").resolve().as_uri()
+
+
+def make_payload(length):
+    """측정용 메시지 생성"""
+    text = "벤치마크 입력 테스트 payload "
+    return (text * (length // len(text) + 1))[:length]
+
+
+def type_message(controller, platform, message):
+    """v4 방식: 한 글자씩 입력 후 Enter"""
+    adapter = controller.adapters[platform]
+    driver = controller.drivers[platform]
+    input_element = adapter.find_input(driver)
+    input_element.click()
+    time.sleep(0.5)
+    input_element.send_keys(Keys.CONTROL + "a")
+    time.sleep(0.2)
+    input_element.send_keys(Keys.DELETE)
+    time.sleep(0.5)
+    for char in message:
+        input_element.send_keys(char)
+        time.sleep(controller.delays['typing'])
+    time.sleep(1)
+    input_element.send_keys(Keys.RETURN)
+    return True
+
+
+def measure(controller, driver, mode, length):
+    """전송까지 걸린 시간 목록"""
+    message = make_payload(length)
+    times = []
+
+    for _ in range(ROUNDS):
+        replies = driver.execute_script("return window.mockChat.replies;")
+        start = time.time()
+
+        if mode == "typing":
+            ok = type_message(controller, "GPT", message)
+        else:
+            controller.input_mode = mode
+            ok = controller.send_message("GPT", message)
+
+        if ok:
+            times.append(time.time() - start)
+
+        # 다음 회차 전에 가짜 응답이 끝날 때까지 대기
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            if driver.execute_script("return window.mockChat.replies;") > replies:
+                break
+            time.sleep(0.05)
+
+    return times
+
+
+print("메시지 전송 시간 벤치마크 시작...")
+
+options = webdriver.ChromeOptions()
+options.add_argument("--headless=new")
+
+driver = webdriver.Chrome(
+    service=Service(get_chromedriver_path()),
+    options=options
+)
+
+controller = AIController()
+controller.gpt_driver = driver
+controller.delays['after_send'] = 0
+results = {}
+
+try:
+    driver.get(f"{PAGE}?platform=gpt&chars=60&speed=5000&latency=50")
+    for length in PAYLOADS:
+        for mode in ["inject", "clipboard", "typing"]:
+            if mode == "typing" and length > TYPING_LIMIT:
+                continue
+            results[(mode, length)] = measure(controller, driver, mode, length)
+finally:
+    driver.quit()
+
+print("\n=== 결과 (전송 완료까지 걸린 시간) ===")
+for (mode, length), times in results.items():
+    if times:
+        avg = sum(times) / len(times)
+        print(f"{length:6d}자 {mode:9s} 평균 {avg:.3f}초 / 최소 {min(times):.3f}초 ({len(times)}회)")
+    else:
+        print(f"{length:6d}자 {mode:9s} 측정 실패")
+print(f"(typing은 {TYPING_LIMIT}자 이하만 측정)")
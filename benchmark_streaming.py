@@ -0,0 +1,78 @@
+import sys
+import time
+
+from ai_chat_controller_final import AIController
+from browser_launcher import launch_chrome
+from mock_chat_server import start_mock_server, mock_adapters
+from page_scripts import EXTRACT_MESSAGE_JS, STREAM_INSTALL_JS, STREAM_READ_JS
+
+# 긴 응답을 받는 동안 확인 한 번당 WebDriver 왕복 시간 비교 (가짜 채팅 서버 + 실제 브라우저)
+#   전체 재읽기: 마지막 응답 요소를 찾아 본문 전체를 가져옴 (폴링 방식)
+#   조각 수신: STREAM_READ_JS로 새로 덧붙은 조각만 가져옴 (스트리밍 방식)
+# 응답 길이 구간별 평균을 비교해 응답이 길어져도 조각 수신 비용이 일정한지 확인
+# 사용법: python benchmark_streaming.py [응답 크기(KB)] [구간 수]
+
+SIZE_KB = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+BUCKETS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+SETTINGS = {'chars': SIZE_KB * 1024, 'speed': 20000, 'chunk': 50, 'latency': 300, 'seed': 5}
+READ_GAP = 0.05  # 확인 사이 간격 (초)
+
+
+def measure(controller, driver, adapter, mode):
+    """응답 하나를 받는 동안 확인마다 (그때까지 받은 길이, 왕복 시간) 기록"""
+    driver.get(adapter.new_chat_url)
+    message = f"스트리밍 벤치마크 ({mode})"
+    if mode == 'delta':
+        driver.execute_script(STREAM_INSTALL_JS, adapter.response_selectors, message, True)
+    driver.execute_script("window.mockChat.send(arguments[0]);", message)
+
+    samples = []
+    offset = 0
+    received = 0
+    while not driver.execute_script("return window.mockChat.finishedAt;"):
+        started = time.perf_counter()
+        if mode == 'delta':
+            state = driver.execute_script(
+                STREAM_READ_JS, adapter.response_selectors, "", False,
+                adapter.stop_selectors, adapter.streaming_selectors, offset
+            )
+            offset = state['count']
+            received += sum(len(chunk) for chunk in state['chunks'])
+        else:
+            messages = controller.locators.find_all(driver, adapter.name, 'response', adapter.response_selectors)
+            text = driver.execute_script(EXTRACT_MESSAGE_JS, messages[-1], adapter.toolbar_selectors) if messages else ""
+            received = len(text or "")
+        samples.append((received, time.perf_counter() - started))
+        time.sleep(READ_GAP)
+    return samples
+
+
+def by_length(samples, total):
+    """응답 길이 구간별 평균 왕복 시간 (ms, 측정 없으면 None)"""
+    buckets = [[] for _ in range(BUCKETS)]
+    for length, cost in samples:
+        if length:
+            buckets[min(length * BUCKETS // total, BUCKETS - 1)].append(cost)
+    return [sum(b) / len(b) * 1000 if b else None for b in buckets]
+
+
+if __name__ == "__main__":
+    server, base_url = start_mock_server(port=0, **SETTINGS)
+    driver = launch_chrome(launch_mode="lite")
+    controller = AIController()
+    adapter = mock_adapters(base_url)["GPT"]
+    total = SETTINGS['chars']
+    try:
+        print(f"응답 {SIZE_KB}KB를 받는 동안 확인 한 번당 왕복 시간 측정...")
+        full = by_length(measure(controller, driver, adapter, 'full'), total)
+        delta = by_length(measure(controller, driver, adapter, 'delta'), total)
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    fmt = lambda v: f"{v:7.2f}ms" if v is not None else "      -  "
+    print("\n=== 결과 (응답 길이 구간별 평균 왕복 시간) ===")
+    print(f"{'받은 길이':>14s}   전체 재읽기    조각 수신")
+    for i in range(BUCKETS):
+        low, high = total * i // BUCKETS // 1024, total * (i + 1) // BUCKETS // 1024
+        print(f"{low:5d}~{high:5d}KB   {fmt(full[i])}    {fmt(delta[i])}")
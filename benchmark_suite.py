@@ -0,0 +1,158 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+from adaptive_delays import AdaptiveDelays
+from ai_chat_controller_final import AIController
+from browser_launcher import launch_chrome
+from conversation_store import ConversationStore
+from mock_chat_server import start_mock_server, mock_adapters
+
+# 가짜 채팅 서버로 컨트롤러 자체 비용 측정 (실제 사이트 접속 없음, 시드 고정으로 매번 같은 응답)
+#   발언당 오버헤드: 대화 전체 시간 - 가짜 응답 생성 시간 (전송~스트리밍 종료)
+#   처리량: 분당 발언 수
+#   전달 간격: 응답 수신 ~ 상대 전송 클릭
+#   명령 수: 발언당 WebDriver 요청 수 (--agent 유무로 비교)
+# 사용법: python benchmark_suite.py [프롬프트 수] [--save-baseline] [--tolerance=0.2]
+#                                  [--speculative] [--agent] [--completion=observer|stream|polling]
+#                                  [--static-delays]   (학습 딜레이 대신 고정 딜레이 표로 실행해 비교)
+
+BASELINE_FILE = "benchmark_baseline.json"
+SETTINGS = {'chars': 400, 'speed': 2000, 'latency': 300, 'jitter': 100, 'seed': 7}
+TURNS = 4
+
+# 지표별 좋은 방향 (True면 낮을수록 좋음)
+METRICS = {
+    'overhead_per_turn': True,
+    'handoff_avg': True,
+    'commands_per_turn': True,
+    'turns_per_minute': False
+}
+
+
+def generation_seconds(driver, since):
+    """가짜 페이지가 기록한 응답 생성 시간 합계 (since번째 전송부터)"""
+    log = driver.execute_script("return window.mockChat.log;")
+    return sum((e['finishedAt'] - e['sentAt']) / 1000 for e in log[since:] if e['finishedAt'])
+
+
+def log_length(driver):
+    """지금까지 전송된 메시지 수"""
+    return driver.execute_script("return window.mockChat.log.length;")
+
+
+def build_controller(base_url, workdir):
+    """가짜 서버를 보는 컨트롤러 (학습 통계/체크포인트/대화 기록은 실제 파일과 분리)"""
+    controller = AIController()
+    controller.adapters = mock_adapters(base_url)
+    controller.delays = AdaptiveDelays(stats_file=None, adaptive="--static-delays" not in sys.argv)
+    controller.store = ConversationStore(os.path.join(workdir, "conversations.jsonl"))
+    controller.checkpoint_path = None
+    controller.topology['turns'] = TURNS
+    controller.speculative = "--speculative" in sys.argv
+    controller.page_agent = "--agent" in sys.argv
+    for arg in sys.argv[1:]:
+        if arg.startswith("--completion="):
+            controller.completion_mode = arg.split("=", 1)[1]
+    return controller
+
+
+def run(prompt_count):
+    """프롬프트 prompt_count개를 실행하고 지표 반환"""
+    server, base_url = start_mock_server(port=0, **SETTINGS)
+    workdir = tempfile.mkdtemp(prefix="bench_")
+    controller = build_controller(base_url, workdir)
+    controller.prompts = [f"벤치마크 프롬프트 {i + 1}" for i in range(prompt_count)]
+
+    try:
+        for platform, adapter in controller.adapters.items():
+            controller.drivers[platform] = launch_chrome(launch_mode="lite")
+            controller.drivers[platform].get(adapter.new_chat_url)
+
+        walls, overheads, failures = [], [], 0
+        for idx, prompt in enumerate(controller.prompts):
+            before = {p: log_length(d) for p, d in controller.drivers.items()}
+            start = time.time()
+            ok = controller.run_single_prompt_conversation(prompt, idx)
+            wall = time.time() - start
+            if not ok:
+                failures += 1
+                continue
+
+            # relay 방식은 한 번에 한 모델만 생성하므로 생성 시간을 그대로 빼면 컨트롤러 몫
+            generation = sum(generation_seconds(d, before[p]) for p, d in controller.drivers.items())
+            walls.append(wall)
+            overheads.append((wall - generation) / TURNS)
+    finally:
+        for driver in controller.drivers.values():
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        server.shutdown()
+
+    gaps = [gap for _, gap in controller.run_stats['handoff_gaps']]
+    commands = controller.run_stats['commands_per_turn']
+    return {
+        'overhead_per_turn': sum(overheads) / len(overheads) if overheads else None,
+        'turns_per_minute': len(walls) * TURNS / sum(walls) * 60 if walls else None,
+        'handoff_avg': sum(gaps) / len(gaps) if gaps else None,
+        'handoff_max': max(gaps) if gaps else None,
+        'commands_per_turn': sum(commands) / len(commands) if commands else None,
+        'failures': failures,
+        'prompts': prompt_count,
+        'settings': SETTINGS,
+        'speculative': controller.speculative,
+        'adaptive_delays': controller.delays.adaptive,
+        'page_agent': controller.page_agent,
+        'completion_mode': controller.completion_mode
+    }
+
+
+def compare(result, baseline, tolerance):
+    """기준 결과와 비교해 나빠진 지표 목록 반환"""
+    regressions = []
+    for name, lower_is_better in METRICS.items():
+        current, previous = result.get(name), baseline.get(name)
+        if current is None or previous is None:
+            continue
+        change = (current - previous) / previous if previous else 0
+        worse = change > tolerance if lower_is_better else change < -tolerance
+        mark = "❌" if worse else "✅"
+        print(f"   {mark} {name:18s} {previous:8.3f} → {current:8.3f} ({change * 100:+.0f}%)")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    prompt_count = int(args[0]) if args else 3
+    tolerance = 0.2
+    for arg in sys.argv[1:]:
+        if arg.startswith("--tolerance="):
+            tolerance = float(arg.split("=", 1)[1])
+
+    print(f"가짜 채팅 서버 벤치마크 시작... (프롬프트 {prompt_count}개 × 발언 {TURNS}회)")
+    result = run(prompt_count)
+
+    print("\n=== 결과 ===")
+    for name in ['overhead_per_turn', 'turns_per_minute', 'handoff_avg', 'handoff_max', 'commands_per_turn']:
+        value = result[name]
+        print(f"{name:18s} {value:.3f}" if value is not None else f"{name:18s} 측정 실패")
+    print(f"실패한 프롬프트: {result['failures']}개")
+
+    if "--save-baseline" in sys.argv:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준 결과 저장: {BASELINE_FILE}")
+    elif os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n=== 기준 결과와 비교 (허용 {tolerance * 100:.0f}%) ===")
+        if compare(result, baseline, tolerance) or result['failures']:
+            print("⚠️ 성능 저하 발견")
+            sys.exit(1)
+        print("✅ 성능 저하 없음")
@@ -0,0 +1,325 @@
+import fnmatch
+import os
+import re
+import shutil
+import sys
+
+from driver_cache import get_chromedriver_path
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# selenium이 없어도 CDP 컨트롤러가 쓰는 실행 인자/프로필 함수는 import할 수 있게 함
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+except ImportError:
+    webdriver = Service = None
+
+# 저사양 모드에서 끄는 Chrome 기능
+LITE_DISABLED_FEATURES = [
+    "Translate",
+    "MediaRouter",
+    "OptimizationHints",
+    "AutofillServerCommunication",
+    "InterestFeedContentSuggestions",
+    "CalculateNativeWinOcclusion",
+    "BackForwardCache"
+]
+
+# 저사양 모드 추가 옵션 (이미지/폰트/미디어 로딩 차단, 백그라운드 기능 제거)
+LITE_ARGUMENTS = [
+    "--headless=new",
+    "--window-size=1280,900",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-remote-fonts",
+    "--autoplay-policy=user-gesture-required",
+    "--mute-audio",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-dev-shm-usage"
+]
+
+# 한 브라우저에 탭 여러 개를 띄울 때 뒤에 있는 탭의 타이머/렌더러가 느려지지 않도록 하는 옵션
+BACKGROUND_TAB_ARGUMENTS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding"
+]
+BACKGROUND_TAB_DISABLED_FEATURES = ["IntensiveWakeUpThrottling", "CalculateNativeWinOcclusion"]
+
+# 이미지/폰트/미디어 요청 자체를 막는 URL 패턴 (CDP)
+LITE_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3", "*.wav"
+]
+
+
+# 프로필 복사시 제외할 항목 (캐시, 실행 중 잠금 파일)
+PROFILE_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "DevToolsActivePort", "lockfile",
+    "Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache",
+    "DawnGraphiteCache", "DawnWebGPUCache", "GraphiteDawnCache",
+    "component_crx_cache", "extensions_crx_cache", "chrome_debug.log",
+    # 탭 복원 기록 (Chrome이 열어 둔 채 계속 덧붙이므로 복제하지 않음)
+    "Sessions"
+)
+
+# 한 번 쓰면 바뀌지 않는 파일만 원본과 하드링크로 공유 (그 외는 전부 reflink 또는 복사)
+#   LevelDB 테이블(.ldb), 맞춤법 사전(.bdic), 확장 프로그램, IndexedDB blob
+IMMUTABLE_FILE_PATTERNS = ["*.ldb", "*.bdic"]
+IMMUTABLE_DIR_PATTERNS = ["Extensions", "*.indexeddb.blob"]
+# 컴포넌트(사전, 인증서 목록 등)는 user-data-dir 바로 아래 <이름>/<버전>/ 폴더에 버전마다 새로 설치됨
+COMPONENT_VERSION = re.compile(r"^\d+(\.\d+)*$")
+FICLONE = 0x40049409  # Linux reflink ioctl
+
+
+def is_immutable_file(parts, profiles):
+    """원본과 하드링크로 공유해도 되는 파일인지 (parts: 프로필 기준 상대 경로 조각)"""
+    if any(fnmatch.fnmatch(parts[-1], pattern) for pattern in IMMUTABLE_FILE_PATTERNS):
+        return True
+    if any(fnmatch.fnmatch(part, pattern) for part in parts[:-1] for pattern in IMMUTABLE_DIR_PATTERNS):
+        return True
+    return len(parts) > 2 and parts[0] not in profiles and bool(COMPONENT_VERSION.match(parts[1]))
+
+
+def reflink_file(source, target):
+    """수정될 때만 갈라지는 복제 (Linux btrfs/xfs 등, 지원 안 하면 False)"""
+    try:
+        import fcntl
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, target)
+        return True
+    except (OSError, ImportError):
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        return False
+
+
+def clone_profile(source, target):
+    """프로필 복제 → 방식별 파일 수와 복사한 크기
+
+    캐시와 탭 복원 기록은 건너뛰고, 바뀌지 않는 파일은 하드링크, 나머지는 reflink(지원시) 또는 복사
+    """
+    stats = {'hardlink': 0, 'reflink': 0, 'copy': 0, 'copied_bytes': 0}
+    use_reflink = sys.platform.startswith("linux")  # 첫 실패 후에는 시도하지 않음
+    # 사용자 프로필 폴더 (Default, Profile 1 ...) — 컴포넌트 폴더와 구분
+    profiles = {
+        name for name in os.listdir(source)
+        if os.path.exists(os.path.join(source, name, "Preferences"))
+    }
+    for root, dirs, files in os.walk(source):
+        ignored = PROFILE_IGNORE(root, dirs + files)
+        dirs[:] = [d for d in dirs if d not in ignored]
+        relative = os.path.relpath(root, source)
+        target_root = os.path.join(target, relative)
+        os.makedirs(target_root, exist_ok=True)
+        base_parts = [] if relative == os.curdir else relative.split(os.sep)
+
+        for name in files:
+            src = os.path.join(root, name)
+            dst = os.path.join(target_root, name)
+            if name in ignored or os.path.islink(src):
+                continue
+            if is_immutable_file(base_parts + [name], profiles):
+                try:
+                    os.link(src, dst)
+                    stats['hardlink'] += 1
+                    continue
+                except OSError:
+                    pass
+            if use_reflink:
+                if reflink_file(src, dst):
+                    stats['reflink'] += 1
+                    continue
+                use_reflink = False
+            shutil.copy2(src, dst)
+            stats['copy'] += 1
+            stats['copied_bytes'] += os.path.getsize(dst)
+    return stats
+
+
+def prepare_profile_copy(source, target):
+    """프로필 사본 준비 (이미 있으면 재사용, 새로 만들 때는 clone_profile로 복제)"""
+    if os.path.exists(target):
+        return target
+
+    if os.path.exists(source):
+        clone_profile(source, target)
+    else:
+        os.makedirs(target)
+    return target
+
+
+def build_chrome_arguments(profile_dir=None, launch_mode="headed", renderer_limit=None, background_tabs=False):
+    """Chrome 명령줄 인자 목록 (드라이버 없이 직접 실행할 때도 사용)
+
+    background_tabs: 뒤에 있는 탭도 앞 탭과 같은 속도로 동작하도록 스로틀링 해제
+    """
+    arguments = []
+    disabled_features = []
+    if profile_dir:
+        arguments.append(f"--user-data-dir={os.path.join(os.getcwd(), profile_dir)}")
+    arguments.append("--disable-blink-features=AutomationControlled")
+    if launch_mode == "lite":
+        arguments.extend(LITE_ARGUMENTS)
+        disabled_features += LITE_DISABLED_FEATURES
+    if background_tabs:
+        arguments.extend(BACKGROUND_TAB_ARGUMENTS)
+        disabled_features += [f for f in BACKGROUND_TAB_DISABLED_FEATURES if f not in disabled_features]
+    # --disable-features는 마지막 하나만 적용되므로 한 번에 전달
+    if disabled_features:
+        arguments.append(f"--disable-features={','.join(disabled_features)}")
+    if renderer_limit:
+        arguments.append(f"--renderer-process-limit={renderer_limit}")
+    return arguments
+
+
+def require_selenium():
+    """WebDriver로 Chrome을 다룰 때 selenium 설치 확인"""
+    if webdriver is None:
+        raise RuntimeError("selenium 패키지가 필요합니다 (pip install selenium)")
+
+
+def build_chrome_options(profile_dir=None, launch_mode="headed", renderer_limit=None, background_tabs=False):
+    """Chrome 옵션 생성
+
+    launch_mode: 'headed' (기존 창 모드) 또는 'lite' (헤드리스 + 리소스 절약)
+    renderer_limit: 렌더러 프로세스 최대 수 (None이면 Chrome 기본값)
+    background_tabs: 탭 여러 개를 동시에 쓸 때 뒤 탭 스로틀링 해제
+    """
+    require_selenium()
+    options = webdriver.ChromeOptions()
+    for argument in build_chrome_arguments(profile_dir, launch_mode, renderer_limit, background_tabs):
+        options.add_argument(argument)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    if launch_mode == "lite":
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+
+    return options
+
+
+def launch_chrome(profile_dir=None, launch_mode="headed", renderer_limit=None, background_tabs=False):
+    """Chrome 실행 후 드라이버 반환"""
+    require_selenium()
+    driver = webdriver.Chrome(
+        service=Service(get_chromedriver_path()),
+        options=build_chrome_options(profile_dir, launch_mode, renderer_limit, background_tabs)
+    )
+
+    if launch_mode == "lite":
+        apply_lite_settings(driver)
+
+    return driver
+
+
+def attach_chrome(port, launch_mode="headed", pid=None):
+    """원격 디버깅 포트로 이미 실행 중인 Chrome에 연결 (pid: 풀이 기록한 Chrome 프로세스 번호)"""
+    require_selenium()
+    options = webdriver.ChromeOptions()
+    options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+    driver = webdriver.Chrome(
+        service=Service(get_chromedriver_path()),
+        options=options
+    )
+    # chromedriver가 띄운 브라우저가 아니므로 메모리 측정시 Chrome 프로세스를 따로 찾음
+    driver.attached_port = port
+    driver.browser_pid = pid
+
+    if launch_mode == "lite":
+        apply_lite_settings(driver)
+
+    return driver
+
+
+def detach_chrome(driver):
+    """브라우저는 그대로 두고 드라이버 연결만 종료"""
+    try:
+        driver.service.stop()
+    except Exception:
+        pass
+
+
+def apply_lite_settings(driver):
+    """헤드리스 표시 제거 및 무거운 리소스 요청 차단"""
+    try:
+        # 헤드리스 User-Agent는 사이트에서 차단될 수 있어 일반 Chrome으로 표시
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+            "userAgent": user_agent.replace("HeadlessChrome", "Chrome")
+        })
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LITE_BLOCKED_URLS})
+    except Exception as e:
+        print(f"⚠️ 저사양 모드 설정 실패: {e}")
+
+
+def keep_tab_active(driver):
+    """현재 탭이 뒤에 있어도 포커스/활성 상태로 동작하게 함 (CDP 설정은 탭마다 따로 적용)"""
+    try:
+        driver.execute_cdp_cmd("Emulation.setFocusEmulationEnabled", {"enabled": True})
+        driver.execute_cdp_cmd("Page.setWebLifecycleState", {"state": "active"})
+    except Exception as e:
+        print(f"⚠️ 탭 활성 유지 설정 실패: {e}")
+
+
+def find_browser_process(port, pid=None):
+    """원격 디버깅 포트로 실행 중인 Chrome 브라우저 프로세스 (못 찾으면 None)"""
+    flag = f"--remote-debugging-port={port}"
+    if pid:
+        try:
+            process = psutil.Process(pid)
+            if flag in process.cmdline():
+                return process
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    for process in psutil.process_iter(['cmdline']):
+        cmdline = process.info['cmdline'] or []
+        # 렌더러/GPU 등 하위 프로세스(--type=...)는 제외
+        if flag in cmdline and not any(arg.startswith("--type=") for arg in cmdline):
+            return process
+    return None
+
+
+def get_driver_rss(driver):
+    """드라이버의 Chrome 프로세스 전체의 메모리(RSS, MB) 합계 (psutil이 없거나 측정할 수 없으면 None)
+
+    풀에 연결한 브라우저는 chromedriver의 하위 프로세스가 아니므로 디버깅 포트로 Chrome을 찾음
+    """
+    if psutil is None or driver is None:
+        return None
+    try:
+        port = getattr(driver, 'attached_port', None)
+        if port:
+            root = find_browser_process(port, getattr(driver, 'browser_pid', None))
+            if root is None:
+                return None
+        else:
+            root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / (1024 * 1024)
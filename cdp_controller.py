@@ -0,0 +1,451 @@
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+import asyncio
+import itertools
+import json
+import sys
+import time
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+from adaptive_delays import AdaptiveDelays
+from conversation_store import ConversationStore
+from driver_pool import acquire_from_pool, release_to_pool, POOL_HOST, POOL_PORT
+from page_scripts import (
+    OBSERVER_INSTALL_JS, ARM_OBSERVER_JS, WAIT_COMPLETION_JS,
+    INJECT_MESSAGE_JS, PREPARE_INPUT_JS, INPUT_EMPTY_JS
+)
+from platform_adapters import css_selectors, default_adapters
+from prompt_source import open_prompt_source, parse_range, skipped_note
+
+# chromedriver를 거치지 않고 Chrome 원격 디버깅 포트의 DevTools 프로토콜(CDP)로 직접 조작
+# 요소 참조를 주고받지 않고 셀렉터로 페이지 안에서 찾기+입력, 기준점+전송 버튼 클릭을 한 번의 요청으로 처리
+# Chrome은 --remote-debugging-port로 띄워 두거나 드라이버 풀에서 빌림
+
+# 입력창을 페이지 안에서 찾아 el에 담음 (보이고 비활성이 아닌 첫 요소, 없으면 null 반환)
+FIND_INPUT_JS = """
+var __selectors = arguments[0], el = null;
+for (var i = 0; i < __selectors.length && !el; i++) {
+    var nodes = [];
+    try { nodes = document.querySelectorAll(__selectors[i]); } catch (e) {}
+    for (var j = 0; j < nodes.length; j++) {
+        if (nodes[j].getClientRects().length && !nodes[j].disabled) { el = nodes[j]; break; }
+    }
+}
+if (!el) return null;
+"""
+
+# 전송 직전 기준점 기록 후 전송 버튼 클릭 → {submitted: 클릭 여부, baseline: 전송 직전 마지막 응답}
+# 버튼이 없거나 비활성이면 submitted가 false → Enter 입력
+ARM_AND_SUBMIT_JS = ARM_OBSERVER_JS + """
+var buttons = arguments[2], toolbar = arguments[3];
+var previous = __aiLatest(arguments[0]);
+var baseline = {count: previous.count, text: __aiMarkdown(previous.node, toolbar)};
+var submitted = false;
+for (var i = 0; i < buttons.length; i++) {
+    var button = null;
+    try { button = document.querySelector(buttons[i]); } catch (e) {}
+    if (button) {
+        if (!button.disabled) {
+            button.click();
+            submitted = true;
+        }
+        break;
+    }
+}
+return {submitted: submitted, baseline: baseline};
+"""
+
+# 가장 최근 응답 본문 (마크다운)
+READ_LATEST_JS = OBSERVER_INSTALL_JS + """
+return __aiMarkdown(__aiLatest(arguments[0]).node, arguments[1]);
+"""
+
+
+def with_input(body):
+    """요소를 arguments[0]으로 받는 스크립트를 입력창 셀렉터 목록으로 실행하도록 감쌈"""
+    return FIND_INPUT_JS + (
+        "return (function () {\n" + body + "\n}).apply(null, [el].concat(Array.prototype.slice.call(arguments, 1)));"
+    )
+
+
+INJECT_INPUT_JS = with_input(INJECT_MESSAGE_JS)
+PREPARE_INPUT_CDP_JS = with_input(PREPARE_INPUT_JS + "\nreturn true;")
+INPUT_EMPTY_CDP_JS = with_input(INPUT_EMPTY_JS)
+
+
+def script_call(body, args, async_callback=False):
+    """Selenium 방식 스크립트(arguments[n], 비동기는 마지막 인자가 콜백)를 CDP 식으로 변환"""
+    payload = json.dumps(list(args), ensure_ascii=False)
+    if async_callback:
+        return ("new Promise(function (__resolve) {\n(function () {\n" + body +
+                f"\n}}).apply(null, {payload}.concat([__resolve]));\n}})")
+    return "(function () {\n" + body + f"\n}}).apply(null, {payload})"
+
+
+def list_page_targets(port, host="127.0.0.1"):
+    """원격 디버깅 포트에 열린 탭 목록"""
+    with urlopen(f"http://{host}:{port}/json/list", timeout=5) as response:
+        targets = json.loads(response.read().decode('utf-8'))
+    return [t for t in targets if t.get('type') == 'page' and t.get('webSocketDebuggerUrl')]
+
+
+def open_page_target(port, url="about:blank", host="127.0.0.1"):
+    """새 탭 열기"""
+    request = Request(f"http://{host}:{port}/json/new?{quote(url, safe='')}", method="PUT")
+    with urlopen(request, timeout=5) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+class CDPSession:
+    """Chrome 탭 하나와의 DevTools 연결 (웹소켓 하나로 명령과 이벤트를 주고받음)"""
+
+    def __init__(self, name, ws_url):
+        self.name = name
+        self.ws_url = ws_url
+        self.ws = None
+        self.reader = None
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.listeners = {}  # 이벤트 이름 → 콜백 목록
+        self.commands = 0
+        self.command_seconds = 0.0
+
+    async def connect(self):
+        """웹소켓 연결 후 응답/이벤트 수신 시작"""
+        if websockets is None:
+            raise RuntimeError("websockets 패키지가 필요합니다 (pip install websockets)")
+        self.ws = await websockets.connect(self.ws_url, max_size=None, ping_interval=None)
+        self.reader = asyncio.create_task(self.read_loop())
+        return self
+
+    async def read_loop(self):
+        """받은 메시지를 기다리는 명령이나 이벤트 콜백에 전달"""
+        try:
+            async for raw in self.ws:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self.pending.pop(message['id'], None)
+                    if future is None or future.done():
+                        continue
+                    if 'error' in message:
+                        future.set_exception(RuntimeError(f"{self.name}: {message['error'].get('message')}"))
+                    else:
+                        future.set_result(message.get('result', {}))
+                else:
+                    for callback in list(self.listeners.get(message.get('method'), [])):
+                        callback(message.get('params', {}))
+        except Exception as e:
+            print(f"⚠️ {self.name} 연결 끊김: {e}")
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"{self.name} 연결이 끊어졌습니다"))
+            self.pending.clear()
+
+    async def send(self, method, timeout=30, **params):
+        """명령 전송 후 결과 대기"""
+        command_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[command_id] = future
+        started = time.perf_counter()
+        try:
+            await self.ws.send(json.dumps({'id': command_id, 'method': method, 'params': params}))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(command_id, None)
+            self.commands += 1
+            self.command_seconds += time.perf_counter() - started
+
+    async def evaluate(self, body, *args, timeout=30, async_callback=False):
+        """Selenium 방식 스크립트 실행 후 값 반환 (비동기 스크립트는 콜백이 불릴 때까지 대기)"""
+        result = await self.send(
+            'Runtime.evaluate', timeout=timeout,
+            expression=script_call(body, args, async_callback),
+            returnByValue=True, awaitPromise=True, userGesture=True
+        )
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise RuntimeError(details.get('exception', {}).get('description') or details.get('text'))
+        return result.get('result', {}).get('value')
+
+    async def navigate(self, url, timeout=30):
+        """페이지 이동 후 load 이벤트까지 대기"""
+        loaded = asyncio.get_running_loop().create_future()
+
+        def on_load(params):
+            if not loaded.done():
+                loaded.set_result(True)
+
+        self.listeners.setdefault('Page.loadEventFired', []).append(on_load)
+        try:
+            await self.send('Page.enable')
+            await self.send('Page.navigate', url=url)
+            await asyncio.wait_for(loaded, timeout)
+        finally:
+            self.listeners['Page.loadEventFired'].remove(on_load)
+
+    async def insert_text(self, text):
+        """포커스된 입력창에 키보드 입력처럼 텍스트 삽입"""
+        await self.send('Input.insertText', text=text)
+
+    async def press_enter(self):
+        """Enter 키 입력"""
+        await self.send('Input.dispatchKeyEvent', type='keyDown', key='Enter', code='Enter',
+                        windowsVirtualKeyCode=13, text='\r')
+        await self.send('Input.dispatchKeyEvent', type='keyUp', key='Enter', code='Enter',
+                        windowsVirtualKeyCode=13)
+
+    async def close(self):
+        """연결 종료 (탭은 닫지 않음)"""
+        if self.ws:
+            await self.ws.close()
+        if self.reader:
+            await asyncio.gather(self.reader, return_exceptions=True)
+
+
+class AsyncAIController:
+    """이벤트 루프 하나로 여러 브라우저 세션을 동시에 조작하는 CDP 컨트롤러
+
+    세션 이름마다 플랫폼과 탭 연결을 가지며, AIController의 send_to_gpt / send_to_claude /
+    wait_for_response_complete에 대응하는 awaitable을 제공한다.
+    """
+
+    def __init__(self, adapters=None, delays=None):
+        self.adapters = adapters or default_adapters()
+        self.delays = delays or AdaptiveDelays()
+        self.sessions = {}  # 세션 이름 → CDPSession
+        self.platforms = {}  # 세션 이름 → 플랫폼
+        self.baselines = {}  # 세션 이름 → 전송 직전 마지막 응답 (시간 초과시 이전 응답을 쓰지 않도록)
+
+    async def connect(self, name, platform, port, host="127.0.0.1", new_tab=False):
+        """원격 디버깅 포트의 탭에 연결 (new_tab이면 새 탭을 열어서 연결)"""
+        targets = [] if new_tab else await asyncio.to_thread(list_page_targets, port, host)
+        target = targets[0] if targets else await asyncio.to_thread(open_page_target, port, "about:blank", host)
+        session = await CDPSession(name, target['webSocketDebuggerUrl']).connect()
+        self.sessions[name] = session
+        self.platforms[name] = platform
+        return session
+
+    async def new_chat(self, name):
+        """새 채팅 화면으로 이동"""
+        await self.sessions[name].navigate(self.adapters[self.platforms[name]].new_chat_url)
+
+    async def input_cleared(self, session, selectors):
+        """after_send 안에 입력창이 비워지는지 (입력창이 사라져도 전송된 것으로 봄)"""
+        deadline = time.time() + self.delays['after_send']
+        while True:
+            if await session.evaluate(INPUT_EMPTY_CDP_JS, selectors) is not False:
+                return True
+            if time.time() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+
+    async def send_message(self, name, message):
+        """메시지 입력 후 전송 (입력창 찾기+입력, 기준점+전송이 각각 요청 한 번)"""
+        session = self.sessions[name]
+        adapter = self.adapters[self.platforms[name]]
+        selectors = css_selectors(adapter.input_selectors)
+        try:
+            # 입력창이 나타날 때까지 페이지 안에서 찾기와 입력을 함께 시도
+            deadline = time.time() + adapter.input_timeout
+            injected = await session.evaluate(INJECT_INPUT_JS, selectors, message)
+            while injected is None:
+                if time.time() >= deadline:
+                    print(f"❌ {name} 입력창을 찾을 수 없습니다")
+                    return False
+                await asyncio.sleep(0.2)
+                injected = await session.evaluate(INJECT_INPUT_JS, selectors, message)
+
+            # 직접 입력이 확인되지 않으면 비운 뒤 키보드 입력처럼 삽입
+            if not injected:
+                await session.evaluate(PREPARE_INPUT_CDP_JS, selectors)
+                await session.insert_text(message)
+
+            result = await session.evaluate(ARM_AND_SUBMIT_JS, adapter.response_selectors, message,
+                                            adapter.submit_selectors, adapter.toolbar_selectors)
+            self.baselines[name] = result['baseline']
+            if not result['submitted']:
+                await session.press_enter()
+
+            # 입력창이 비워져야 전송된 것 (버튼 클릭이 먹지 않았으면 Enter로 한 번 더 시도)
+            if not await self.input_cleared(session, selectors):
+                if result['submitted']:
+                    await session.press_enter()
+                if not await self.input_cleared(session, selectors):
+                    print(f"❌ {name} 전송 확인 실패: 입력창이 비워지지 않았습니다")
+                    return False
+
+            print(f"✅ {name} 전송 완료! ({message[:40]}...)")
+            return True
+        except Exception as e:
+            print(f"❌ {name} 전송 실패: {e}")
+            return False
+
+    async def send_to_gpt(self, message):
+        """GPT 세션에 메시지 전송"""
+        return await self.send_message("GPT", message)
+
+    async def send_to_claude(self, message):
+        """Claude 세션에 메시지 전송"""
+        return await self.send_message("Claude", message)
+
+    async def read_latest(self, name):
+        """가장 최근 응답 본문"""
+        adapter = self.adapters[self.platforms[name]]
+        return await self.sessions[name].evaluate(READ_LATEST_JS, adapter.response_selectors, adapter.toolbar_selectors)
+
+    async def wait_for_response_complete(self, name):
+        """MutationObserver 신호로 응답 완료 대기 (브라우저 안에서 기다리므로 대기 중 요청 없음)"""
+        platform = self.platforms[name]
+        adapter = self.adapters[platform]
+        max_wait = self.delays.timeout(platform)
+        try:
+            result = await self.sessions[name].evaluate(
+                WAIT_COMPLETION_JS,
+                adapter.response_selectors,
+                adapter.stop_selectors,
+                adapter.streaming_selectors,
+                int(self.delays['quiet_period'] * 1000),
+                int(self.delays['settle'] * 1000),
+                50,
+                int(max_wait * 1000),
+                adapter.toolbar_selectors,
+                timeout=max_wait + 5,
+                async_callback=True
+            )
+        except Exception as e:
+            print(f"   ⚠️ {name} 옵저버 대기 실패: {e}")
+            result = None
+
+        if result and result.get('status') == 'complete':
+            text = result.get('text') or ''
+            first_ms = result.get('firstMs')
+            self.delays.record(platform, first_ms / 1000 if first_ms is not None else None,
+                               result.get('totalMs', 0) / 1000, len(text))
+            return text
+
+        # 시간 초과/실패시 현재까지의 응답 사용 (전송 전부터 있던 응답은 제외)
+        text = (result or {}).get('text') or await self.read_latest(name)
+        baseline = self.baselines.get(name)
+        if baseline and text == baseline['text']:
+            text = None
+        if text and len(text) > 50:
+            print(f"⚠️ {name} 시간 초과, 현재까지 받은 응답 사용 ({len(text)}자)")
+            return text
+        print(f"❌ {name} 응답을 받지 못했습니다")
+        return None
+
+    async def run_relay(self, names, prompt, turns, store=None, prompt_id=None):
+        """세션 순서대로 돌아가며 직전 응답을 다음 세션에 전달 → [(세션, 응답), ...] (실패시 None)"""
+        conversations = []
+        if not await self.send_message(names[0], prompt):
+            return None
+        if store:
+            store.append(prompt_id, 0, "User", prompt)
+
+        for turn in range(turns):
+            speaker = names[turn % len(names)]
+            started = time.time()
+            response = await self.wait_for_response_complete(speaker)
+            if not response:
+                return None
+            conversations.append((speaker, response))
+            if store:
+                store.append(prompt_id, turn + 1, self.platforms[speaker], response, time.time() - started)
+            if turn < turns - 1 and not await self.send_message(names[(turn + 1) % len(names)], response):
+                return None
+        return conversations
+
+    def print_command_stats(self):
+        """세션별 CDP 명령 수와 평균 왕복 시간"""
+        for name, session in self.sessions.items():
+            if session.commands:
+                print(f"   {name}: 명령 {session.commands}회, 평균 {session.command_seconds / session.commands * 1000:.1f}ms")
+
+    async def close(self):
+        """모든 세션 연결 종료"""
+        await asyncio.gather(*(session.close() for session in self.sessions.values()), return_exceptions=True)
+
+
+async def run_pairs(controller, pairs, prompts, turns, store):
+    """브라우저 쌍마다 작업자 하나씩 두고 프롬프트를 차례로 꺼내 동시에 실행 → 쌍별 처리한 대화 수"""
+    jobs = iter(prompts)  # 루프 하나에서만 꺼내므로 잠금 불필요
+    results = {'success': 0, 'failed': 0}
+    handled = {}
+
+    async def worker(names):
+        handled[names[0]] = 0
+        for idx, prompt in jobs:
+            print(f"🎯 [{names[0]}] 프롬프트 {idx + 1}: {prompt[:40]}")
+            for name in names:
+                await controller.new_chat(name)
+            if await controller.run_relay(names, prompt, turns, store, idx + 1):
+                results['success'] += 1
+                prompts.mark_done(idx)
+            else:
+                results['failed'] += 1
+            handled[names[0]] += 1
+            store.flush()
+
+    await asyncio.gather(*(worker(names) for names in pairs))
+    print(f"\n📊 결과: 성공 {results['success']} / 실패 {results['failed']}")
+    return handled
+
+
+async def main(args):
+    """--ports=GPT:9222,Claude:9223 (직접 띄운 Chrome) 또는 --pool[=주소] --pairs=N (드라이버 풀)"""
+    options = dict(arg[2:].split("=", 1) if "=" in arg else (arg[2:], "") for arg in args if arg.startswith("--"))
+    turns = int(options.get("turns") or 6)
+    prompts = open_prompt_source(options.get("prompts") or "prompts.json",
+                                 *parse_range(options.get("range") or "0:"), fresh="fresh" in options)
+    controller = AsyncAIController()
+    store = ConversationStore()
+    pool_url = None
+    slots = []  # (쌍 대표 세션 이름, 슬롯)
+    pairs = []
+    handled = {}
+
+    try:
+        if "pool" in options:
+            pool_url = options["pool"] or f"http://{POOL_HOST}:{POOL_PORT}"
+            for i in range(int(options.get("pairs") or 1)):
+                names = []
+                for platform in ("GPT", "Claude"):
+                    slot = await asyncio.to_thread(acquire_from_pool, pool_url, platform)
+                    if not slot:
+                        raise RuntimeError(f"{platform} 브라우저를 풀에서 빌리지 못했습니다")
+                    slots.append((f"GPT-{i + 1}", slot))
+                    name = f"{platform}-{i + 1}"
+                    await controller.connect(name, platform, slot['port'])
+                    names.append(name)
+                pairs.append(names)
+        else:
+            names = []
+            for entry in (options.get("ports") or "GPT:9222,Claude:9223").split(","):
+                platform, port = entry.split(":")
+                await controller.connect(platform, platform, int(port))
+                names.append(platform)
+            pairs.append(names)
+
+        print(f"🔌 CDP 연결 완료: {len(controller.sessions)}개 세션, 쌍 {len(pairs)}개{skipped_note(prompts)}")
+        started = time.time()
+        handled = await run_pairs(controller, pairs, prompts, turns, store)
+        print(f"⏱️ 전체 {time.time() - started:.1f}초")
+        controller.print_command_stats()
+        controller.delays.print_summary()
+        controller.delays.save()
+    finally:
+        store.close()
+        await controller.close()
+        for owner, slot in slots:
+            await asyncio.to_thread(release_to_pool, pool_url, slot['id'], handled.get(owner, 0))
+
+
+# 사용법: python cdp_controller.py [--ports=GPT:9222,Claude:9223 | --pool[=주소] --pairs=4]
+#                                [--prompts=파일] [--range=0:100] [--fresh] [--turns=6]
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1:]))
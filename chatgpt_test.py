@@ -1,11 +1,12 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
 
+from driver_cache import get_chromedriver_path
+
 print("ChatGPT 테스트 시작...")
 
 # Chrome 옵션 설정 (봇 감지 회피)
@@ -17,7 +18,7 @@ options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) Apple
 
 # 브라우저 실행
 driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
+    service=Service(get_chromedriver_path()),
     options=options
 )
 
@@ -1,10 +1,11 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 import time
 import os
 
+from driver_cache import get_chromedriver_path
+
 print("독립된 Chrome 프로필로 ChatGPT 접속...")
 
 # 독립 프로필 폴더 생성
@@ -23,7 +24,7 @@ options.add_experimental_option("excludeSwitches", ["enable-automation"])
 
 # 브라우저 실행
 driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
+    service=Service(get_chromedriver_path()),
     options=options
 )
 
@@ -0,0 +1,38 @@
+import json
+import os
+
+# 진행 상황 파일 (발언/전달이 끝날 때마다 덮어씀)
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+def save_checkpoint(state, path=CHECKPOINT_FILE):
+    """진행 상황 저장 (임시 파일에 쓴 뒤 교체해서 중간에 죽어도 깨지지 않음)"""
+    temp = path + ".tmp"
+    try:
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    except Exception as e:
+        print(f"⚠️ 체크포인트 저장 실패: {e}")
+
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    """저장된 진행 상황 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ 체크포인트 읽기 실패: {e}")
+        return None
+
+
+def clear_checkpoint(path=CHECKPOINT_FILE):
+    """배치가 끝나면 진행 상황 삭제"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -1,11 +1,12 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 import time
 import os
 
+from driver_cache import get_chromedriver_path
+
 print("Claude 자동화 테스트 시작...")
 
 # Claude용 별도 프로필 생성
@@ -22,7 +23,7 @@ options.add_experimental_option("excludeSwitches", ["enable-automation"])
 
 # 브라우저 실행
 driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
+    service=Service(get_chromedriver_path()),
     options=options
 )
 
@@ -0,0 +1,174 @@
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+# 대화 기록 파일 (한 줄에 발언 하나, 덧붙이기만 함)
+STORE_FILE = "conversations.jsonl"
+
+# 기존 텍스트 로그 형식
+TEXT_LOG_PATTERN = "conversation_*.txt"
+TEXT_LOG_NAME = re.compile(r"conversation_(\d{8}_\d{6})_prompt(\d+)\.txt$")
+TEXT_LOG_HEADER = re.compile(r"^프롬프트 \d+: (.*)$", re.MULTILINE)
+TEXT_LOG_TURN = re.compile(r"^\[(\d+)\] (\S+):\n(.*?)\n-{10,}$", re.MULTILINE | re.DOTALL)
+
+# 필드 순서 고정 (검색시 json 파싱 전에 문자열로 먼저 거름)
+FIELDS = ["run_id", "prompt_id", "turn", "speaker", "chars", "wait_seconds", "at", "text"]
+
+
+def encode(record):
+    """기록 한 줄 (필드 순서, 구분자 고정)"""
+    return json.dumps({k: record.get(k) for k in FIELDS}, ensure_ascii=False, separators=(",", ":"))
+
+
+class ConversationStore:
+    """발언이 끝날 때마다 JSONL 파일에 덧붙이는 대화 저장소
+
+    append는 일정 개수/시간마다 모아서 기록한다 (다음 append 때 확인).
+    바로 남겨야 하는 기록은 append 후 flush를 호출 (컨트롤러는 응답마다 호출)
+    """
+
+    def __init__(self, path=STORE_FILE, batch_size=8, flush_interval=5.0, run_id=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.run_id = run_id or time.strftime("%Y%m%d_%H%M%S") + f"_{os.getpid()}"
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.oldest = None
+
+    def append(self, prompt_id, turn, speaker, text, wait_seconds=None):
+        """발언 하나 추가 (turn 0은 프롬프트)"""
+        record = {
+            'run_id': self.run_id,
+            'prompt_id': prompt_id,
+            'turn': turn,
+            'speaker': speaker,
+            'chars': len(text or ""),
+            'wait_seconds': round(wait_seconds, 3) if wait_seconds is not None else None,
+            'at': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'text': text
+        }
+        with self.lock:
+            self.buffer.append(encode(record))
+            if self.oldest is None:
+                self.oldest = time.time()
+            due = len(self.buffer) >= self.batch_size or time.time() - self.oldest >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """모아둔 기록을 파일에 한 번에 덧붙임"""
+        with self.lock:
+            if not self.buffer:
+                return
+            lines, self.buffer, self.oldest = self.buffer, [], None
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                # 기록 실패시 다음 flush에서 다시 시도
+                self.buffer = lines + self.buffer
+                print(f"⚠️ 대화 기록 저장 실패: {e}")
+
+    def close(self):
+        """남은 기록 저장"""
+        self.flush()
+
+
+def iter_records(path=STORE_FILE, **filters):
+    """조건에 맞는 기록 읽기 (예: iter_records(speaker="GPT", prompt_id=3))"""
+    # 필드 순서가 고정이라 json 파싱 전에 부분 문자열로 먼저 거를 수 있음
+    needles = [f'"{k}":' + json.dumps(v, ensure_ascii=False) for k, v in filters.items()]
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if not all(needle in line for needle in needles):
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 기록 도중 끊긴 마지막 줄
+                continue
+            if all(record.get(k) == v for k, v in filters.items()):
+                yield record
+
+
+def summarize(path=STORE_FILE, **filters):
+    """발언자별 횟수, 평균 글자 수, 평균 대기 시간"""
+    stats = {}
+    runs = set()
+    for record in iter_records(path, **filters):
+        runs.add(record['run_id'])
+        entry = stats.setdefault(record['speaker'], {'count': 0, 'chars': 0, 'waits': []})
+        entry['count'] += 1
+        entry['chars'] += record['chars']
+        if record['wait_seconds'] is not None:
+            entry['waits'].append(record['wait_seconds'])
+    return runs, stats
+
+
+def import_text_logs(pattern=TEXT_LOG_PATTERN, path=STORE_FILE):
+    """기존 conversation_*.txt 파일을 저장소로 가져오기 (이미 가져온 파일은 건너뜀)"""
+    imported = {record['run_id'] for record in iter_records(path, turn=0)}
+    count = 0
+
+    for filename in sorted(glob.glob(pattern)):
+        match = TEXT_LOG_NAME.search(filename)
+        if not match:
+            continue
+        run_id = f"import_{match.group(1)}"
+        if run_id in imported:
+            continue
+
+        with open(filename, 'r', encoding='utf-8') as f:
+            content = f.read()
+        header = TEXT_LOG_HEADER.search(content)
+
+        # 파일 하나를 한 번에 기록
+        store = ConversationStore(path, batch_size=sys.maxsize, flush_interval=float("inf"), run_id=run_id)
+        prompt_id = int(match.group(2))
+        store.append(prompt_id, 0, "User", header.group(1) if header else "")
+        for turn, speaker, text in TEXT_LOG_TURN.findall(content):
+            store.append(prompt_id, int(turn), speaker, text.strip())
+        store.close()
+
+        imported.add(run_id)
+        count += 1
+        print(f"📥 {filename} → {run_id}")
+
+    print(f"✅ {count}개 파일 가져오기 완료 ({path})")
+    return count
+
+
+# 사용법:
+#   python conversation_store.py import          기존 텍스트 로그 가져오기
+#   python conversation_store.py stats [발언자]  발언자별 통계
+#   python conversation_store.py show <run_id>   실행 하나의 대화 출력
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+
+    if command == "import":
+        import_text_logs()
+    elif command == "stats":
+        filters = {'speaker': sys.argv[2]} if len(sys.argv) > 2 else {}
+        start = time.time()
+        runs, stats = summarize(**filters)
+        print(f"📊 실행 {len(runs)}개 ({time.time() - start:.2f}초)")
+        for speaker, entry in stats.items():
+            waits = entry['waits']
+            avg_wait = f"{sum(waits) / len(waits):.1f}초" if waits else "-"
+            print(f"   {speaker:7s} {entry['count']}회 / 평균 {entry['chars'] // entry['count']}자 / 평균 대기 {avg_wait}")
+    elif command == "show" and len(sys.argv) > 2:
+        for record in iter_records(run_id=sys.argv[2]):
+            print(f"[{record['prompt_id']}-{record['turn']}] {record['speaker']}: {record['text'][:100]}")
+    else:
+        print("사용법: python conversation_store.py [import | stats [발언자] | show <run_id>]")
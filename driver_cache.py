@@ -0,0 +1,191 @@
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+# chromedriver 경로 캐시 파일 (저장소 폴더 기준)
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chromedriver_cache.json")
+
+# webdriver_manager가 내려받은 드라이버 보관 위치
+WDM_DRIVER_DIR = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver")
+
+# Chrome 실행 파일 후보 경로
+CHROME_CANDIDATES = [
+    os.path.join(os.environ.get("PROGRAMFILES", "C:\\Program Files"), "Google", "Chrome", "Application", "chrome.exe"),
+    os.path.join(os.environ.get("PROGRAMFILES(X86)", "C:\\Program Files (x86)"), "Google", "Chrome", "Application", "chrome.exe"),
+    os.path.join(os.environ.get("LOCALAPPDATA", ""), "Google", "Chrome", "Application", "chrome.exe"),
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+]
+
+VERSION_PATTERN = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+
+_lock = threading.Lock()
+_resolved_path = None
+
+
+def find_chrome_binary():
+    """Chrome 실행 파일 경로 찾기 (환경변수 CHROME_BINARY 우선)"""
+    if os.environ.get("CHROME_BINARY"):
+        return os.environ["CHROME_BINARY"]
+    for name in ["google-chrome", "google-chrome-stable", "chrome", "chromium", "chromium-browser"]:
+        path = shutil.which(name)
+        if path:
+            return path
+    for path in CHROME_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def get_chrome_version():
+    """설치된 Chrome 버전 (네트워크 없이 확인, 실패시 None)"""
+    if sys.platform == "win32":
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            version, _ = winreg.QueryValueEx(key, "version")
+            return version
+        except Exception:
+            pass
+
+    binary = find_chrome_binary()
+    if not binary:
+        return None
+
+    # Windows의 chrome.exe는 --version을 출력하지 않아 폴더 이름에서 버전을 읽음
+    if binary.lower().endswith(".exe"):
+        for name in os.listdir(os.path.dirname(binary)):
+            if VERSION_PATTERN.fullmatch(name):
+                return name
+        return None
+
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=5
+        ).stdout
+    except Exception:
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def get_major(version):
+    """버전 문자열의 메이저 번호"""
+    match = VERSION_PATTERN.search(version or "")
+    return match.group(1) if match else None
+
+
+def load_cache():
+    """저장된 캐시 불러오기"""
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_cache(entry):
+    """캐시 저장"""
+    try:
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"⚠️ chromedriver 캐시 저장 실패: {e}")
+
+
+def is_valid(entry, chrome_version):
+    """캐시된 드라이버가 아직 쓸 수 있는지 (파일 존재 + Chrome 메이저 버전 일치)"""
+    path = entry.get('path')
+    if not path or not os.path.isfile(path):
+        return False
+    if chrome_version and get_major(entry.get('chrome_version')) != get_major(chrome_version):
+        return False
+    return True
+
+
+def find_local_driver(chrome_version):
+    """webdriver_manager가 이미 받아둔 드라이버 중 버전이 맞는 것 찾기 (오프라인용)"""
+    major = get_major(chrome_version)
+    candidates = [
+        path for path in glob.glob(os.path.join(WDM_DRIVER_DIR, "**", "chromedriver*"), recursive=True)
+        if os.path.isfile(path) and os.path.basename(path) in ("chromedriver", "chromedriver.exe")
+    ]
+    if major:
+        matching = [p for p in candidates if f"{os.sep}{major}." in p]
+        candidates = matching or candidates
+    return sorted(candidates)[-1] if candidates else None
+
+
+def resolve_online():
+    """webdriver_manager로 버전 확인 및 다운로드 (네트워크 필요)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def get_chromedriver_path():
+    """chromedriver 경로 (한 번 확인한 뒤에는 캐시 사용, 오프라인에서도 동작)"""
+    global _resolved_path
+
+    with _lock:
+        if _resolved_path:
+            return _resolved_path
+
+        start = time.time()
+        chrome_version = get_chrome_version()
+        entry = load_cache()
+
+        if is_valid(entry, chrome_version):
+            _resolved_path = entry['path']
+            saved = entry.get('resolve_seconds')
+            note = f", 원래 {saved:.1f}초" if saved else ""
+            print(f"⚡ chromedriver 캐시 사용 ({time.time() - start:.2f}초{note})")
+            return _resolved_path
+
+        try:
+            path = resolve_online()
+        except Exception as e:
+            # 네트워크가 없으면 기존 캐시나 로컬에 받아둔 드라이버 사용
+            path = find_local_driver(chrome_version) or entry.get('path')
+            if not path or not os.path.isfile(path):
+                raise
+            print(f"⚠️ chromedriver 온라인 확인 실패, 로컬 드라이버 사용: {e}")
+
+        elapsed = time.time() - start
+        save_cache({
+            'path': path,
+            'chrome_version': chrome_version,
+            'resolve_seconds': round(elapsed, 3),
+            'resolved_at': time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+        print(f"📦 chromedriver 확인 완료 ({elapsed:.1f}초): {path}")
+        _resolved_path = path
+        return path
+
+
+# 캐시 효과 측정
+if __name__ == "__main__":
+    print("chromedriver 경로 확인 시간 측정...")
+
+    start = time.time()
+    resolve_online()
+    online = time.time() - start
+
+    start = time.time()
+    get_chromedriver_path()
+    first = time.time() - start
+
+    # 프로세스 메모리 캐시를 비우고 파일 캐시만으로 다시 확인
+    _resolved_path = None
+    start = time.time()
+    get_chromedriver_path()
+    cached = time.time() - start
+
+    print(f"\nChromeDriverManager().install(): {online:.2f}초")
+    print(f"캐시 첫 확인:                    {first:.2f}초")
+    print(f"캐시 재확인 (새 실행 기준):      {cached:.3f}초")
+    print(f"실행당 절약:                     {online - cached:.2f}초")
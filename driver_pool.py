@@ -0,0 +1,264 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from urllib.request import urlopen
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from browser_launcher import build_chrome_arguments, prepare_profile_copy
+from driver_cache import find_chrome_binary
+from platform_adapters import default_adapters
+
+POOL_HOST = "127.0.0.1"
+POOL_PORT = 8765
+BASE_DEBUG_PORT = 9300
+
+
+class BrowserSlot:
+    """풀에서 관리하는 Chrome 인스턴스 하나"""
+
+    def __init__(self, slot_id, platform, port, profile):
+        self.slot_id = slot_id
+        self.platform = platform
+        self.port = port
+        self.profile = profile
+        self.process = None
+        self.conversations = 0
+        self.busy = False
+        self.recycling = False
+
+    def to_dict(self):
+        return {
+            'id': self.slot_id,
+            'platform': self.platform,
+            'port': self.port,
+            'profile': self.profile,
+            'conversations': self.conversations,
+            'busy': self.busy,
+            'recycling': self.recycling,
+            'pid': self.process.pid if self.process else None
+        }
+
+
+class DriverPool:
+    """로그인된 Chrome을 미리 띄워두고 원격 디버깅 포트로 빌려주는 서비스"""
+
+    def __init__(self, size=1, max_conversations=20, launch_mode="headed",
+                 profiles=None, workers_dir="worker_profiles", renderer_limit=None):
+        self.size = max(1, size)
+        self.max_conversations = max_conversations
+        self.launch_mode = launch_mode
+        self.renderer_limit = renderer_limit
+        self.profiles = profiles or {"GPT": "chrome_profile", "Claude": "claude_profile"}
+        self.workers_dir = workers_dir
+        self.adapters = default_adapters()
+        self.chrome = find_chrome_binary()
+        self.lock = threading.Lock()
+        self.slots = {}
+        self.running = False
+
+    def create_slots(self):
+        """플랫폼마다 size개의 슬롯 생성 (첫 슬롯은 원본 프로필 사용)"""
+        port = BASE_DEBUG_PORT
+        for platform, source in self.profiles.items():
+            for i in range(self.size):
+                profile = source if i == 0 else prepare_profile_copy(
+                    source, os.path.join(self.workers_dir, f"pool_{i}", source)
+                )
+                slot_id = f"{platform.lower()}-{i + 1}"
+                self.slots[slot_id] = BrowserSlot(slot_id, platform, port, profile)
+                port += 1
+
+    def launch(self, slot):
+        """슬롯의 Chrome 실행 후 응답할 때까지 대기"""
+        arguments = [self.chrome, f"--remote-debugging-port={slot.port}"]
+        arguments += build_chrome_arguments(slot.profile, self.launch_mode, self.renderer_limit)
+        arguments.append(self.adapters[slot.platform].new_chat_url)
+
+        slot.process = subprocess.Popen(
+            arguments, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        slot.conversations = 0
+
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            if self.is_healthy(slot):
+                print(f"   ✓ {slot.slot_id} 준비 (포트 {slot.port})")
+                return True
+            time.sleep(0.5)
+
+        print(f"   ❌ {slot.slot_id} 시작 실패")
+        return False
+
+    def is_healthy(self, slot):
+        """디버깅 포트가 응답하는지 확인"""
+        if slot.process is None or slot.process.poll() is not None:
+            return False
+        try:
+            with urlopen(f"http://127.0.0.1:{slot.port}/json/version", timeout=1) as response:
+                return response.status == 200
+        except Exception:
+            return False
+
+    def terminate(self, slot):
+        """슬롯의 Chrome 종료"""
+        if slot.process and slot.process.poll() is None:
+            slot.process.terminate()
+            try:
+                slot.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                slot.process.kill()
+        slot.process = None
+
+    def recycle(self, slot):
+        """Chrome을 다시 띄워 새 상태로 교체 (백그라운드)"""
+        print(f"♻️ {slot.slot_id} 재시작 (대화 {slot.conversations}회)")
+        self.terminate(slot)
+        self.launch(slot)
+        with self.lock:
+            slot.recycling = False
+
+    def start(self):
+        """모든 슬롯 실행"""
+        if not self.chrome:
+            raise RuntimeError("Chrome 실행 파일을 찾을 수 없습니다 (CHROME_BINARY 환경변수로 지정)")
+
+        print(f"🔥 드라이버 풀 준비 중... (플랫폼당 {self.size}개)")
+        self.create_slots()
+        for slot in self.slots.values():
+            self.launch(slot)
+
+        self.running = True
+        threading.Thread(target=self.health_loop, daemon=True).start()
+
+    def health_loop(self, interval=30):
+        """쉬고 있는 슬롯을 주기적으로 검사하고 죽었으면 다시 실행"""
+        while self.running:
+            time.sleep(interval)
+            with self.lock:
+                idle = [s for s in self.slots.values() if not s.busy and not s.recycling]
+                for slot in idle:
+                    slot.recycling = True
+            for slot in idle:
+                if not self.is_healthy(slot):
+                    print(f"⚠️ {slot.slot_id} 응답 없음")
+                    self.recycle(slot)
+                else:
+                    with self.lock:
+                        slot.recycling = False
+
+    def acquire(self, platform):
+        """플랫폼의 빈 슬롯 하나 대여 (없으면 None)"""
+        with self.lock:
+            for slot in self.slots.values():
+                if slot.platform == platform and not slot.busy and not slot.recycling:
+                    slot.busy = True
+                    return slot.to_dict()
+        return None
+
+    def release(self, slot_id, conversations=0):
+        """슬롯 반납 (대화 수가 한도를 넘으면 재시작)"""
+        with self.lock:
+            slot = self.slots.get(slot_id)
+            if slot is None:
+                return False
+            slot.busy = False
+            slot.conversations += conversations
+            if slot.conversations < self.max_conversations:
+                return True
+            slot.recycling = True
+
+        threading.Thread(target=self.recycle, args=(slot,), daemon=True).start()
+        return True
+
+    def status(self):
+        """전체 슬롯 상태"""
+        with self.lock:
+            return [slot.to_dict() for slot in self.slots.values()]
+
+    def stop(self):
+        """모든 Chrome 종료"""
+        self.running = False
+        for slot in self.slots.values():
+            self.terminate(slot)
+
+    def serve(self, host=POOL_HOST, port=POOL_PORT):
+        """HTTP로 대여/반납 요청 처리"""
+        pool = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+                if url.path == "/acquire":
+                    body = pool.acquire(query.get("platform", "GPT"))
+                    code = 200 if body else 503
+                elif url.path == "/release":
+                    body = {'ok': pool.release(query.get("id"), int(query.get("conversations", 0)))}
+                    code = 200
+                elif url.path == "/status":
+                    body = pool.status()
+                    code = 200
+                else:
+                    body, code = {'error': 'not found'}, 404
+
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        print(f"✅ 드라이버 풀 대기 중: http://{host}:{port}")
+        server.serve_forever()
+
+
+def acquire_from_pool(pool_url, platform, timeout=60):
+    """풀에서 브라우저 대여 (빈 슬롯이 생길 때까지 대기)"""
+    deadline = time.time() + timeout
+    while True:
+        try:
+            with urlopen(f"{pool_url}/acquire?platform={platform}", timeout=5) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except Exception:
+            if time.time() >= deadline:
+                return None
+            time.sleep(1)
+
+
+def release_to_pool(pool_url, slot_id, conversations=0):
+    """풀에 브라우저 반납"""
+    try:
+        with urlopen(f"{pool_url}/release?id={slot_id}&conversations={conversations}", timeout=5):
+            return True
+    except Exception as e:
+        print(f"⚠️ 풀 반납 실패 ({slot_id}): {e}")
+        return False
+
+
+# 풀 서비스 실행
+# 사용법: python driver_pool.py [플랫폼당 브라우저 수] [--lite] [--renderers=N]
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    pool = DriverPool(
+        size=int(args[0]) if args else 1,
+        launch_mode='lite' if "--lite" in sys.argv else 'headed',
+        renderer_limit=next((int(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--renderers=")), None)
+    )
+
+    try:
+        pool.start()
+        print("\n💡 처음 실행이라면 각 브라우저에서 로그인해주세요.")
+        pool.serve()
+    except KeyboardInterrupt:
+        print("\n⏹️ 드라이버 풀 종료 중...")
+    finally:
+        pool.stop()
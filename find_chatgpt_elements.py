@@ -1,10 +1,11 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 import time
 import os
 
+from driver_cache import get_chromedriver_path
+
 print("ChatGPT 요소 찾기 테스트...")
 
 # 기존 프로필 사용
@@ -14,7 +15,7 @@ options.add_argument(f"user-data-dir={profile_path}")
 options.add_argument("--disable-blink-features=AutomationControlled")
 
 driver = webdriver.Chrome(
-    service=Service(ChromeDriverManager().install()),
+    service=Service(get_chromedriver_path()),
     options=options
 )
 
@@ -0,0 +1,147 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+import threading
+import time
+
+
+class LocatorCache:
+    """플랫폼/페이지별로 통했던 셀렉터와 찾은 요소를 기억하는 캐시
+
+    1. 찾아둔 요소가 아직 페이지에 붙어 있으면 그대로 사용 (요청 1번)
+    2. 아니면 지난번에 통한 셀렉터만 다시 조회
+    3. 그래도 없으면 후보 전체를 기다리지 않고 한 번씩 조회한 뒤, 그래도 없을 때만 후보별로 대기
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # (플랫폼, 종류) → {'page', 'locator', 'element'}
+        self.stats = {}  # 종류 → {'hit', 'selector_hit', 'miss', 'fail', 'hit_seconds', 'miss_seconds'}
+
+    def page_key(self, driver):
+        """페이지 구분 키 (대화 id가 바뀌어도 같은 화면이면 같은 키)"""
+        try:
+            url = driver.current_url.split("?", 1)[0].split("#", 1)[0]
+        except Exception:
+            return None
+        scheme, _, rest = url.partition("://")
+        host, _, path = rest.partition("/")
+        section = path.split("/", 1)[0]
+        return f"{host}/{section}"
+
+    def find(self, driver, platform, kind, locators, timeout=5, clickable=True):
+        """요소 하나 찾기 (없으면 None), locators: [(By, 셀렉터), ...] 우선순위 순"""
+        started = time.perf_counter()
+        key = (platform, kind)
+        page = self.page_key(driver)
+        with self.lock:
+            entry = dict(self.entries.get(key) or {})
+
+        element, result = None, 'fail'
+        if entry.get('page') == page:
+            if entry.get('element') is not None and self.is_usable(entry['element'], clickable):
+                element, result = entry['element'], 'hit'
+            elif entry.get('locator'):
+                element = self.probe(driver, [entry['locator']], clickable)
+                result = 'selector_hit' if element is not None else 'fail'
+
+        if element is None:
+            # 지난번 셀렉터를 맨 앞에 두고 나머지 후보 탐색
+            ordered = list(locators)
+            if entry.get('locator') in ordered:
+                ordered.remove(entry['locator'])
+                ordered.insert(0, entry['locator'])
+            element = self.probe(driver, ordered, clickable)
+            if element is None:
+                element = self.wait_for_any(driver, ordered, timeout, clickable)
+            result = 'miss' if element is not None else 'fail'
+
+        with self.lock:
+            if element is not None:
+                self.entries[key] = {'page': page, 'locator': element.locator, 'element': element}
+            else:
+                self.entries.pop(key, None)
+            self.count(kind, result, time.perf_counter() - started)
+        return element
+
+    def find_all(self, driver, platform, kind, selectors):
+        """CSS 셀렉터 후보 중 결과가 있는 첫 셀렉터의 요소 목록 (지난번 셀렉터 먼저)"""
+        key = (platform, kind)
+        with self.lock:
+            remembered = (self.entries.get(key) or {}).get('selector')
+        ordered = [remembered] + [s for s in selectors if s != remembered] if remembered in selectors else list(selectors)
+        for selector in ordered:
+            try:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            except Exception:
+                continue
+            if elements:
+                with self.lock:
+                    self.entries[key] = {'selector': selector}
+                    self.count(kind, 'hit' if selector == remembered else 'miss', 0)
+                return elements
+        return []
+
+    def is_usable(self, element, clickable):
+        """찾아둔 요소가 아직 페이지에 붙어 있고 쓸 수 있는지 (떨어졌으면 예외로 바로 확인됨)"""
+        try:
+            return element.is_enabled() and (not clickable or element.is_displayed())
+        except Exception:
+            return False
+
+    def probe(self, driver, locators, clickable):
+        """후보를 기다리지 않고 한 번씩 조회"""
+        for by, selector in locators:
+            try:
+                for element in driver.find_elements(by, selector):
+                    if self.is_usable(element, clickable):
+                        element.locator = (by, selector)
+                        return element
+            except Exception:
+                continue
+        return None
+
+    def wait_for_any(self, driver, locators, timeout, clickable):
+        """후보 중 하나가 나타날 때까지 대기 (후보마다 따로 기다리지 않음)"""
+        def ready(d):
+            return self.probe(d, locators, clickable) or False
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=0.2).until(ready)
+        except Exception:
+            return None
+
+    def invalidate(self, platform=None):
+        """페이지 이동/새 채팅 후 찾아둔 요소 버리기 (셀렉터 기억은 유지)"""
+        with self.lock:
+            for key, entry in self.entries.items():
+                if platform is None or key[0] == platform:
+                    entry.pop('element', None)
+
+    def count(self, kind, result, seconds):
+        """조회 결과 집계 (lock 안에서 호출)"""
+        stats = self.stats.setdefault(kind, {
+            'hit': 0, 'selector_hit': 0, 'miss': 0, 'fail': 0, 'hit_seconds': 0.0, 'miss_seconds': 0.0
+        })
+        stats[result] += 1
+        if result == 'miss':
+            stats['miss_seconds'] += seconds
+        elif result != 'fail':
+            stats['hit_seconds'] += seconds
+
+    def print_summary(self):
+        """종류별 적중률과 조회당 절약 시간 출력"""
+        with self.lock:
+            stats = {kind: dict(s) for kind, s in self.stats.items()}
+        if not stats:
+            return
+        print("🎯 요소 캐시:")
+        for kind, s in stats.items():
+            hits = s['hit'] + s['selector_hit']
+            total = hits + s['miss'] + s['fail']
+            line = f"   {kind:10s} 적중 {hits}/{total} ({hits / total * 100:.0f}%)"
+            if s['selector_hit']:
+                line += f", 셀렉터 재사용 {s['selector_hit']}회"
+            if hits and s['miss'] and s['miss_seconds']:
+                miss_avg = s['miss_seconds'] / s['miss']
+                hit_avg = s['hit_seconds'] / hits
+                line += f", 조회 {hit_avg * 1000:.0f}ms (탐색시 {miss_avg * 1000:.0f}ms, 회당 {max(miss_avg - hit_avg, 0) * 1000:.0f}ms 절약)"
+            print(line)
@@ -0,0 +1,80 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import pathlib
+import sys
+import threading
+
+from platform_adapters import default_adapters
+
+MOCK_HOST = "127.0.0.1"
+MOCK_PORT = 8780
+PAGE_FILE = pathlib.Path(__file__).with_name("mock_chat_page.html")
+
+# 서버 기본 응답 설정 (URL 파라미터로 페이지마다 바꿀 수 있음)
+DEFAULT_SETTINGS = {
+    'chars': 600,
+    'speed': 300,
+    'latency': 800,
+    'chunk': 8,
+    'jitter': 0,
+    'seed': 1
+}
+
+
+def render_page(settings):
+    """서버 기본값을 심은 가짜 채팅 페이지"""
+    page = PAGE_FILE.read_text(encoding='utf-8')
+    defaults = f"<script>window.mockDefaults = {json.dumps(settings)};</script>\n<script>"
+    return page.replace("<script>", defaults, 1).encode('utf-8')
+
+
+def start_mock_server(host=MOCK_HOST, port=MOCK_PORT, **settings):
+    """가짜 채팅 서버를 백그라운드 스레드로 실행 (port=0이면 빈 포트 사용) → (서버, 주소)"""
+    merged = dict(DEFAULT_SETTINGS, **settings)
+    page = render_page(merged)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path in ("", "/gpt", "/claude"):
+                body, code, kind = page, 200, "text/html; charset=utf-8"
+            elif path == "/settings":
+                body, code, kind = json.dumps(merged).encode('utf-8'), 200, "application/json"
+            else:
+                body, code, kind = b"not found", 404, "text/plain"
+
+            self.send_response(code)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def mock_adapters(base_url):
+    """새 채팅 주소를 가짜 서버로 바꾼 어댑터 (셀렉터는 실제 사이트와 동일)"""
+    adapters = default_adapters()
+    for name, adapter in adapters.items():
+        adapter.new_chat_url = f"{base_url}/{name.lower()}"
+    return adapters
+
+
+# 서버만 실행 (브라우저로 직접 확인할 때)
+# 사용법: python mock_chat_server.py [--chars=600 --speed=300 --latency=800 --jitter=0 --seed=1 --port=8780]
+if __name__ == "__main__":
+    options = dict(arg[2:].split("=", 1) for arg in sys.argv[1:] if arg.startswith("--") and "=" in arg)
+    port = int(options.pop("port", MOCK_PORT))
+    settings = {k: float(v) if "." in v else int(v) for k, v in options.items() if k in DEFAULT_SETTINGS}
+
+    server, url = start_mock_server(port=port, **settings)
+    print(f"✅ 가짜 채팅 서버: {url}/gpt , {url}/claude")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,463 @@
+# 페이지에 주입하는 스크립트 모음 (Selenium execute_script와 CDP Runtime.evaluate에서 함께 사용)
+# selenium 없이 import할 수 있도록 문자열 상수만 둠
+# 다른 스크립트 앞에 붙여 쓰는 스크립트(OBSERVER_INSTALL_JS, ARM_OBSERVER_JS 등)는 return 없이 끝나야 함
+
+# 응답 본문을 마크다운으로 추출 (버튼/아이콘/툴바는 건너뜀, 코드 블록·목록·제목 유지)
+MARKDOWN_JS = """
+function __aiMarkdown(root, skipSelectors) {
+    if (!root) return '';
+    var SKIP_TAGS = {BUTTON: 1, SVG: 1, svg: 1, NAV: 1, FORM: 1, INPUT: 1, TEXTAREA: 1,
+                     SELECT: 1, STYLE: 1, SCRIPT: 1, NOSCRIPT: 1, TEMPLATE: 1};
+    var BLOCK_TAGS = {P: 1, DIV: 1, SECTION: 1, ARTICLE: 1, HEADER: 1, FOOTER: 1, MAIN: 1,
+                      FIGURE: 1, FIGCAPTION: 1, DETAILS: 1, SUMMARY: 1, LI: 1, DL: 1, DT: 1, DD: 1};
+    var skip = skipSelectors || [];
+    // 코드 블록은 자리표시로 빼 두었다가 목록 들여쓰기와 공백 정리가 끝난 뒤 그대로 되돌림
+    var blocks = [];
+    function skipped(el) {
+        if (SKIP_TAGS[el.tagName]) return true;
+        for (var i = 0; i < skip.length; i++) {
+            try { if (el.matches(skip[i])) return true; } catch (e) {}
+        }
+        return false;
+    }
+    function children(el) {
+        var out = '';
+        for (var c = el.firstChild; c; c = c.nextSibling) out += render(c);
+        return out;
+    }
+    function cells(row) {
+        var out = [];
+        for (var i = 0; i < row.children.length; i++) {
+            if (!skipped(row.children[i])) out.push(children(row.children[i]).replace(/\\s+/g, ' ').trim());
+        }
+        return '| ' + out.join(' | ') + ' |';
+    }
+    function render(node) {
+        if (node.nodeType === 3) return node.nodeValue.replace(/\\s+/g, ' ');
+        if (node.nodeType !== 1 || skipped(node)) return '';
+        var tag = node.tagName;
+        if (tag === 'PRE') {
+            var code = node.querySelector('code') || node;
+            var lang = /language-([\\w+#-]+)/.exec(code.className || '');
+            blocks.push('```' + (lang ? lang[1] : '') + '\\n' + code.textContent.replace(/\\n$/, '') + '\\n```');
+            return '\\n\\n\\u0000' + (blocks.length - 1) + '\\u0000\\n\\n';
+        }
+        if (tag === 'CODE') return '`' + node.textContent + '`';
+        if (tag === 'BR') return '\\n';
+        if (tag === 'HR') return '\\n\\n---\\n\\n';
+        if (tag === 'TABLE') {
+            var rows = node.querySelectorAll('tr'), lines = [];
+            for (var r = 0; r < rows.length; r++) {
+                lines.push(cells(rows[r]));
+                if (r === 0) lines.push(lines[0].replace(/[^|]+/g, ' --- '));
+            }
+            return '\\n\\n' + lines.join('\\n') + '\\n\\n';
+        }
+        if (tag === 'UL' || tag === 'OL') {
+            var n = parseInt(node.getAttribute('start') || '1', 10), items = '';
+            for (var i = 0; i < node.children.length; i++) {
+                var li = node.children[i];
+                if (li.tagName !== 'LI' || skipped(li)) continue;
+                var marker = tag === 'OL' ? (n++) + '. ' : '- ';
+                var pad = new Array(marker.length + 1).join(' ');
+                var body = children(li).trim().replace(/\\n\\s*\\n/g, '\\n').replace(/\\n/g, '\\n' + pad);
+                items += marker + body + '\\n';
+            }
+            return '\\n\\n' + items + '\\n';
+        }
+        var inner = children(node);
+        if (/^H[1-6]$/.test(tag)) return '\\n\\n' + '######'.slice(0, +tag[1]) + ' ' + inner.trim() + '\\n\\n';
+        if (tag === 'STRONG' || tag === 'B') return inner.trim() ? '**' + inner.trim() + '**' : '';
+        if (tag === 'EM' || tag === 'I') return inner.trim() ? '*' + inner.trim() + '*' : '';
+        if (tag === 'BLOCKQUOTE') return '\\n\\n' + inner.trim().replace(/^/gm, '> ') + '\\n\\n';
+        if (BLOCK_TAGS[tag]) return '\\n\\n' + inner.trim() + '\\n\\n';
+        return inner;
+    }
+    // 줄 끝 공백과 연속 빈 줄 정리 후 코드 블록 복원
+    return render(root).replace(/[ \\t]+\\n/g, '\\n').replace(/\\n[ \\t]+(?=[^ \\t\\-\\d])/g, '\\n')
+        .replace(/\\n{3,}/g, '\\n\\n').trim().replace(/\\u0000(\\d+)\\u0000/g, function (m, i) {
+            return blocks[+i];
+        });
+}
+"""
+
+# MutationObserver 설치 (페이지당 한 번)
+OBSERVER_INSTALL_JS = MARKDOWN_JS + """
+if (!window.__aiCompletion) {
+    var state = window.__aiCompletion = {lastChange: Date.now(), baseline: null, listeners: []};
+    new MutationObserver(function () {
+        state.lastChange = Date.now();
+        state.listeners.slice().forEach(function (fn) { fn(); });
+    }).observe(document.body, {childList: true, subtree: true, characterData: true, attributes: true});
+}
+function __aiLatest(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = [];
+        try { nodes = document.querySelectorAll(selectors[i]); } catch (e) {}
+        if (nodes.length) return {count: nodes.length, node: nodes[nodes.length - 1]};
+    }
+    return {count: 0, node: null};
+}
+function __aiText(node) {
+    return node ? (node.innerText || node.textContent || '') : '';
+}
+"""
+
+# 전송 직전 마지막 응답 (개수, 본문) 반환 — 폴링으로 대기할 때 이전 응답을 건너뛰는 기준
+# arguments: 응답 셀렉터가 첫 번째, 툴바 셀렉터가 마지막
+REPLY_BASELINE_JS = """
+var __base = __aiLatest(arguments[0]);
+return {count: __base.count, text: __aiMarkdown(__base.node, arguments[arguments.length - 1])};
+"""
+
+# 폴링 방식 기준점만 기록
+POLLING_BASELINE_JS = OBSERVER_INSTALL_JS + REPLY_BASELINE_JS
+
+# 전송 직전 기준점 기록 (이전 응답을 새 응답으로 오인하지 않도록)
+# 다른 스크립트 앞에 붙여 쓰므로 return 없이 끝남
+ARM_OBSERVER_JS = OBSERVER_INSTALL_JS + """
+var latest = __aiLatest(arguments[0]);
+window.__aiCompletion.baseline = {count: latest.count, text: __aiText(latest.node), sent: (arguments[1] || '').trim()};
+"""
+
+# 기준점 기록 후 폴링용 기준점 반환 (arguments: 응답 셀렉터, 보낸 메시지, 툴바 셀렉터)
+ARM_WITH_BASELINE_JS = ARM_OBSERVER_JS + REPLY_BASELINE_JS
+
+# 완료 신호가 올 때까지 브라우저 안에서 대기 (비동기 스크립트 콜백)
+WAIT_COMPLETION_JS = OBSERVER_INSTALL_JS + """
+var selectors = arguments[0], stopSelectors = arguments[1], streamingSelectors = arguments[2];
+var quietMs = arguments[3], settleMs = arguments[4], minLength = arguments[5], timeoutMs = arguments[6];
+var skipSelectors = arguments[7];
+var done = arguments[arguments.length - 1];
+var state = window.__aiCompletion;
+if (!state.baseline) {
+    var first = __aiLatest(selectors);
+    state.baseline = {count: first.count, text: __aiText(first.node), sent: ''};
+}
+var baseline = state.baseline;
+var sawIndicator = false, finished = false, timer = null, deadline = null;
+var startedAt = Date.now(), firstChangeAt = null;
+
+function anyVisible(list) {
+    for (var i = 0; i < list.length; i++) {
+        try { if (document.querySelector(list[i])) return true; } catch (e) {}
+    }
+    return false;
+}
+function isActive() {
+    var active = anyVisible(stopSelectors) || anyVisible(streamingSelectors);
+    if (active) sawIndicator = true;
+    return active;
+}
+function finish(status, text) {
+    if (finished) return;
+    finished = true;
+    clearTimeout(timer);
+    clearTimeout(deadline);
+    var idx = state.listeners.indexOf(onMutation);
+    if (idx >= 0) state.listeners.splice(idx, 1);
+    state.baseline = null;
+    var now = Date.now();
+    done({status: status, text: text, totalMs: now - startedAt,
+          firstMs: firstChangeAt ? firstChangeAt - startedAt : null});
+}
+function check() {
+    if (finished) return;
+    var active = isActive();
+    var wait = sawIndicator ? settleMs : quietMs;
+    var idle = Date.now() - state.lastChange;
+    if (!active && idle >= wait) {
+        var latest = __aiLatest(selectors);
+        var text = __aiText(latest.node);
+        var started = (latest.count > baseline.count || text !== baseline.text) && text.trim() !== baseline.sent;
+        if (started && text.length > minLength) {
+            finish('complete', __aiMarkdown(latest.node, skipSelectors));
+            return;
+        }
+    }
+    schedule(Math.max(wait - idle, 50));
+}
+function schedule(ms) {
+    clearTimeout(timer);
+    timer = setTimeout(check, ms);
+}
+function onMutation() {
+    if (!firstChangeAt) firstChangeAt = Date.now();
+    // 스트리밍 중에는 텍스트를 읽지 않고 조용해질 때까지 미룸
+    schedule(isActive() ? quietMs : (sawIndicator ? settleMs : quietMs));
+}
+state.listeners.push(onMutation);
+deadline = setTimeout(function () {
+    finish('timeout', __aiMarkdown(__aiLatest(selectors).node, skipSelectors));
+}, timeoutMs);
+check();
+"""
+
+# 응답 스트리밍 캡처 설치 (arguments[2]가 true면 전송 직전 기준점으로 다시 시작)
+# 옵저버가 받은 변경 기록에서 응답 끝에 덧붙은 텍스트만 chunks에 쌓음 (응답 전체를 다시 읽지 않음)
+# 중간이 바뀌는 등 덧붙임으로 볼 수 없는 변경이 있을 때만 전체 텍스트와 비교
+STREAM_INSTALL_JS = OBSERVER_INSTALL_JS + """
+var selectors = arguments[0], sent = (arguments[1] || '').replace(/\\s+/g, ' ').trim(), rearm = arguments[2];
+var s = window.__aiStream;
+if (!s || rearm) {
+    if (s && s.observer) s.observer.disconnect();
+    var count = __aiLatest(selectors).count;
+    s = window.__aiStream = {
+        node: null, text: '', chunks: [], rewrites: 0, pending: false, records: [],
+        base: rearm ? count : Math.max(count - 1, 0), sent: sent, lastChange: Date.now()
+    };
+    // 응답 요소 안에서 node 뒤에 내용이 있는 형제가 없는지 (끝에 덧붙은 변경인지)
+    var atEnd = function (node) {
+        for (; node && node !== s.node; node = node.parentNode) {
+            for (var sib = node.nextSibling; sib; sib = sib.nextSibling) {
+                if (sib.textContent) return false;
+            }
+        }
+        return node === s.node;
+    };
+    // 변경 기록 하나에서 덧붙은 텍스트 ('' = 응답과 무관, null = 덧붙임이 아님)
+    // 기록은 처리 시점의 내용을 읽으므로 같은 묶음에서 이미 읽은 노드(추가된 노드, 바뀐 텍스트)의 변경은 건너뜀
+    var appended = function (m, seen) {
+        if (!s.node.contains(m.target)) return '';
+        for (var f = 0; f < seen.length; f++) {
+            if (seen[f].contains(m.target)) return '';
+        }
+        if (m.type === 'characterData') {
+            var old = m.oldValue || '', now = m.target.data, tail = Math.min(old.length, 64);
+            seen.push(m.target);
+            // 이전 값의 끝부분만 같은 위치에 있는지 확인 (텍스트 노드 전체 비교 없이)
+            var kept = now.length >= old.length && now.substr(old.length - tail, tail) === old.slice(old.length - tail);
+            return atEnd(m.target) && kept ? now.slice(old.length) : null;
+        }
+        var text = '';
+        for (var i = 0; i < m.removedNodes.length; i++) {
+            if (m.removedNodes[i].textContent) return null;
+        }
+        for (var j = 0; j < m.addedNodes.length; j++) {
+            seen.push(m.addedNodes[j]);
+            text += m.addedNodes[j].textContent || '';
+        }
+        if (!text) return '';
+        return atEnd(m.addedNodes[m.addedNodes.length - 1]) ? text : null;
+    };
+    // 전체 텍스트와 비교해 맞추기 (처음 찾았을 때와 덧붙임이 아닌 변경이 있을 때만)
+    var resync = function () {
+        var full = s.node.textContent || '';
+        if (full.lastIndexOf(s.text, 0) === 0) {
+            if (full.length > s.text.length) s.chunks.push(full.slice(s.text.length));
+        } else {
+            s.rewrites++;
+        }
+        s.text = full;
+    };
+    var flush = function () {
+        s.pending = false;
+        var records = s.records;
+        s.records = [];
+        if (!s.node || !s.node.isConnected) {
+            var latest = __aiLatest(selectors);
+            if (!latest.node || latest.count <= s.base) return;
+            var own = (latest.node.textContent || '').replace(/\\s+/g, ' ').trim();
+            // 보낸 메시지가 응답 셀렉터에 잡힌 경우는 건너뜀
+            if (s.sent && own.indexOf(s.sent) === 0) { s.base = latest.count; return; }
+            s.node = latest.node;
+            resync();
+            return;
+        }
+        var added = '', seen = [];
+        for (var i = 0; i < records.length; i++) {
+            var piece = appended(records[i], seen);
+            if (piece === null) { resync(); return; }
+            added += piece;
+        }
+        if (added) {
+            s.chunks.push(added);
+            s.text += added;
+        }
+    };
+    s.flush = flush;
+    s.observer = new MutationObserver(function (records) {
+        s.lastChange = Date.now();
+        Array.prototype.push.apply(s.records, records);
+        if (!s.pending) { s.pending = true; setTimeout(flush, 0); }
+    });
+    s.observer.observe(document.body, {childList: true, subtree: true, characterData: true, characterDataOldValue: true});
+    flush();
+}
+"""
+
+# offset 이후에 쌓인 조각과 완료 신호 상태 반환
+STREAM_READ_JS = STREAM_INSTALL_JS + """
+var stopSelectors = arguments[3], streamingSelectors = arguments[4], offset = arguments[5];
+var active = false;
+stopSelectors.concat(streamingSelectors).forEach(function (sel) {
+    try { if (document.querySelector(sel)) active = true; } catch (e) {}
+});
+return {
+    chunks: s.chunks.slice(offset), count: s.chunks.length, started: !!s.node,
+    length: s.text.length, rewrites: s.rewrites, active: active, idle: Date.now() - s.lastChange
+};
+"""
+
+# 스트리밍이 끝난 응답의 최종 텍스트 (한 번만 읽음)
+STREAM_FINAL_JS = MARKDOWN_JS + """
+var s = window.__aiStream;
+if (!s || !s.node) return '';
+s.observer.disconnect();
+window.__aiStream = null;
+return __aiMarkdown(s.node, arguments[0]);
+"""
+
+# 메시지 요소 하나의 본문 추출 (폴링용)
+EXTRACT_MESSAGE_JS = MARKDOWN_JS + """
+return __aiMarkdown(arguments[0], arguments[1]);
+"""
+
+# 입력창 내용을 한 번에 교체하고 실제로 들어갔는지 확인 (에디터가 받는 input 이벤트 발생)
+INJECT_MESSAGE_JS = """
+var el = arguments[0], text = arguments[1];
+el.focus();
+if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+} else {
+    var range = document.createRange();
+    range.selectNodeContents(el);
+    var selection = window.getSelection();
+    selection.removeAllRanges();
+    selection.addRange(range);
+    // 기존 내용을 선택한 채로 insertText → 지우기와 입력이 한 번에 처리됨
+    if (!document.execCommand('insertText', false, text)) {
+        var data = new DataTransfer();
+        data.setData('text/plain', text);
+        el.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+    }
+}
+var current = (el.value !== undefined ? el.value : el.innerText) || '';
+var norm = function (s) { return s.replace(/\\s+/g, ' ').trim(); };
+return norm(current) === norm(text);
+"""
+
+# 입력창 미리 포커스 및 비우기 (투기적 전달 준비)
+PREPARE_INPUT_JS = """
+var el = arguments[0];
+el.focus();
+if (el.tagName === 'TEXTAREA' || el.tagName === 'INPUT') {
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, '');
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+} else if ((el.innerText || '').trim()) {
+    var range = document.createRange();
+    range.selectNodeContents(el);
+    var selection = window.getSelection();
+    selection.removeAllRanges();
+    selection.addRange(range);
+    document.execCommand('delete');
+}
+"""
+
+# 전송 후 입력창이 비었는지 확인
+INPUT_EMPTY_JS = """
+var el = arguments[0];
+return !el.isConnected || !((el.value !== undefined ? el.value : el.innerText) || '').trim();
+"""
+
+# 페이지 에이전트 버전 (스크립트가 바뀌면 올려서 이전 에이전트를 교체)
+AGENT_VERSION = 2
+
+# 페이지에 한 번 설치하는 에이전트 (상태 확인/읽기/전송/새 채팅이 각각 WebDriver 요청 한 번)
+# 앱 안에서 화면만 바뀌는 이동에는 window가 유지되고, 새로 로드되면 AGENT_CALL_JS가 다시 설치를 요청함
+# arguments: 설정, 호출할 메서드, 인자 목록 (설치 후 바로 호출)
+AGENT_INSTALL_JS = OBSERVER_INSTALL_JS + """
+var cfg = arguments[0];
+var __inject = function () {
+""" + INJECT_MESSAGE_JS + """
+};
+function first(selectors, usable) {
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = [];
+        try { nodes = document.querySelectorAll(selectors[i]); } catch (e) {}
+        for (var j = 0; j < nodes.length; j++) {
+            if (!usable || (nodes[j].getClientRects().length && !nodes[j].disabled)) return nodes[j];
+        }
+    }
+    return null;
+}
+var agent = window.__aiAgent = {
+    version: cfg.version,
+    sentAt: Date.now(),
+    firstAt: null,
+    sawIndicator: false,
+    submit: 'idle',  // 전송 버튼 클릭 상태: pending (재시도 중) / clicked / failed
+    // 기준점 이후에 새로 생긴 응답 (없으면 null)
+    reply: function () {
+        var base = window.__aiCompletion.baseline || {count: 0, text: '', sent: ''};
+        var latest = __aiLatest(cfg.response), text = __aiText(latest.node);
+        var started = (latest.count > base.count || text !== base.text) && text.trim() !== base.sent;
+        return started ? {node: latest.node, text: text} : null;
+    },
+    status: function (quietMs, settleMs, minLength) {
+        var active = !!(first(cfg.stop) || first(cfg.streaming));
+        if (active) agent.sawIndicator = true;
+        var reply = agent.reply(), now = Date.now();
+        var idle = now - window.__aiCompletion.lastChange;
+        if (reply && !agent.firstAt) agent.firstAt = now;
+        var wait = agent.sawIndicator ? settleMs : quietMs;
+        var state = !reply ? 'waiting' : (!active && idle >= wait && reply.text.length > minLength ? 'complete' : 'streaming');
+        return {state: state, length: reply ? reply.text.length : 0, active: active, idle: idle,
+                firstMs: agent.firstAt ? agent.firstAt - agent.sentAt : null, totalMs: now - agent.sentAt};
+    },
+    read: function (offset) {
+        var reply = agent.reply();
+        var text = reply ? __aiMarkdown(reply.node, cfg.toolbar) : '';
+        return {text: text.slice(offset || 0), length: text.length};
+    },
+    send: function (text) {
+        var el = first(cfg.input, true);
+        if (!el) return {sent: false, reason: 'input'};
+        if (!__inject(el, text)) return {sent: false, reason: 'inject'};
+        var latest = __aiLatest(cfg.response);
+        window.__aiCompletion.baseline = {count: latest.count, text: __aiText(latest.node), sent: text.trim()};
+        var baseline = {count: latest.count, text: __aiMarkdown(latest.node, cfg.toolbar)};
+        agent.sentAt = Date.now();
+        agent.firstAt = null;
+        agent.sawIndicator = false;
+        var button = first(cfg.submit);
+        if (!button) return {sent: false, reason: 'submit', input: el, baseline: baseline};
+        // 전송 버튼이 입력 직후 아직 비활성이면 활성화될 때까지 페이지 안에서 재시도 (결과는 submitted()로 확인)
+        agent.submit = 'pending';
+        (function click(tries) {
+            var b = first(cfg.submit);
+            if (b && !b.disabled) { b.click(); agent.submit = 'clicked'; agent.sentAt = Date.now(); return; }
+            if (tries > 0) setTimeout(function () { click(tries - 1); }, 50);
+            else agent.submit = 'failed';
+        })(40);
+        return {sent: agent.submit === 'clicked' ? true : agent.submit, baseline: baseline};
+    },
+    submitted: function () {
+        return agent.submit;
+    },
+    newChat: function (url) {
+        // 사이트의 새 채팅 링크가 있으면 앱 안에서 이동 (에이전트 유지)
+        var path = url.replace(/^https?:\\/\\/[^\\/]+/, '') || '/';
+        var links = document.querySelectorAll('a[href]');
+        for (var i = 0; i < links.length; i++) {
+            if (links[i].getAttribute('href') === path || links[i].href === url) {
+                links[i].click();
+                window.__aiCompletion.baseline = null;
+                return true;
+            }
+        }
+        return false;
+    }
+};
+return agent[arguments[1]].apply(agent, arguments[2]);
+"""
+
+# 설치된 에이전트 호출 (없거나 버전이 다르면 {missing: true})
+AGENT_CALL_JS = """
+var agent = window.__aiAgent;
+if (!agent || agent.version !== arguments[0]) return {missing: true};
+return agent[arguments[1]].apply(agent, arguments[2]);
+"""
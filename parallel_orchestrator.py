@@ -0,0 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+
+from adaptive_delays import AdaptiveDelays
+from ai_chat_controller_final import AIController
+from conversation_store import ConversationStore
+from profile_manager import ProfileManager
+from prompt_source import open_prompt_source, parse_range, skipped_note
+
+
+class ParallelOrchestrator:
+    """여러 GPT ↔ Claude 브라우저 쌍으로 프롬프트를 동시에 실행"""
+
+    def __init__(self, concurrency=2, workers_dir="worker_profiles", launch_mode="headed", prompts=None, renderer_limit=None):
+        self.concurrency = max(1, concurrency)
+        self.workers_dir = workers_dir
+        # 워커 프로필은 실행마다 원본에서 새로 복제하고 끝나면 삭제 (keep_profiles면 남김)
+        self.profiles = ProfileManager(workers_dir)
+        self.keep_profiles = False
+        self.launch_mode = launch_mode
+        self.renderer_limit = renderer_limit
+        self.controllers = []
+        self.print_lock = threading.Lock()
+
+        # 워커들이 같은 대화 기록 파일에 쓰도록 저장소 하나를 공유
+        self.store = ConversationStore()
+
+        # 응답 시간 통계도 하나를 공유 (워커마다 따로 두면 delay_stats.json을 마지막에 저장한 워커 것만 남음)
+        self.delays = AdaptiveDelays()
+
+        # 프롬프트 파일은 워커들이 함께 한 줄씩 꺼내 씀 (기본은 prompts.json)
+        self.prompts = prompts or open_prompt_source()
+        self.jobs_lock = threading.Lock()
+
+    def log(self, worker_id, message):
+        """워커 번호를 붙여 출력"""
+        with self.print_lock:
+            print(f"[W{worker_id}] {message}")
+
+    def create_controllers(self):
+        """워커마다 독립된 컨트롤러와 브라우저 쌍 생성"""
+        print(f"🧩 워커 {self.concurrency}개 준비 중...")
+
+        profiles = self.profiles.clone_workers(["chrome_profile", "claude_profile"], self.concurrency)
+        for worker in profiles:
+            controller = AIController(
+                gpt_profile=worker["chrome_profile"],
+                claude_profile=worker["claude_profile"]
+            )
+            controller.prompts = self.prompts
+            controller.launch_mode = self.launch_mode
+            controller.renderer_limit = self.renderer_limit
+            controller.store = self.store
+            controller.delays = self.delays
+            # 체크포인트/재개는 순차 실행(ai_chat_controller_final.py --resume)에서만 사용
+            controller.checkpoint_path = None
+            self.controllers.append(controller)
+
+        # 브라우저 시작은 병렬로 (초기 로딩 대기도 한 번만 소요)
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(lambda c: c.start_browsers(), self.controllers))
+
+    def next_job(self, jobs):
+        """공유 프롬프트 스트림에서 다음 프롬프트 꺼내기 (없으면 None)"""
+        with self.jobs_lock:
+            return next(jobs, None)
+
+    def run_worker(self, worker_id, controller, jobs, results):
+        """프롬프트 스트림에서 하나씩 꺼내 순서대로 실행"""
+        controller.is_running = True
+        first = True
+
+        while controller.is_running:
+            job = self.next_job(jobs)
+            if job is None:
+                break
+            idx, prompt = job
+
+            # 같은 세션에서 다음 프롬프트 전 대기
+            if not first:
+                time.sleep(controller.delays['between_prompts'])
+            first = False
+
+            self.log(worker_id, f"🎯 프롬프트 {idx + 1} 시작")
+            try:
+                success = controller.run_single_prompt_conversation(prompt, idx)
+            except Exception as e:
+                self.log(worker_id, f"❌ 프롬프트 {idx + 1} 오류: {e}")
+                success = False
+
+            results[idx] = success
+            controller.store.flush()
+            if success:
+                self.prompts.mark_done(idx)
+            self.log(worker_id, f"{'✅' if success else '⚠️'} 프롬프트 {idx + 1} 종료")
+
+    def run_all_conversations(self):
+        """모든 프롬프트를 워커들에 나눠 동시 실행"""
+        print("\n🚀 병렬 자동 대화 시작!")
+        print(f"📋 총 프롬프트 수: {len(self.prompts)} (남은 프롬프트 {self.prompts.pending_count()}개){skipped_note(self.prompts)}")
+        print(f"🧵 동시 실행 수: {len(self.controllers)}\n")
+
+        jobs = iter(self.prompts)
+
+        results = {}
+        start_time = time.time()
+
+        with ThreadPoolExecutor(max_workers=len(self.controllers)) as pool:
+            futures = [
+                pool.submit(self.run_worker, worker_id, controller, jobs, results)
+                for worker_id, controller in enumerate(self.controllers, 1)
+            ]
+            for future in futures:
+                future.result()
+
+        elapsed = time.time() - start_time
+        successful = sum(1 for ok in results.values() if ok)
+
+        print(f"\n{'='*70}")
+        print(f"🎊 모든 대화 완료!")
+        print(f"📊 결과: {successful}/{len(results)} 성공")
+        print(f"⏱️ 총 소요 시간: {elapsed:.1f}초 (프롬프트당 {elapsed / max(len(results), 1):.1f}초)")
+        print(f"{'='*70}\n")
+        return results
+
+    def stop(self):
+        """모든 워커 브라우저 종료 후 프로필 복제본 정리"""
+        for controller in self.controllers:
+            controller.stop()
+        if not self.keep_profiles:
+            self.profiles.cleanup()
+
+
+# 메인 실행
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    concurrency = int(args[0]) if args else 2
+    prompts_file, prompt_range, renderer_limit = "prompts.json", (0, None), None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--prompts="):
+            prompts_file = arg.split("=", 1)[1]
+        elif arg.startswith("--range="):
+            prompt_range = parse_range(arg.split("=", 1)[1])
+        elif arg.startswith("--renderers="):
+            renderer_limit = int(arg.split("=", 1)[1])
+    orchestrator = ParallelOrchestrator(
+        concurrency=concurrency,
+        launch_mode='lite' if "--lite" in sys.argv else 'headed',
+        prompts=open_prompt_source(prompts_file, *prompt_range, fresh="--fresh" in sys.argv),
+        renderer_limit=renderer_limit
+    )
+    orchestrator.keep_profiles = "--keep-profiles" in sys.argv
+
+    print("🎮 AI 자동 대화 컨트롤러 - 병렬 실행")
+    print("=" * 60)
+
+    try:
+        orchestrator.create_controllers()
+
+        print("\n⚠️ 시작 전 확인사항:")
+        print("1. 모든 워커 브라우저의 ChatGPT / Claude 로그인 상태 확인")
+        print("2. 팝업이나 안내 메시지 닫기")
+
+        input("\n✅ 준비가 완료되면 엔터를 눌러주세요...")
+
+        orchestrator.run_all_conversations()
+
+        input("\n🔚 브라우저를 닫고 종료하려면 엔터를 누르세요...")
+
+    except KeyboardInterrupt:
+        print("\n\n⚠️ 사용자가 중단했습니다 (Ctrl+C)")
+    finally:
+        orchestrator.stop()
@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+import json
+import threading
+import time
+
+from adaptive_delays import percentile
+
+TRACE_FILE = "run_trace.json"
+
+
+class PhaseTimer:
+    """대화 단계별 소요 시간 기록 (monotonic 시계)
+
+    단계마다 시작/끝을 남겨 두었다가 실행이 끝나면 백분위 요약을 출력하고
+    Chrome trace 이벤트 JSON(chrome://tracing, Perfetto)으로 내보낸다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.origin = time.perf_counter()
+        self.events = []
+        self.context = {}
+
+    @contextmanager
+    def phase(self, name, platform=None, **args):
+        """with 블록 전체를 한 단계로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, platform, start, time.perf_counter(), **args)
+
+    def add(self, name, platform, start, end, **args):
+        """이미 잰 구간 기록 (perf_counter 기준 시작/끝)"""
+        event = {
+            'name': name,
+            'platform': platform or "-",
+            'start': start,
+            'duration': max(end - start, 0),
+            'args': dict(self.context, **args)
+        }
+        with self.lock:
+            self.events.append(event)
+
+    def summary(self):
+        """단계별 횟수, p50/p95/최대, 합계 (초)"""
+        durations = {}
+        with self.lock:
+            for event in self.events:
+                durations.setdefault(event['name'], []).append(event['duration'])
+        return {
+            name: {
+                'count': len(values),
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'max': max(values),
+                'total': sum(values)
+            }
+            for name, values in durations.items()
+        }
+
+    def print_summary(self):
+        """단계별 소요 시간 요약 출력 (합계가 큰 순서)"""
+        summary = self.summary()
+        if not summary:
+            return
+        print("⏱️ 단계별 소요 시간 (p50 / p95 / 최대, 합계):")
+        for name, s in sorted(summary.items(), key=lambda item: -item[1]['total']):
+            print(f"   {name:16s} {s['p50']:7.3f}초 / {s['p95']:7.3f}초 / {s['max']:7.3f}초  "
+                  f"합계 {s['total']:8.1f}초 ({s['count']}회)")
+
+    def export_trace(self, path=TRACE_FILE):
+        """Chrome trace 이벤트 형식으로 저장 (플랫폼마다 한 줄)"""
+        with self.lock:
+            events = list(self.events)
+
+        lanes = {}
+        trace = []
+        for event in events:
+            tid = lanes.setdefault(event['platform'], len(lanes) + 1)
+            trace.append({
+                'name': event['name'],
+                'cat': event['platform'],
+                'ph': 'X',
+                'ts': round((event['start'] - self.origin) * 1e6),
+                'dur': round(event['duration'] * 1e6),
+                'pid': 1,
+                'tid': tid,
+                'args': event['args']
+            })
+        for platform, tid in lanes.items():
+            trace.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': platform}})
+
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+            print(f"🧭 실행 타임라인 저장: {path} (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+        except Exception as e:
+            print(f"⚠️ 타임라인 저장 실패: {e}")
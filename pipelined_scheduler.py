@@ -0,0 +1,232 @@
+import queue
+import sys
+import threading
+import time
+
+from ai_chat_controller_final import AIController
+from prompt_source import parse_range, skipped_note
+
+
+class Conversation:
+    """진행 중인 프롬프트 하나의 상태"""
+
+    def __init__(self, prompt, prompt_idx):
+        self.prompt = prompt
+        self.prompt_idx = prompt_idx
+        self.tabs = {}
+        self.turns = []
+        self.next_message = prompt
+
+
+class PipelinedScheduler:
+    """여러 프롬프트를 번갈아 진행해 참가자 브라우저를 모두 계속 바쁘게 유지
+
+    대화 구성은 controller.topology를 따름 (relay 방식만 지원)
+    """
+
+    def __init__(self, controller, in_flight=2):
+        controller.check_topology()
+        if controller.topology['mode'] != 'relay':
+            raise ValueError("파이프라인 실행은 relay 방식만 지원합니다")
+        if controller.shared_profile:
+            raise ValueError("파이프라인 실행은 참가자마다 브라우저가 따로 있어야 합니다 (공유 브라우저 불가)")
+        self.controller = controller
+        self.participants = list(controller.topology['participants'])
+        self.turns_per_prompt = controller.topology['turns']
+        self.in_flight = max(1, in_flight)
+        self.lock = threading.Lock()
+        self.queues = {p: queue.Queue() for p in self.participants}
+        self.free_tabs = {p: [] for p in self.participants}
+        self.busy = {p: 0.0 for p in self.participants}
+        self.results = {}
+        self.pending = iter(())
+        self.source = None
+        self.active = 0
+
+    def acquire_tab(self, platform, driver):
+        """남는 탭을 재사용하거나 새 탭 열기 (드라이버 담당 스레드에서만 호출)"""
+        with self.lock:
+            if self.free_tabs[platform]:
+                return self.free_tabs[platform].pop()
+
+        driver.switch_to.new_window('tab')
+        self.controller.adapters[platform].new_chat(driver)
+        return driver.current_window_handle
+
+    def start_next(self):
+        """대기 중인 프롬프트 하나를 파이프라인에 투입 (lock 보유 상태에서 호출)"""
+        job = next(self.pending, None)
+        if job is None:
+            return False
+        prompt_idx, prompt = job
+        self.active += 1
+        print(f"🎯 프롬프트 {prompt_idx + 1} 투입")
+        self.queues[self.participants[0]].put(Conversation(prompt, prompt_idx))
+        return True
+
+    def finish(self, conv, success):
+        """대화 종료 처리 후 다음 프롬프트 투입"""
+        self.controller.store.flush()
+        if success and hasattr(self.source, 'mark_done'):
+            self.source.mark_done(conv.prompt_idx)
+        with self.lock:
+            self.results[conv.prompt_idx] = success
+            self.active -= 1
+            for platform, handle in conv.tabs.items():
+                self.free_tabs[platform].append(handle)
+
+            print(f"{'✅' if success else '⚠️'} 프롬프트 {conv.prompt_idx + 1} 종료")
+            self.start_next()
+
+            if self.active == 0:
+                for q in self.queues.values():
+                    q.put(None)
+
+    def run_step(self, platform, conv):
+        """대화의 한 차례: 전송 후 응답 대기"""
+        driver = self.controller.drivers[platform]
+        if platform not in conv.tabs:
+            conv.tabs[platform] = self.acquire_tab(platform, driver)
+        driver.switch_to.window(conv.tabs[platform])
+
+        if not self.controller.send_message(platform, conv.next_message):
+            return None
+        if not conv.turns:
+            self.controller.record_turn(conv.prompt_idx, 0, "User", conv.prompt)
+
+        started = time.time()
+        response = self.controller.wait_for_response_complete(driver, platform)
+        if response:
+            self.controller.record_turn(
+                conv.prompt_idx, len(conv.turns) + 1, platform, response, time.time() - started
+            )
+        return response
+
+    def run_driver(self, platform):
+        """드라이버 하나를 담당하는 작업 루프"""
+        other = self.participants[(self.participants.index(platform) + 1) % len(self.participants)]
+
+        while True:
+            conv = self.queues[platform].get()
+            if conv is None:
+                break
+
+            start = time.time()
+            try:
+                response = self.run_step(platform, conv)
+            except Exception as e:
+                print(f"❌ {platform} 프롬프트 {conv.prompt_idx + 1} 오류: {e}")
+                response = None
+            self.busy[platform] += time.time() - start
+
+            if not response:
+                self.finish(conv, False)
+                continue
+
+            conv.turns.append((platform, response))
+            if len(conv.turns) >= self.turns_per_prompt:
+                self.finish(conv, True)
+                continue
+
+            # 다음 참가자 브라우저로 넘기고 이 드라이버는 다른 대화를 처리
+            conv.next_message = response
+            self.queues[other].put(conv)
+
+    def run(self, prompts=None):
+        """프롬프트 전체를 파이프라인으로 실행 (목록 또는 (인덱스, 프롬프트)를 주는 소스)"""
+        prompts = prompts if prompts is not None else self.controller.prompts
+        self.source = prompts
+
+        print("\n🚀 파이프라인 자동 대화 시작!")
+        print(f"📋 총 프롬프트 수: {len(prompts)}{skipped_note(prompts)}")
+        print(f"🔀 동시 진행 대화 수: {self.in_flight}\n")
+
+        self.free_tabs = {
+            p: [self.controller.drivers[p].current_window_handle] for p in self.participants
+        }
+        # 프롬프트 파일은 필요할 때 하나씩 읽어옴
+        self.pending = iter(enumerate(prompts) if isinstance(prompts, list) else prompts)
+        self.controller.is_running = True
+
+        with self.lock:
+            for _ in range(self.in_flight):
+                if not self.start_next():
+                    break
+            if self.active == 0:
+                return self.results
+
+        start_time = time.time()
+        threads = [
+            threading.Thread(target=self.run_driver, args=(platform,), daemon=True)
+            for platform in self.participants
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.report(time.time() - start_time, len(self.results))
+        return self.results
+
+    def report(self, wall, prompt_count):
+        """드라이버별 사용률과 순차 실행 대비 절약 시간 출력"""
+        successful = sum(1 for ok in self.results.values() if ok)
+
+        # 순차 루프는 작업 시간의 합 + 교환 간 대기 + 프롬프트 간 대기
+        delays = self.controller.delays
+        sequential = (
+            sum(self.busy.values())
+            + prompt_count * (self.turns_per_prompt - 1) * delays['between_exchange']
+            + max(prompt_count - 1, 0) * delays['between_prompts']
+        )
+
+        print(f"\n{'='*70}")
+        print(f"🎊 모든 대화 완료!")
+        print(f"📊 결과: {successful}/{prompt_count} 성공")
+        print(f"⏱️ 총 소요 시간: {wall:.1f}초")
+        print("📈 드라이버 사용률:")
+        for platform, busy in self.busy.items():
+            ratio = busy / wall * 100 if wall > 0 else 0
+            print(f"   {platform:7s} 작업 {busy:.1f}초 / 유휴 {max(wall - busy, 0):.1f}초 ({ratio:.0f}%)")
+        print(f"🐢 순차 실행 예상: {sequential:.1f}초 → 절약 {max(sequential - wall, 0):.1f}초")
+        print(f"{'='*70}\n")
+
+
+# 메인 실행
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    in_flight = int(args[0]) if args else 2
+    controller = AIController()
+    for arg in sys.argv[1:]:
+        if arg.startswith("--prompts="):
+            controller.prompts_file = arg.split("=", 1)[1]
+        elif arg.startswith("--range="):
+            controller.prompt_range = parse_range(arg.split("=", 1)[1])
+        elif arg == "--fresh":
+            controller.fresh_prompts = True
+        elif arg.startswith("--turns="):
+            controller.topology['turns'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--participants="):
+            controller.topology['participants'] = arg.split("=", 1)[1].split(",")
+    controller.load_prompts()
+
+    print("🎮 AI 자동 대화 컨트롤러 - 파이프라인 실행")
+    print("=" * 60)
+
+    try:
+        controller.start_browsers()
+
+        print("\n⚠️ 시작 전 확인사항:")
+        print("1. ChatGPT / Claude 로그인 상태 확인")
+        print("2. 팝업이나 안내 메시지 닫기")
+
+        input("\n✅ 준비가 완료되면 엔터를 눌러주세요...")
+
+        PipelinedScheduler(controller, in_flight=in_flight).run()
+
+        input("\n🔚 브라우저를 닫고 종료하려면 엔터를 누르세요...")
+
+    except KeyboardInterrupt:
+        print("\n\n⚠️ 사용자가 중단했습니다 (Ctrl+C)")
+    finally:
+        controller.stop()
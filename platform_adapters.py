@@ -0,0 +1,152 @@
+from response_cleaner import UI_LABELS
+
+# selenium 없이도 셀렉터 정의는 읽을 수 있게 함 (CDP 컨트롤러는 css_selectors만 사용)
+try:
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+except ImportError:
+    Keys = WebDriverWait = EC = None
+
+    class By:
+        """selenium By와 같은 값의 로케이터 종류"""
+        ID = "id"
+        CSS_SELECTOR = "css selector"
+
+
+class PlatformAdapter:
+    """채팅 사이트별 DOM 차이를 감추는 어댑터 (엔진은 이 인터페이스만 사용)"""
+
+    name = ""
+    new_chat_url = ""
+
+    # 입력창 후보 (순서대로 시도) 와 후보당 대기 시간
+    input_selectors = []
+    input_timeout = 5
+
+    # 응답 메시지 / 완료 신호 셀렉터
+    response_selectors = []
+    stop_selectors = []
+    streaming_selectors = []
+
+    # 전송 버튼 (없으면 Enter로 전송)
+    submit_selectors = []
+
+    # 응답 텍스트에서 지울 버튼 문구
+    ui_labels = UI_LABELS
+
+    # 응답 본문 추출시 건너뛸 요소 (버튼/svg 태그는 항상 제외)
+    toolbar_selectors = [
+        "[role='toolbar']",
+        "[role='button']",
+        "[aria-hidden='true']",
+        ".sr-only"
+    ]
+
+    def find_input(self, driver, locators=None):
+        """입력창 찾기 (없으면 None, locators: 찾은 셀렉터/요소를 기억하는 LocatorCache)"""
+        if locators is not None:
+            return locators.find(driver, self.name, 'input', self.input_selectors, self.input_timeout)
+        for by, selector in self.input_selectors:
+            try:
+                element = WebDriverWait(driver, self.input_timeout).until(
+                    EC.element_to_be_clickable((by, selector))
+                )
+                if element:
+                    print(f"   ✓ 입력창 찾음: {selector}")
+                    return element
+            except:
+                continue
+        return None
+
+    def focus_input(self, driver, element):
+        """입력창 포커스"""
+        element.click()
+
+    def submit(self, driver, element):
+        """메시지 전송 (전송 버튼이 있으면 클릭, 없으면 Enter)"""
+        for selector in self.submit_selectors:
+            buttons = driver.find_elements(By.CSS_SELECTOR, selector)
+            if buttons and buttons[0].is_enabled():
+                buttons[0].click()
+                return
+        element.send_keys(Keys.RETURN)
+
+    def new_chat(self, driver):
+        """새 채팅 시작"""
+        driver.get(self.new_chat_url)
+
+
+class GPTAdapter(PlatformAdapter):
+    """ChatGPT (chatgpt.com)"""
+
+    name = "GPT"
+    new_chat_url = "https://chatgpt.com"
+
+    input_selectors = [
+        (By.ID, "prompt-textarea"),
+        (By.CSS_SELECTOR, "textarea[data-id='root']"),
+        (By.CSS_SELECTOR, "div[contenteditable='true']")
+    ]
+    input_timeout = 5
+
+    response_selectors = [
+        "div[data-message-author-role='assistant']",
+        "div.group:has(div.text-token-text-primary)"
+    ]
+    stop_selectors = [
+        "button[data-testid='stop-button']",
+        "button[aria-label='Stop streaming']"
+    ]
+    streaming_selectors = [".result-streaming"]
+
+    submit_selectors = ["button[data-testid='send-button']"]
+
+    def focus_input(self, driver, element):
+        """JavaScript로 포커스 (오버레이에 가려져도 동작)"""
+        driver.execute_script("""
+            var element = arguments[0];
+            element.focus();
+            element.click();
+        """, element)
+
+
+class ClaudeAdapter(PlatformAdapter):
+    """Claude (claude.ai)"""
+
+    name = "Claude"
+    new_chat_url = "https://claude.ai/new"
+
+    input_selectors = [
+        (By.CSS_SELECTOR, "div[contenteditable='true']")
+    ]
+    input_timeout = 10
+
+    response_selectors = [
+        "div[data-test-render-count]",
+        "div.prose"
+    ]
+    stop_selectors = ["button[aria-label='Stop response']"]
+    streaming_selectors = ["[data-is-streaming='true']"]
+
+    submit_selectors = ["button[aria-label='Send message']"]
+
+
+def css_selectors(locators):
+    """(By, 셀렉터) 목록을 CSS 셀렉터로 변환 (페이지 안 스크립트용, CSS로 못 바꾸는 것은 제외)"""
+    selectors = []
+    for by, selector in locators:
+        if by == By.ID:
+            selectors.append(f"#{selector}")
+        elif by == By.CSS_SELECTOR:
+            selectors.append(selector)
+    return selectors
+
+
+def default_adapters():
+    """기본 플랫폼 어댑터 목록"""
+    return {
+        "GPT": GPTAdapter(),
+        "Claude": ClaudeAdapter()
+    }
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+import time
+
+from browser_launcher import clone_profile
+
+# 복제본 표시 파일 (이 파일이 있는 폴더만 정리 대상)
+CLONE_MARKER = ".profile_clone.json"
+
+# Chrome이 실행 중일 때 프로필 폴더에 있는 잠금 파일
+#   Linux/macOS: SingletonLock 심볼릭 링크 (대상이 "<호스트>-<pid>")
+#   Windows: lockfile (실행 중에는 Chrome이 열어 두어 지울 수 없음)
+
+
+def pid_alive(pid):
+    """이 컴퓨터에서 실행 중인 프로세스인지"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def is_in_use(profile):
+    """Chrome이 사용 중인 프로필인지 (비정상 종료로 남은 잠금은 무시)"""
+    lock = os.path.join(profile, "SingletonLock")
+    if os.path.lexists(lock):
+        try:
+            host, _, pid = os.readlink(lock).rpartition("-")
+            if host == socket.gethostname() and pid_alive(int(pid)):
+                return True
+        except (OSError, ValueError):
+            pass
+
+    lockfile = os.path.join(profile, "lockfile")
+    if os.path.exists(lockfile):
+        try:
+            os.remove(lockfile)
+        except OSError:
+            return True
+    return False
+
+
+class ProfileManager:
+    """워커별 프로필 복제본 생성/정리
+
+    원본 프로필을 캐시 없이 하드링크 위주로 복제하므로 워커 수가 많아도 몇 초 안에 준비되고,
+    실행이 끝나면 이번에 만든 복제본을 지운다 (gc로 남은 복제본도 정리).
+    """
+
+    def __init__(self, workers_dir="worker_profiles"):
+        self.workers_dir = workers_dir
+        self.lock = threading.Lock()
+        self.clones = []
+        self.timings = []  # (복제본 경로, 초, 통계)
+
+    def clone(self, source, worker):
+        """원본 프로필을 workers_dir/<worker>/<원본 이름>으로 새로 복제 (남아 있던 복제본은 교체)"""
+        target = os.path.join(self.workers_dir, worker, os.path.basename(os.path.normpath(source)))
+        if os.path.exists(target):
+            if is_in_use(target):
+                raise RuntimeError(f"사용 중인 프로필 복제본입니다: {target}")
+            shutil.rmtree(target)
+
+        started = time.perf_counter()
+        if os.path.exists(source):
+            stats = clone_profile(source, target)
+        else:
+            os.makedirs(target)
+            stats = {'hardlink': 0, 'reflink': 0, 'copy': 0, 'copied_bytes': 0}
+        with open(os.path.join(target, CLONE_MARKER), 'w', encoding='utf-8') as f:
+            json.dump({'source': source, 'created_at': time.strftime("%Y-%m-%d %H:%M:%S")}, f, ensure_ascii=False)
+        elapsed = time.perf_counter() - started
+
+        with self.lock:
+            self.clones.append(target)
+            self.timings.append((target, elapsed, stats))
+        return target
+
+    def clone_workers(self, sources, count):
+        """워커 count개에 원본 프로필들을 동시에 복제 → [원본 → 복제본 경로] 목록"""
+        started = time.perf_counter()
+        jobs = [(worker_id, source) for worker_id in range(1, count + 1) for source in sources]
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs)) or 1) as pool:
+            paths = list(pool.map(lambda job: self.clone(job[1], f"worker_{job[0]}"), jobs))
+
+        workers = [{} for _ in range(count)]
+        for (worker_id, source), path in zip(jobs, paths):
+            workers[worker_id - 1][source] = path
+        self.print_summary(time.perf_counter() - started)
+        return workers
+
+    def print_summary(self, wall=None):
+        """복제 시간과 방식별 파일 수 출력"""
+        with self.lock:
+            timings = list(self.timings)
+        if not timings:
+            return
+        total = {'hardlink': 0, 'reflink': 0, 'copy': 0, 'copied_bytes': 0}
+        for _, _, stats in timings:
+            for key in total:
+                total[key] += stats[key]
+        slowest = max(elapsed for _, elapsed, _ in timings)
+        wall_text = f"전체 {wall:.1f}초, " if wall is not None else ""
+        print(f"🧬 프로필 복제 {len(timings)}개: {wall_text}최대 {slowest:.2f}초 "
+              f"(하드링크 {total['hardlink']}, reflink {total['reflink']}, "
+              f"복사 {total['copy']}개 / {total['copied_bytes'] / (1024 * 1024):.1f}MB)")
+
+    def cleanup(self):
+        """이번에 만든 복제본 삭제 (사용 중이면 남김)"""
+        with self.lock:
+            clones, self.clones = self.clones, []
+        removed = sum(1 for path in clones if self.remove(path))
+        if removed:
+            print(f"🧹 프로필 복제본 {removed}개 삭제")
+
+    def gc(self, max_age_hours=None):
+        """workers_dir에 남은 복제본 정리 (사용 중인 것과 max_age_hours보다 최근 것은 남김)"""
+        removed = 0
+        if not os.path.isdir(self.workers_dir):
+            return removed
+        for root, dirs, files in os.walk(self.workers_dir):
+            if CLONE_MARKER not in files:
+                continue
+            dirs[:] = []
+            age = time.time() - os.path.getmtime(os.path.join(root, CLONE_MARKER))
+            if max_age_hours is not None and age < max_age_hours * 3600:
+                continue
+            if self.remove(root):
+                removed += 1
+        print(f"🧹 남은 프로필 복제본 {removed}개 정리")
+        return removed
+
+    def remove(self, path):
+        """복제본 하나 삭제 후 빈 상위 폴더 정리 (하드링크만 끊기므로 원본은 그대로, 사용 중이면 False)"""
+        if not os.path.exists(os.path.join(path, CLONE_MARKER)) or is_in_use(path):
+            return False
+        shutil.rmtree(path, ignore_errors=True)
+        parent = os.path.dirname(path)
+        while parent and os.path.abspath(parent) != os.path.abspath(self.workers_dir):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break
+            parent = os.path.dirname(parent)
+        return True
+
+
+# 사용법: python profile_manager.py gc [최소 경과 시간(시간)]
+#         python profile_manager.py bench [워커 수]   (복제 시간 측정 후 삭제)
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "gc"
+    manager = ProfileManager()
+    if command == "bench":
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+        print(f"워커 {count}개 프로필 복제 측정...")
+        manager.clone_workers(["chrome_profile", "claude_profile"], count)
+        manager.cleanup()
+    else:
+        manager.gc(float(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,118 @@
+import json
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+from browser_launcher import launch_chrome, prepare_profile_copy
+from platform_adapters import default_adapters
+
+# 두 사이트 로그인을 함께 담는 통합 프로필 (브라우저 하나로 GPT/Claude 탭을 모두 띄울 때 사용)
+SHARED_PROFILE = "shared_profile"
+DEFAULT_SOURCES = {"GPT": "chrome_profile", "Claude": "claude_profile"}
+MARKER_FILE = "merged_from.json"
+
+# Network.setCookies가 받는 쿠키 필드
+COOKIE_FIELDS = ["name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority"]
+
+
+def site_origin(url):
+    """주소의 origin (https://host)"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def site_cookies(cookies, url):
+    """사이트 도메인(하위 도메인 포함)의 쿠키만 (다른 사이트 쿠키로 기존 로그인을 덮지 않도록)"""
+    host = urlparse(url).hostname
+    selected = []
+    for cookie in cookies:
+        domain = cookie.get('domain', '').lstrip('.')
+        if domain and (host == domain or host.endswith('.' + domain) or domain.endswith('.' + host)):
+            selected.append(cookie)
+    return selected
+
+
+def export_login(profile, url, launch_mode="headed"):
+    """프로필의 로그인 상태 읽기 → (쿠키 목록, 사이트 localStorage)
+
+    쿠키 값은 프로필마다 다른 키로 암호화되어 파일을 그대로 합칠 수 없으므로 브라우저에서 복호화된 값을 받음
+    """
+    driver = launch_chrome(profile, launch_mode)
+    try:
+        driver.get(url)
+        time.sleep(3)
+        cookies = site_cookies(driver.execute_cdp_cmd("Network.getAllCookies", {})['cookies'], url)
+        storage = driver.execute_script("return Object.assign({}, window.localStorage);")
+    finally:
+        driver.quit()
+    return cookies, storage
+
+
+def import_login(driver, url, cookies, storage):
+    """현재 브라우저에 쿠키와 사이트 localStorage 넣기"""
+    entries = []
+    for cookie in cookies:
+        entry = {k: cookie[k] for k in COOKIE_FIELDS if k in cookie}
+        # 세션 쿠키(expires -1)는 만료 시각 없이 넣음
+        if entry.get('expires', -1) <= 0:
+            entry.pop('expires', None)
+        entries.append(entry)
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": entries})
+
+    driver.get(url)
+    driver.execute_script("""
+        var items = arguments[0];
+        Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });
+    """, storage)
+
+
+def merge_profiles(sources=None, target=SHARED_PROFILE, launch_mode="headed", force=False):
+    """여러 프로필의 로그인을 통합 프로필 하나로 합침 (한 번만 실행, 이미 있으면 그대로 사용)
+
+    첫 프로필은 폴더째 복사하고 나머지 프로필의 쿠키/localStorage를 브라우저를 통해 옮김
+    """
+    sources = sources or DEFAULT_SOURCES
+    marker = os.path.join(target, MARKER_FILE)
+    if os.path.exists(marker) and not force:
+        print(f"✅ 통합 프로필 사용: {target}")
+        return target
+
+    adapters = default_adapters()
+    platforms = list(sources)
+    print(f"🔀 프로필 통합 중: {', '.join(sources.values())} → {target}")
+    prepare_profile_copy(sources[platforms[0]], target)
+
+    exported = {}
+    for platform in platforms[1:]:
+        url = adapters[platform].new_chat_url
+        cookies, storage = export_login(sources[platform], url, launch_mode)
+        exported[platform] = (url, cookies, storage)
+        print(f"   ✓ {platform}: 쿠키 {len(cookies)}개, localStorage {len(storage)}개 읽음")
+
+    driver = launch_chrome(target, launch_mode)
+    try:
+        for platform, (url, cookies, storage) in exported.items():
+            import_login(driver, url, cookies, storage)
+            print(f"   ✓ {platform}: {site_origin(url)} 로그인 옮김")
+    finally:
+        driver.quit()
+
+    with open(marker, 'w', encoding='utf-8') as f:
+        json.dump({'sources': sources, 'merged_at': time.strftime("%Y-%m-%d %H:%M:%S")}, f, ensure_ascii=False, indent=2)
+    print(f"✅ 통합 프로필 준비 완료: {target}")
+    return target
+
+
+# 통합 프로필 만들기 (기존 프로필은 건드리지 않음)
+# 사용법: python profile_merge.py [--force] [--lite] [--target=shared_profile]
+if __name__ == "__main__":
+    target = SHARED_PROFILE
+    for arg in sys.argv[1:]:
+        if arg.startswith("--target="):
+            target = arg.split("=", 1)[1]
+    merge_profiles(
+        target=target,
+        launch_mode="lite" if "--lite" in sys.argv else "headed",
+        force="--force" in sys.argv
+    )
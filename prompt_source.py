@@ -0,0 +1,199 @@
+import csv
+import json
+import os
+import threading
+
+# 처음 실행할 때 prompts.json에 넣어두는 기본 프롬프트
+DEFAULT_PROMPTS = [
+    "안녕하세요! 당신의 이름은 무엇인가요? 그리고 오늘 기분은 어떠신가요?",
+    "좋아하는 색깔이 무엇인가요? 그 이유도 알려주세요.",
+    "만약 하루 동안 어떤 동물이든 될 수 있다면 무엇이 되고 싶나요?"
+]
+
+# JSON/JSONL 객체나 CSV 헤더에서 프롬프트로 읽을 필드
+PROMPT_FIELDS = ["prompt", "text", "content"]
+
+CHUNK_SIZE = 64 * 1024
+
+
+def pick_prompt(item):
+    """JSON 값 하나에서 프롬프트 문자열 꺼내기"""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        for field in PROMPT_FIELDS:
+            if isinstance(item.get(field), str):
+                return item[field]
+    return None
+
+
+def iter_json_array(f):
+    """JSON 배열 파일을 조금씩 읽으면서 원소를 하나씩 반환 (파일 전체를 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # 공백, 쉼표, 여는 괄호 건너뛰기
+        while pos < len(buffer) and (buffer[pos] in " \t\r\n," or (buffer[pos] == "[" and not started)):
+            started = started or buffer[pos] == "["
+            pos += 1
+
+        if buffer.startswith("]", pos):
+            return
+        if pos < len(buffer):
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except ValueError:
+                if eof:
+                    raise
+            else:
+                # 버퍼 끝에서 잘린 숫자일 수 있으므로 뒤에 내용이 더 있을 때만 확정
+                if end < len(buffer) or eof:
+                    yield item
+                    pos = end
+                    continue
+        if eof:
+            return
+
+        chunk = f.read(CHUNK_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+class PromptSource:
+    """큰 프롬프트 파일(JSON/JSONL/CSV)을 필요한 만큼만 읽어오는 소스
+
+    start/end로 처리할 인덱스 범위(샤드)를 정하고, 끝난 프롬프트는 <파일>.done에 기록해 다음 실행에서 건너뜀
+    """
+
+    def __init__(self, path, start=0, end=None, done_path=None):
+        self.path = path
+        self.start = start
+        self.end = end
+        self.done_path = done_path or path + ".done"
+        self.format = os.path.splitext(path)[1].lower().lstrip(".")
+        self.lock = threading.Lock()
+        self.done = self.load_done()
+        self.total = None
+
+    def load_done(self):
+        """완료된 프롬프트 인덱스 목록"""
+        try:
+            with open(self.done_path, 'r', encoding='utf-8') as f:
+                return {int(line) for line in f if line.strip().isdigit()}
+        except FileNotFoundError:
+            return set()
+
+    def reset_done(self):
+        """완료 기록 삭제 (처음부터 다시 실행)"""
+        with self.lock:
+            self.done = set()
+            if os.path.exists(self.done_path):
+                os.remove(self.done_path)
+
+    def mark_done(self, idx):
+        """프롬프트 완료 기록 (한 줄씩 덧붙임)"""
+        with self.lock:
+            if idx in self.done:
+                return
+            self.done.add(idx)
+            with open(self.done_path, 'a', encoding='utf-8') as f:
+                f.write(f"{idx}\n")
+
+    def iter_all(self):
+        """파일의 모든 프롬프트를 (인덱스, 프롬프트)로 차례로 반환"""
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            if self.format == "jsonl":
+                items = (json.loads(line) for line in f if line.strip())
+            elif self.format == "csv":
+                items = self.iter_csv(f)
+            else:
+                items = iter_json_array(f)
+
+            idx = 0
+            for item in items:
+                prompt = pick_prompt(item)
+                if prompt is None:
+                    continue
+                yield idx, prompt
+                idx += 1
+
+    def iter_csv(self, f):
+        """CSV 행 반환 (헤더에 prompt/text/content 열이 있으면 그 열, 없으면 첫 열)"""
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            return
+        header = [cell.strip().lower() for cell in first]
+        column = next((header.index(name) for name in PROMPT_FIELDS if name in header), None)
+        if column is None:
+            column = 0
+            yield first[0] if first else None
+        for row in reader:
+            yield row[column] if len(row) > column else None
+
+    def __iter__(self):
+        """범위 안에서 아직 끝나지 않은 프롬프트만 반환"""
+        for idx, prompt in self.iter_all():
+            if idx < self.start:
+                continue
+            if self.end is not None and idx >= self.end:
+                return
+            if idx not in self.done:
+                yield idx, prompt
+
+    def __len__(self):
+        """범위 안의 프롬프트 수 (처음 한 번만 파일을 훑어서 셈)"""
+        if self.total is None:
+            count = 0
+            for idx, _ in self.iter_all():
+                if self.end is not None and idx >= self.end:
+                    break
+                count += 1
+            self.total = max(count - self.start, 0)
+        return self.total
+
+    def done_count(self):
+        """범위 안에서 완료 기록이 있어 건너뛸 프롬프트 수"""
+        return sum(1 for idx in self.done if idx >= self.start and (self.end is None or idx < self.end))
+
+    def pending_count(self):
+        """범위 안에서 남은 프롬프트 수"""
+        return len(self) - self.done_count()
+
+    def shard(self, worker, workers):
+        """전체를 workers개의 연속 구간으로 나눈 것 중 worker번째 (0부터)"""
+        first = self.start
+        last = first + len(self)
+        size = -(-(last - first) // workers)
+        start = min(first + worker * size, last)
+        return PromptSource(self.path, start, min(start + size, last), self.done_path)
+
+
+def open_prompt_source(path="prompts.json", start=0, end=None, fresh=False):
+    """프롬프트 파일 열기 (없으면 기본 프롬프트로 만듦, 이미 있으면 건드리지 않음, fresh면 완료 기록 삭제)"""
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(DEFAULT_PROMPTS, f, ensure_ascii=False, indent=2)
+    source = PromptSource(path, start, end)
+    if fresh:
+        source.reset_done()
+    return source
+
+
+def skipped_note(prompts):
+    """완료 기록으로 건너뛰는 프롬프트 안내 (없거나 목록이면 빈 문자열)"""
+    done = prompts.done_count() if isinstance(prompts, PromptSource) else 0
+    if not done:
+        return ""
+    return f"\n⏭️ 완료 기록({prompts.done_path})에 있는 프롬프트 {done}개는 건너뜁니다 (처음부터 하려면 --fresh)"
+
+
+def parse_range(value):
+    """'100:200' 형식의 인덱스 범위 (1:은 끝까지)"""
+    start, _, end = value.partition(":")
+    return int(start or 0), int(end) if end else None
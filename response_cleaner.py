@@ -0,0 +1,39 @@
+import re
+
+# 응답 영역에 함께 잡히는 버튼 문구
+UI_LABELS = [
+    "재시도",
+    "Retry",
+    "Copy",
+    "복사",
+    "좋아요",
+    "싫어요",
+    "👍",
+    "👎",
+    "Share",
+    "공유",
+    "Download",
+    "다운로드",
+    "Edit",
+    "편집"
+]
+
+
+def build_cleaner(labels=UI_LABELS):
+    """UI 문구로만 이루어진 줄을 지우는 정규식 생성
+
+    버튼 문구는 innerText에서 자기 줄에 따로 나오므로 그런 줄만 지움
+    (본문 속 "좋아요", "Edit" 같은 단어는 그대로 둠)
+    """
+    label = "|".join(re.escape(l) for l in sorted(set(labels), key=len, reverse=True))
+    return re.compile(rf"^[ \t]*(?:{label})(?:[ \t]+(?:{label}))*[ \t]*$\n?", re.MULTILINE)
+
+
+DEFAULT_CLEANER = build_cleaner()
+
+
+def clean_text(text, cleaner=DEFAULT_CLEANER):
+    """UI 문구 줄 제거 후 연속 공백을 한 칸으로 정리"""
+    if not text:
+        return text
+    return " ".join(cleaner.sub("", text).split())
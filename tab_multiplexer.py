@@ -0,0 +1,296 @@
+import sys
+import threading
+import time
+
+from ai_chat_controller_final import AIController
+from browser_launcher import apply_lite_settings, get_driver_rss, keep_tab_active
+from prompt_source import parse_range, skipped_note
+
+
+class TabSlot:
+    """참가자마다 탭 하나씩 묶은 대화 자리 (프롬프트가 끝나면 다음 프롬프트를 받음)"""
+
+    def __init__(self, slot_id):
+        self.slot_id = slot_id
+        self.job = 0  # 배정할 때마다 증가 (이전 대화를 처리하던 스레드가 새 대화를 건드리지 않도록)
+        self.tabs = {}  # 플랫폼 → 창 핸들
+        self.state = 'idle'  # idle / queued (보낼 메시지 있음) / waiting (응답 대기)
+        self.speaker = None
+        self.message = None
+        self.prompt = None
+        self.prompt_idx = None
+        self.turns = []
+        self.sent_at = None
+        self.used = False
+        self.reset = set()  # 새 채팅을 열어야 하는 플랫폼
+
+
+class TabMultiplexer:
+    """플랫폼마다 Chrome 하나에 탭 여러 개를 띄워 대화를 동시에 진행
+
+    드라이버마다 스레드 하나가 탭을 돌아가며 확인한다. 한 탭의 응답을 기다리느라 막히지 않도록
+    페이지 에이전트의 status()(요청 한 번)로 상태만 보고 바로 다음 탭으로 넘어간다.
+    대화 구성은 controller.topology를 따름 (relay 방식만 지원)
+    """
+
+    def __init__(self, controller, tabs=4, poll=0.3):
+        controller.check_topology()
+        if controller.topology['mode'] != 'relay':
+            raise ValueError("탭 다중화는 relay 방식만 지원합니다")
+        if controller.shared_profile:
+            raise ValueError("탭 다중화는 참가자마다 브라우저가 따로 있어야 합니다 (공유 브라우저 불가)")
+        controller.page_agent = True
+        self.controller = controller
+        self.participants = list(controller.topology['participants'])
+        self.turns_per_prompt = controller.topology['turns']
+        self.poll = poll
+        self.slots = [TabSlot(i + 1) for i in range(max(1, tabs))]
+        self.lock = threading.Lock()
+        self.pending = iter(())
+        self.source = None
+        self.results = {}
+        self.memory = {}  # 플랫폼 → 탭 하나일 때 브라우저 메모리 (MB)
+        self.turn_count = 0
+
+    def open_tabs(self):
+        """플랫폼마다 탭을 슬롯 수만큼 준비 (첫 탭은 이미 열린 채팅 화면)"""
+        controller = self.controller
+        for platform in self.participants:
+            driver = controller.drivers[platform]
+            self.memory[platform] = get_driver_rss(driver)
+            for slot in self.slots:
+                if slot.slot_id > 1:
+                    driver.switch_to.new_window('tab')
+                    controller.adapters[platform].new_chat(driver)
+                    # 저사양 모드의 CDP 설정(User-Agent, 리소스 차단)도 탭마다 적용
+                    if controller.launch_mode == 'lite':
+                        apply_lite_settings(driver)
+                slot.tabs[platform] = driver.current_window_handle
+                keep_tab_active(driver)
+            print(f"🗂️ {platform}: 브라우저 하나에 탭 {len(self.slots)}개 준비")
+
+    def assign(self, slot):
+        """슬롯에 다음 프롬프트 배정 (lock 보유 상태에서 호출, 없으면 False)"""
+        slot.job += 1
+        job = next(self.pending, None)
+        if job is None:
+            slot.state = 'idle'
+            slot.reset = set()
+            return False
+        slot.prompt_idx, slot.prompt = job
+        # 이전 대화가 있던 탭은 새 채팅에서 시작
+        slot.reset = set(self.participants) if slot.used else set()
+        slot.used = True
+        slot.turns = []
+        slot.speaker = self.participants[0]
+        slot.message = slot.prompt
+        slot.state = 'queued'
+        print(f"🎯 [탭 {slot.slot_id}] 프롬프트 {slot.prompt_idx + 1} 투입")
+        return True
+
+    def finish(self, slot, success, job):
+        """대화 종료 처리 후 같은 슬롯에 다음 프롬프트 배정
+
+        슬롯을 놓는 곳은 여기 하나뿐이고, job이 이미 끝난 대화면 아무것도 하지 않음 (False)
+        """
+        with self.lock:
+            if slot.job != job or slot.state == 'idle':
+                return False
+            self.controller.store.flush()
+            if success and hasattr(self.source, 'mark_done'):
+                self.source.mark_done(slot.prompt_idx)
+            self.results[slot.prompt_idx] = success
+            print(f"{'✅' if success else '⚠️'} [탭 {slot.slot_id}] 프롬프트 {slot.prompt_idx + 1} 종료")
+            self.assign(slot)
+        return True
+
+    def step(self, platform, slot, job):
+        """슬롯 하나를 한 단계 진행 (한 일이 있으면 True, job: 진행할 대화 번호)"""
+        controller = self.controller
+        driver = controller.drivers[platform]
+        with self.lock:
+            if slot.job != job:
+                return False
+            needs_reset = platform in slot.reset
+            state, speaker, message, sent_at = slot.state, slot.speaker, slot.message, slot.sent_at
+
+        if needs_reset:
+            driver.switch_to.window(slot.tabs[platform])
+            controller.new_chat(platform)
+            with self.lock:
+                if slot.job == job:
+                    slot.reset.discard(platform)
+            return True
+        if state == 'idle' or speaker != platform:
+            return False
+
+        driver.switch_to.window(slot.tabs[platform])
+        if state == 'queued':
+            if not controller.send_message(platform, message):
+                self.finish(slot, False, job)
+                return True
+            with self.lock:
+                if slot.job != job:
+                    return True
+                slot.sent_at = time.time()
+                slot.state = 'waiting'
+                first, prompt_idx, prompt = not slot.turns, slot.prompt_idx, slot.prompt
+            if first:
+                controller.record_turn(prompt_idx, 0, "User", prompt)
+            return True
+
+        delays = controller.delays
+        status = controller.agent_call(driver, platform, 'status',
+                                       int(delays['quiet_period'] * 1000), int(delays['settle'] * 1000), 50)
+        timed_out = time.time() - sent_at > delays.timeout(platform)
+        if status['state'] != 'complete' and not timed_out:
+            return False
+
+        response = controller.agent_call(driver, platform, 'read', 0)['text']
+        if status['state'] == 'complete':
+            first_ms = status.get('firstMs')
+            controller.record_timing(platform, first_ms / 1000 if first_ms is not None else None,
+                                     status.get('totalMs', 0) / 1000, len(response))
+        if not response or len(response) <= 50:
+            print(f"❌ [탭 {slot.slot_id}] {platform} 응답을 받지 못했습니다")
+            self.finish(slot, False, job)
+            return True
+
+        with self.lock:
+            if slot.job != job:
+                return True
+            slot.turns.append((platform, response))
+            self.turn_count += 1
+            prompt_idx, turn = slot.prompt_idx, len(slot.turns)
+        controller.record_turn(prompt_idx, turn, platform, response, time.time() - sent_at)
+        print(f"📥 [탭 {slot.slot_id}] {platform} 응답 수신 ({len(response)}자, 발언 {turn}/{self.turns_per_prompt})")
+
+        if turn >= self.turns_per_prompt:
+            self.finish(slot, True, job)
+            return True
+
+        # 다음 참가자에게 넘김 (그 참가자의 드라이버 스레드가 보냄)
+        with self.lock:
+            if slot.job != job:
+                return True
+            slot.speaker = self.participants[len(slot.turns) % len(self.participants)]
+            slot.message = response
+            slot.state = 'queued'
+        return True
+
+    def run_driver(self, platform):
+        """드라이버 하나를 담당하며 탭을 돌아가며 진행"""
+        while True:
+            with self.lock:
+                if all(slot.state == 'idle' and not slot.reset for slot in self.slots):
+                    return
+                jobs = [slot.job for slot in self.slots]
+            worked = False
+            for slot, job in zip(self.slots, jobs):
+                try:
+                    worked = self.step(platform, slot, job) or worked
+                except Exception as e:
+                    # 새 채팅 열기 실패처럼 다른 스레드 차례인 대화여도 여기서 종료 (이미 끝났으면 무시됨)
+                    print(f"❌ [탭 {slot.slot_id}] {platform} 오류: {e}")
+                    worked = self.finish(slot, False, job) or worked
+            if not worked:
+                time.sleep(self.poll)
+
+    def run(self, prompts=None):
+        """프롬프트 전체를 탭 여러 개로 동시에 실행"""
+        prompts = prompts if prompts is not None else self.controller.prompts
+        self.source = prompts
+        self.pending = iter(enumerate(prompts) if isinstance(prompts, list) else prompts)
+        self.controller.is_running = True
+
+        print("\n🚀 탭 다중화 자동 대화 시작!")
+        print(f"📋 총 프롬프트 수: {len(prompts)}{skipped_note(prompts)}")
+        print(f"🗂️ 플랫폼당 탭 수: {len(self.slots)}\n")
+
+        self.open_tabs()
+        self.controller.count_commands()
+        with self.lock:
+            for slot in self.slots:
+                self.assign(slot)
+
+        start_time = time.time()
+        threads = [
+            threading.Thread(target=self.run_driver, args=(platform,), daemon=True)
+            for platform in self.participants
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.report(time.time() - start_time)
+        return self.results
+
+    def report(self, wall):
+        """결과와 대화당 메모리 출력"""
+        successful = sum(1 for ok in self.results.values() if ok)
+        print(f"\n{'='*70}")
+        print(f"🎊 모든 대화 완료!")
+        print(f"📊 결과: {successful}/{len(self.results)} 성공")
+        print(f"⏱️ 총 소요 시간: {wall:.1f}초")
+        for platform in self.participants:
+            single = self.memory[platform]
+            total = get_driver_rss(self.controller.drivers[platform])
+            if single is None or total is None:
+                print(f"💾 {platform}: 메모리 n/a (측정할 수 없는 브라우저)")
+                continue
+            # 탭 하나일 때 브라우저 전체 메모리 = 대화마다 브라우저를 따로 띄울 때 대화당 메모리
+            per_tab = total / len(self.slots)
+            print(f"💾 {platform}: 전체 {total:.0f}MB, 대화당 {per_tab:.0f}MB "
+                  f"(대화마다 브라우저 하나면 {single:.0f}MB → {(1 - per_tab / single) * 100:.0f}% 절약)")
+        if self.turn_count:
+            commands = sum(self.controller.command_counts.values())
+            self.controller.run_stats['commands_per_turn'].append(commands / self.turn_count)
+        self.controller.print_command_summary()
+        self.controller.delays.print_summary()
+        self.controller.delays.save()
+        print(f"{'='*70}\n")
+
+
+# 메인 실행
+# 사용법: python tab_multiplexer.py [플랫폼당 탭 수] [--lite] [--renderers=N] [--prompts=파일] [--range=0:100] [--fresh] [--turns=6]
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    tabs = int(args[0]) if args else 4
+    controller = AIController()
+    controller.tabs_per_browser = tabs
+    if "--lite" in sys.argv:
+        controller.launch_mode = 'lite'
+    for arg in sys.argv[1:]:
+        if arg.startswith("--prompts="):
+            controller.prompts_file = arg.split("=", 1)[1]
+        elif arg.startswith("--range="):
+            controller.prompt_range = parse_range(arg.split("=", 1)[1])
+        elif arg == "--fresh":
+            controller.fresh_prompts = True
+        elif arg.startswith("--turns="):
+            controller.topology['turns'] = int(arg.split("=", 1)[1])
+        elif arg.startswith("--renderers="):
+            controller.renderer_limit = int(arg.split("=", 1)[1])
+    controller.load_prompts()
+
+    print("🎮 AI 자동 대화 컨트롤러 - 탭 다중화 실행")
+    print("=" * 60)
+
+    try:
+        controller.start_browsers()
+
+        print("\n⚠️ 시작 전 확인사항:")
+        print("1. ChatGPT / Claude 로그인 상태 확인")
+        print("2. 팝업이나 안내 메시지 닫기")
+
+        input("\n✅ 준비가 완료되면 엔터를 눌러주세요...")
+
+        TabMultiplexer(controller, tabs=tabs).run()
+
+        input("\n🔚 브라우저를 닫고 종료하려면 엔터를 누르세요...")
+
+    except KeyboardInterrupt:
+        print("\n\n⚠️ 사용자가 중단했습니다 (Ctrl+C)")
+    finally:
+        controller.stop()
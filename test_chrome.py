@@ -1,12 +1,13 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 
+from driver_cache import get_chromedriver_path
+
 print("Chrome 브라우저를 시작합니다...")
 
 # Chrome 드라이버 자동 설치 및 실행
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+driver = webdriver.Chrome(service=Service(get_chromedriver_path()))
 
 print("구글 홈페이지로 이동합니다...")
 driver.get("https://www.google.com")